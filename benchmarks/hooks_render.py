@@ -0,0 +1,70 @@
+"""
+Measures time of a re-render of a functional component using many hooks.
+
+Run from the repository root:
+
+    python benchmarks/hooks_render.py
+
+Besides the total re-render time, prints the overhead per hook call: the difference from a re-render of a component
+doing the same work without hooks, divided by the number of hooks.
+"""
+import sys
+import timeit
+from os import path
+
+sys.path.insert(0, path.dirname(path.dirname(path.abspath(__file__))))
+
+from turbosnake import functional_component, use_state, use_ref, use_memo, use_callback, use_toggle
+from turbosnake.test_helpers import TestTree
+
+HOOK_GROUPS = 50
+HOOKS = HOOK_GROUPS * 5
+RENDERS = 500
+REPEATS = 20
+
+
+@functional_component
+def many_hooks():
+    for i in range(HOOK_GROUPS):
+        use_state(i)
+        use_ref()
+        use_memo(lambda: i, (i,))
+        use_callback(lambda: i, (i,))
+        use_toggle()
+
+
+@functional_component
+def no_hooks():
+    for i in range(HOOK_GROUPS):
+        (lambda: i, (i,))
+        (lambda: i, (i,))
+
+
+def measure(component_function) -> float:
+    tree = TestTree()
+
+    with tree:
+        component = component_function()
+
+    tree.run_tasks()
+
+    def render():
+        component.enqueue_update()
+        tree.run_tasks()
+
+    best = min(timeit.repeat(render, number=RENDERS, repeat=REPEATS)) / RENDERS
+    tree.close()
+
+    return best
+
+
+def main():
+    with_hooks = measure(many_hooks)
+    without_hooks = measure(no_hooks)
+
+    print(f'Re-render with {HOOKS} hooks: {with_hooks * 1e6:.0f}us')
+    print(f'Overhead per hook call: {(with_hooks - without_hooks) / HOOKS * 1e9:.0f}ns')
+
+
+if __name__ == '__main__':
+    main()
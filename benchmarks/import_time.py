@@ -0,0 +1,80 @@
+"""
+Measures cold import time of turbosnake packages and checks it against the cold-start budget.
+
+Run from the repository root:
+
+    python benchmarks/import_time.py
+
+Every statement is executed by a new interpreter started with `-X importtime`, several times. Median of the time
+spent importing all modules loaded by the statement (including standard library modules it causes to load) is
+compared to the budget of the statement. The script exits with status 1 when any statement exceeds it's budget.
+
+Budgets, in milliseconds:
+
+- `import turbosnake`, `import turbosnake.ttk` - 40ms. Packages import their public names lazily, so importing them
+  loads only `typing` and the lazy import helper.
+- `from turbosnake import ...` names used by a typical application - 200ms. Loads the core modules and `asyncio` used
+  by the tree, but not `tkinter` or modules of features the application doesn't use.
+- `from turbosnake.ttk import ...` names used by a typical Tk application - 300ms. Adds `tkinter` and the Tk tree.
+
+Budgets are about twice the import times measured on a developer machine, so they hold on slower CI runners but catch
+a package that imports all of it's modules (or a heavy dependency) eagerly again.
+"""
+import statistics
+import subprocess
+import sys
+from os import path
+
+PROJECT_ROOT = path.dirname(path.dirname(path.abspath(__file__)))
+REPEATS = 7
+_MARKER = 'import time: statement starts'
+
+# Statement and it's budget in milliseconds
+BUDGETS = (
+    ('import turbosnake', 40),
+    ('import turbosnake.ttk', 40),
+    ('from turbosnake import Tree, functional_component, use_state, use_effect, fragment', 200),
+    ('from turbosnake.ttk import TkTree, tk_window, tk_frame, tk_button, tk_label', 300),
+)
+
+
+def measure_import_time(statement: str) -> float:
+    """Returns time in milliseconds spent importing modules loaded by the statement in a new interpreter."""
+    # Modules imported during interpreter startup are reported too, the marker separates them
+    code = f'import sys; sys.stderr.write("{_MARKER}\\n"); sys.stderr.flush()\n{statement}\n'
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+    lines = result.stderr.splitlines()
+    total = 0
+
+    for line in lines[lines.index(_MARKER) + 1:]:
+        # Lines look like "import time:       self [us] |     cumulative | imported package", nested imports are
+        # indented, so only cumulative times of top-level imports are summed
+        if not line.startswith('import time:'):
+            continue
+
+        _, cumulative, name = line.split('|')
+
+        if cumulative.strip().isdigit() and not name.startswith('  '):
+            total += int(cumulative)
+
+    return total / 1000
+
+
+def main() -> int:
+    exceeded = False
+
+    for statement, budget in BUDGETS:
+        measured = statistics.median(measure_import_time(statement) for _ in range(REPEATS))
+        verdict = 'ok' if measured <= budget else 'OVER BUDGET'
+        exceeded = exceeded or measured > budget
+
+        print(f'{measured:7.1f}ms / {budget:4}ms  {verdict:11}  {statement}')
+
+    return 1 if exceeded else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
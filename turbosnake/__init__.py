@@ -1,12 +1,38 @@
-from ._async import use_async_call
-from ._components import Tree, Component, Ref, ComponentsCollection, MutableComponentsCollection, \
-    ImmutableComponentsCollection, ParentComponent, DynamicComponent, Wrapper, ComponentNotFoundError, fragment, \
-    component_inserter
-from ._context import Context, ContextNotProvidedError, ContextProvider, use_context
-from ._functional_component import functional_component
-from ._hooks import ComponentWithHooks, Hook
-from ._hooks import use_toggle, use_state, use_memo, use_effect, use_callback, use_previous, use_ref, \
-    use_callback_proxy, use_self
-from ._slotted_component import SlottedComponent, SlotsCollectionBuilder, SlotBuilder, NamedSlotsCollectionBuilder, \
-    PropSlotBuilder, PropSlotsComponent, ForbiddenSlotError
-from ._utils import event_prop_invoker, noop_handler, component
+from typing import TYPE_CHECKING
+
+from ._lazy_imports import lazy_exports
+
+# Public names are imported on first access, see `lazy_exports`
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '._async': ('use_async_call',),
+    '._components': ('Tree', 'Component', 'Ref', 'ComponentsCollection', 'MutableComponentsCollection',
+                     'ImmutableComponentsCollection', 'ParentComponent', 'DynamicComponent', 'Wrapper',
+                     'ComponentNotFoundError', 'fragment', 'component_inserter', 'UpdateGate'),
+    '._diagnostics': ('LeakChecker', 'Leak'),
+    '._context': ('Context', 'ContextNotProvidedError', 'ContextProvider', 'use_context'),
+    '._functional_component': ('functional_component', 'enable_hot_swap', 'prepare_hot_swap'),
+    '._lazy': ('lazy', 'LazyComponent', 'LazyLoadError'),
+    '._hooks': ('ComponentWithHooks', 'Hook', 'use_toggle', 'use_state', 'use_memo', 'use_effect', 'use_callback',
+                'use_previous', 'use_ref', 'use_callback_proxy', 'use_self', 'use_animation_frame', 'use_reducer'),
+    '._selectors': ('Selector', 'ComponentIndex'),
+    '._slotted_component': ('SlottedComponent', 'SlotsCollectionBuilder', 'SlotBuilder', 'NamedSlotsCollectionBuilder',
+                            'PropSlotBuilder', 'PropSlotsComponent', 'ForbiddenSlotError'),
+    '._utils': ('event_prop_invoker', 'noop_handler', 'component'),
+})
+
+if TYPE_CHECKING:
+    from ._async import use_async_call
+    from ._components import Tree, Component, Ref, ComponentsCollection, MutableComponentsCollection, \
+        ImmutableComponentsCollection, ParentComponent, DynamicComponent, Wrapper, ComponentNotFoundError, fragment, \
+        component_inserter, UpdateGate
+    from ._diagnostics import LeakChecker, Leak
+    from ._context import Context, ContextNotProvidedError, ContextProvider, use_context
+    from ._functional_component import functional_component, enable_hot_swap, prepare_hot_swap
+    from ._lazy import lazy, LazyComponent, LazyLoadError
+    from ._hooks import ComponentWithHooks, Hook
+    from ._hooks import use_toggle, use_state, use_memo, use_effect, use_callback, use_previous, use_ref, \
+        use_callback_proxy, use_self, use_animation_frame, use_reducer
+    from ._selectors import Selector, ComponentIndex
+    from ._slotted_component import SlottedComponent, SlotsCollectionBuilder, SlotBuilder, \
+        NamedSlotsCollectionBuilder, PropSlotBuilder, PropSlotsComponent, ForbiddenSlotError
+    from ._utils import event_prop_invoker, noop_handler, component
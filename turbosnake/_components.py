@@ -1,10 +1,12 @@
 import asyncio
 import queue
+import time
 from abc import abstractmethod, ABCMeta
 from collections import OrderedDict, Counter
-from functools import wraps
+from functools import wraps, partial
 from typing import Optional, Type, Union, Callable, Iterable
 
+from ._frame_clock import FrameClock
 from ._render_context import get_render_context, render_context_manager, enter_render_context
 from ._utils0 import have_differences_by_keys
 
@@ -21,6 +23,12 @@ class Tree(metaclass=ABCMeta):
     """
     TASK_QUEUES = ('update', 'effect')
 
+    # Interval (in milliseconds) between frames of the frame clock
+    FRAME_INTERVAL = 1000 / 60
+
+    # Updates of the root component are never suspended
+    child_update_gate = None
+
     def __init__(self, queues=TASK_QUEUES):
         super().__init__()
         self.__queue_names = queues
@@ -30,6 +38,11 @@ class Tree(metaclass=ABCMeta):
 
         self.__task_processing_scheduled = False
         self.__root: Optional[Component] = None
+        self.__batched_tasks: dict[str, list[Callable]] = {}
+        self.__frame_clock: Optional[FrameClock] = None
+
+        # Index of mounted components, see `ComponentIndex`
+        self.component_index = None
 
     def enqueue_task(self, queue_name, task):
         """Enqueue task for execution on given queue."""
@@ -41,6 +54,28 @@ class Tree(metaclass=ABCMeta):
             self.schedule_task(self.__run_tasks)
             self.__task_processing_scheduled = True
 
+    def enqueue_batched_task(self, queue_name, task):
+        """Enqueue task for execution on given queue as part of a batch of tasks.
+
+        All tasks batched for the same queue before the batch starts executing are executed as a single queue task.
+        This is cheaper than enqueueing each of them separately when a lot of tasks are enqueued at once, e.g. when a
+        large subtree is unmounted.
+
+        Unlike `enqueue_task`, this method must be called from the thread the tree runs on.
+        """
+        try:
+            self.__batched_tasks[queue_name].append(task)
+        except KeyError:
+            self.__batched_tasks[queue_name] = [task]
+            self.enqueue_task(queue_name, partial(self.__run_batched_tasks, queue_name))
+
+    def __run_batched_tasks(self, queue_name):
+        for task in self.__batched_tasks.pop(queue_name):
+            try:
+                task()
+            except Exception as e:
+                self.handle_error(e, queue_name, task)
+
     def __run_from_queue(self, queue_name):
         q = self.__queues[queue_name]
 
@@ -63,11 +98,21 @@ class Tree(metaclass=ABCMeta):
     def __run_tasks(self):
         self.__task_processing_scheduled = False
 
-        for queue_name in self.__queue_names:
-            if self.__run_from_queue(queue_name):
-                self.schedule_task(self.__run_tasks)
-                self.__task_processing_scheduled = True
-                return
+        try:
+            for queue_name in self.__queue_names:
+                if self.__run_from_queue(queue_name):
+                    self.schedule_task(self.__run_tasks)
+                    self.__task_processing_scheduled = True
+                    return
+        finally:
+            self.on_tasks_processed()
+
+    def on_tasks_processed(self):
+        """Called after each pass of task processing.
+
+        Tree implementations may override this method to apply changes collected during the pass.
+        """
+        pass
 
     @abstractmethod
     def schedule_task(self, callback: Callable):
@@ -107,10 +152,75 @@ class Tree(metaclass=ABCMeta):
         """
         ...
 
+    def now(self) -> float:
+        """Returns current time in milliseconds.
+
+        Only differences between returned values are meaningful, they are consistent with delays accepted by
+        `schedule_delayed_task`.
+        """
+        return time.monotonic() * 1000
+
+    @property
+    def frame_clock(self) -> FrameClock:
+        """Frame clock ticking every `FRAME_INTERVAL` milliseconds while it has subscribers, used to drive animations."""
+        if self.__frame_clock is None:
+            self.__frame_clock = FrameClock(self, self.FRAME_INTERVAL)
+
+        return self.__frame_clock
+
     def handle_error(self, error, queue_name, task):
         """Called when an error is raised in any of tasks executed as result of `enqueue_task` call."""
         raise error
 
+    def on_descendants_reordered(self):
+        """Called when some of components in this tree have changed their order without being re-mounted."""
+        pass
+
+    def census(self) -> dict:
+        """Counts objects held by this tree.
+
+        Intended to find out what grows when memory usage of a long-running application grows.
+        Returned dictionary contains:
+        - `components` - `Counter` of mounted components by their `class_id()`
+        - `hooks` - `Counter` of hooks of mounted components by hook class
+        - `context_observers` - list of `(context_id, number of observers)` pairs for all context providers, in order
+          they appear in the tree
+        - `refs` - number of `Ref`s currently referring to mounted components or created by `use_ref`
+        - `pending_tasks` - number of tasks waiting for execution, by queue name
+
+        Tree implementations and components may add more entries, see `Component.add_to_census`.
+        """
+        queues = self.__queues
+        batched_tasks = self.__batched_tasks
+        pending_tasks = {}
+
+        for queue_name in self.__queue_names:
+            count = queues[queue_name].qsize()
+
+            if queue_name in batched_tasks:
+                # All batched tasks are executed by a single queue task
+                count += len(batched_tasks[queue_name]) - 1
+
+            pending_tasks[queue_name] = count
+
+        census = {
+            'components': Counter(),
+            'hooks': Counter(),
+            'context_observers': [],
+            'refs': 0,
+            'pending_tasks': pending_tasks,
+        }
+
+        if self.__root is not None:
+            stack = [self.__root]
+
+            while stack:
+                c = stack.pop()
+                c.add_to_census(census)
+                stack.extend(reversed(list(c.mounted_children())))
+
+        return census
+
     @property
     def tree(self) -> 'Tree':
         return self
@@ -151,6 +261,57 @@ class ComponentNotFoundError(Exception):
     pass
 
 
+class UpdateGate:
+    """Controls updates of components of a subtree.
+
+    While the gate is suspended, updates of components behind it are deferred instead of being enqueued.
+    Deferred updates are enqueued when the gate resumes.
+    Gates may be nested, updates passing an inner gate are still deferred by suspended outer gates.
+
+    Components get their gate from parent on mount, see `Component.child_update_gate`.
+    """
+
+    def __init__(self, tree: Tree, parent: Optional['UpdateGate'] = None):
+        self.tree = tree
+        self.parent = parent
+        self.__suspended = False
+        self.__deferred: dict['Component', None] = {}
+
+    @property
+    def suspended(self) -> bool:
+        """`True` iff this gate is suspended, not considering outer gates."""
+        return self.__suspended
+
+    def enqueue_update(self, component: 'Component'):
+        if self.__suspended:
+            self.__deferred[component] = None
+        elif self.parent is not None:
+            self.parent.enqueue_update(component)
+        else:
+            self.tree.enqueue_task('update', component.update)
+
+    def suspend(self):
+        self.__suspended = True
+
+    def resume(self):
+        """Resumes the gate, enqueueing updates of still mounted components deferred while it was suspended."""
+        self.__suspended = False
+        deferred = self.__deferred
+        self.__deferred = {}
+
+        for component in deferred:
+            if component.is_mounted():
+                self.enqueue_update(component)
+
+    def discard_deferred(self):
+        """Forgets deferred updates, e.g. when components behind the gate are about to be unmounted."""
+        self.__deferred = {}
+
+    @property
+    def deferred_count(self) -> int:
+        return len(self.__deferred)
+
+
 class Component:
     def __init__(self, /, key=None, ref: Optional[Ref] = None, **props):
         self.props = props
@@ -177,22 +338,46 @@ class Component:
 
         self.parent: Component = parent
         self.__tree: Tree = parent.tree
+        self.update_gate: Optional[UpdateGate] = parent.child_update_gate
         self.__state = {}
         self.__update_enqueued = False
         self.prev_props = self.props
+        self.__last_update_props = self.props
+
+        index = self.__tree.component_index
+        if index is not None:
+            index.add(self)
 
         self.enqueue_update()
 
     def unmount(self):
         """Called when this component is being unmounted from tree."""
+        index = self.__tree.component_index
+        if index is not None:
+            index.remove(self)
+
         del self.parent
         del self.__tree
 
     def enqueue_update(self):
         if not self.__update_enqueued:
-            self.__tree.enqueue_task('update', self.update)
+            gate = self.update_gate
+
+            if gate is None:
+                self.__tree.enqueue_task('update', self.update)
+            else:
+                gate.enqueue_update(self)
+
             self.__update_enqueued = True
 
+    @property
+    def child_update_gate(self) -> Optional[UpdateGate]:
+        """Gate of updates of children of this component.
+
+        Components that suspend updates of their descendants return their own gate here.
+        """
+        return self.update_gate
+
     def update_props_from(self, other: 'Component') -> bool:
         """Updates `props` of this component with props of another component.
 
@@ -214,7 +399,9 @@ class Component:
 
     def update(self):
         self.__update_enqueued = False
-        self.prev_props = self.props
+        # Keep props of previous update available after this update, for `has_props_changed`
+        self.prev_props = self.__last_update_props
+        self.__last_update_props = self.props
 
     def get_state(self, key):
         """Get state element.
@@ -255,6 +442,13 @@ class Component:
         """Iterator over all mounted children of this component"""
         yield from ()
 
+    def on_descendants_reordered(self):
+        """Called when some of descendants of this component have changed their order without being re-mounted.
+
+        Default implementation propagates the notification to parent component.
+        """
+        self.parent.on_descendants_reordered()
+
     def first_matching_descendants(self, predicate) -> Iterable['Component']:
         """Iterator over all descendants of this component that match given predicate but don't have any other such
         components between them and this component.
@@ -307,9 +501,80 @@ class Component:
 
     def has_props_changed(self, prop_names: Iterable[str]) -> bool:
         """Returns True iff value of any of properties listed in `prop_names` was changed during the most recent update.
+
+        Props are compared to the ones of the previous update, which are kept until the next update.
+        Must be called after `Component.update` of the most recent update has run, e.g. after `super().update()`.
         """
         return have_differences_by_keys(self.prev_props, self.props, prop_names)
 
+    def add_to_census(self, census: dict):
+        """Adds this component and objects it holds to a census collected by `Tree.census`.
+
+        Children of this component are counted by the tree, not by this method.
+        """
+        census['components'][self.class_id()] += 1
+
+        ref = self.ref
+        if ref is not None and ref.current is self:
+            census['refs'] += 1
+
+    def get_owned_objects(self) -> Iterable:
+        """Iterator over objects that are expected to be freed after this component is unmounted and forgotten.
+
+        Used by `LeakChecker`. Children of this component are not included.
+        """
+        yield self
+
+
+def sort_in_document_order(components: Iterable[Component], ancestor=None) -> list[Component]:
+    """Returns given mounted components sorted in order they appear in the tree, ascendants before descendants.
+
+    :param ancestor: common ascendant (component or tree) of all the components; the tree by default
+    """
+    # Positions of components among their siblings, filled for all children of a parent at once
+    positions: dict[Component, int] = {}
+    paths: dict[Component, tuple] = {}
+
+    def get_path(component) -> tuple:
+        try:
+            return paths[component]
+        except KeyError:
+            pass
+
+        # Ascendants-or-self of the component whose paths are not known yet, from the component up. Walking up with a
+        # loop instead of recursion keeps very deep trees within recursion limit.
+        chain = []
+        path = ()
+
+        while True:
+            parent = component.parent
+
+            if parent is component.tree:
+                break
+
+            if component not in positions:
+                for i, sibling in enumerate(parent.mounted_children()):
+                    positions[sibling] = i
+
+            chain.append(component)
+
+            if parent is ancestor:
+                break
+
+            try:
+                path = paths[parent]
+                break
+            except KeyError:
+                component = parent
+
+        for component in reversed(chain):
+            path = path + (positions[component],)
+            paths[component] = path
+
+        return path
+
+    return sorted(components, key=get_path)
+
 
 class ComponentsCollection(metaclass=ABCMeta):
     """Base class for collection of components.
@@ -435,18 +700,36 @@ class MountedComponentsCollection:
         old_components = self.components
         new_components = OrderedDict()
 
+        # Positions of old components, used to detect changes in order of components that remain mounted
+        old_positions = {key: i for i, key in enumerate(old_components)} if len(old_components) > 1 else None
+        last_position = -1
+        reordered = False
+        index = self.parent.tree.component_index
+
         for new_component in components:
             key = new_component.key
             old_component: Component = old_components.get(key, None)
 
             if old_component:
                 if self.is_updatable(old_component, new_component):
+                    prev_props = old_component.props
+
                     if old_component.update_props_from(new_component):
                         old_component.enqueue_update()
+
+                    if index is not None and old_component.props is not prev_props:
+                        index.on_props_updated(old_component)
+
                     old_component.ref = new_component.ref
                     old_component.assign_ref()
                     new_components[key] = old_component
                     del old_components[key]
+
+                    if old_positions:
+                        position = old_positions[key]
+                        reordered = reordered or position < last_position
+                        last_position = position
+
                     continue
                 else:
                     old_component.unmount()
@@ -462,6 +745,9 @@ class MountedComponentsCollection:
 
         self.components = new_components
 
+        if reordered:
+            self.parent.on_descendants_reordered()
+
     def unmount(self):
         for component in self.components.values():
             component.unmount()
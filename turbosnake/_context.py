@@ -2,7 +2,7 @@ from abc import ABCMeta
 from typing import Callable, Optional
 
 from ._components import Component, Wrapper, ComponentNotFoundError
-from ._hooks import Hook, ComponentHookProcessor
+from ._hooks import Hook, _current
 from ._utils import component
 
 
@@ -26,6 +26,10 @@ class ContextProvider(Wrapper, Component, metaclass=ABCMeta):
     def unregister_observer(self, observer: Callable):
         self.__observers.remove(observer)
 
+    def add_to_census(self, census: dict):
+        super().add_to_census(census)
+        census['context_observers'].append((self.context_id, len(self.__observers)))
+
     def __notify_observers(self, value):
         for observer in self.__observers:
             observer(value)
@@ -110,7 +114,7 @@ def use_context(context_or_id):
     if isinstance(context_or_id, Context):
         context_id = context_or_id.id
 
-    return ComponentHookProcessor.current().process_hook(_ContextHook, context_id)
+    return _current.processor.process_hook(_ContextHook, context_id)
 
 
 class Context:
@@ -0,0 +1,142 @@
+import gc
+import inspect
+import weakref
+from collections import deque
+from typing import NamedTuple
+
+from ._components import Component
+
+"""
+_diagnostics.py
+
+Contains tools that help to find memory leaks in component trees.
+"""
+
+
+_CONTAINER_TYPES = (list, tuple, set, frozenset, dict, deque)
+
+
+def _describe(obj) -> str:
+    if isinstance(obj, Component):
+        return f'component {obj.class_id()} (key={obj.key!r})'
+
+    description = repr(obj)
+
+    if len(description) > 100:
+        description = description[:97] + '...'
+
+    return description
+
+
+def _describe_referrer(referrer, obj) -> str:
+    if isinstance(referrer, dict):
+        keys = [k for k, v in referrer.items() if v is obj]
+
+        for owner in gc.get_referrers(referrer):
+            if getattr(owner, '__dict__', None) is referrer:
+                return f'attribute {", ".join(map(str, keys))} of {_describe(owner)}'
+
+        return f'dict item {", ".join(map(repr, keys))}'
+
+    if isinstance(referrer, (list, tuple, set, frozenset)):
+        return f'{type(referrer).__name__} of {len(referrer)} items'
+
+    return _describe(referrer)
+
+
+class Leak(NamedTuple):
+    # Description of the object that was not freed
+    description: str
+    # Descriptions of objects that hold the leaked object
+    referrers: list[str]
+
+    def __str__(self):
+        return f'{self.description} is held by:' + ''.join(f'\n  {r}' for r in self.referrers)
+
+
+class LeakChecker:
+    """Checks that objects owned by a subtree of components are freed after the subtree is unmounted.
+
+    checker = LeakChecker(component)  # Create checker while the subtree is still mounted
+
+    ...  # Unmount the subtree, run pending tasks
+
+    for leak in checker.collect_leaks():
+        print(leak)
+
+    The checker tracks objects returned by `Component.get_owned_objects` of all components of the subtree - the components
+    themselves, their hooks, widgets, etc. - using weak references, so it doesn't prevent them from being freed.
+
+    Note that unmounted objects may be legitimately kept for some time, e.g. widgets parked in widget pool or components
+    whose tasks are still enqueued.
+    """
+
+    def __init__(self, component: Component):
+        self.__tracked: list[tuple[weakref.ref, str]] = []
+
+        stack = [component]
+
+        while stack:
+            c = stack.pop()
+
+            for obj in c.get_owned_objects():
+                try:
+                    self.__tracked.append((weakref.ref(obj), _describe(obj)))
+                except TypeError:
+                    pass  # Object doesn't support weak references
+
+            stack.extend(c.mounted_children())
+
+    def collect_leaks(self) -> list[Leak]:
+        """Runs garbage collector and returns descriptions of tracked objects that are still alive.
+
+        Objects are reported together with objects referring to them, except for other leaked objects of the same
+        subtree, so the report shows what holds the subtree from outside.
+        """
+        gc.collect()
+
+        alive = []
+        descriptions = []
+
+        for ref, description in self.__tracked:
+            obj = ref()
+
+            if obj is not None:
+                alive.append(obj)
+                descriptions.append(description)
+
+            obj = None
+
+        # References between leaked objects are not interesting
+        internal = {id(alive), id(inspect.currentframe())}
+
+        for obj in alive:
+            internal.add(id(obj))
+
+            if hasattr(obj, '__dict__'):
+                internal.add(id(obj.__dict__))
+
+        leaks = []
+
+        for i in range(len(alive)):
+            obj = alive[i]
+            referrers = []
+            candidates = gc.get_referrers(obj)
+            internal.add(id(candidates))
+
+            for referrer in candidates:
+                if id(referrer) in internal:
+                    continue
+
+                # Containers (e.g. list of hooks) held by leaked objects only are internal too
+                if isinstance(referrer, _CONTAINER_TYPES) and all(
+                        id(holder) in internal for holder in gc.get_referrers(referrer)
+                ):
+                    continue
+
+                referrers.append(_describe_referrer(referrer, obj))
+
+            internal.discard(id(candidates))
+            leaks.append(Leak(descriptions[i], referrers))
+
+        return leaks
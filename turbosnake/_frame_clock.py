@@ -0,0 +1,85 @@
+import math
+from typing import Callable
+
+"""
+_frame_clock.py
+
+Contains frame clock that drives animations.
+"""
+
+
+class FrameClock:
+    """Calls subscribed callbacks once per frame while there is at least one subscriber.
+
+    Frames are aligned to a grid of `interval` milliseconds starting at the moment the clock starts ticking.
+    When the event loop falls behind, missed frames are skipped instead of being executed one after another, and the
+    callbacks receive real time elapsed since the previous frame.
+
+    The clock uses `now` and `schedule_delayed_task` methods of the tree, so it works with any tree implementation
+    supporting delayed tasks.
+    """
+
+    def __init__(self, tree, interval: float):
+        self.__tree = tree
+        self.interval = interval
+        self.__subscribers: dict[object, Callable[[float], None]] = {}
+        self.__cancel_tick = None
+        self.__origin = 0.0
+        self.__last_frame = 0.0
+
+    @property
+    def is_ticking(self) -> bool:
+        return self.__cancel_tick is not None
+
+    def subscribe(self, callback: Callable[[float], None]) -> Callable[[], None]:
+        """Adds a callback that will be called on every frame with number of milliseconds elapsed since previous frame.
+
+        :returns: function that removes the callback
+        """
+        token = object()
+        self.__subscribers[token] = callback
+
+        if not self.is_ticking:
+            self.__start()
+
+        def unsubscribe():
+            self.__subscribers.pop(token, None)
+
+            if not self.__subscribers:
+                self.__stop()
+
+        return unsubscribe
+
+    def __start(self):
+        now = self.__tree.now()
+        self.__origin = self.__last_frame = now
+        self.__schedule_tick(now)
+
+    def __stop(self):
+        cancel = self.__cancel_tick
+
+        if cancel is not None:
+            self.__cancel_tick = None
+            cancel()
+
+    def __schedule_tick(self, now: float):
+        interval = self.interval
+        next_frame = self.__origin + ((now - self.__origin) // interval + 1) * interval
+        self.__cancel_tick = self.__tree.schedule_delayed_task(max(1, math.ceil(next_frame - now)), self.__tick)
+
+    def __tick(self):
+        self.__cancel_tick = None
+
+        tree = self.__tree
+        now = tree.now()
+        elapsed = now - self.__last_frame
+        self.__last_frame = now
+
+        for callback in list(self.__subscribers.values()):
+            try:
+                callback(elapsed)
+            except Exception as e:
+                tree.handle_error(e, None, callback)
+
+        if self.__subscribers and not self.is_ticking:
+            self.__schedule_tick(now)
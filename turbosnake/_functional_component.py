@@ -1,11 +1,70 @@
 import inspect
 from functools import update_wrapper
 from typing import Optional, Union, Iterable
+from weakref import WeakSet
 
 from ._components import Component, ParentComponent, DynamicComponent, component_inserter
-from ._hooks import ComponentWithHooks
+from ._hooks import ComponentWithHooks, HookSequenceError
 from ._slotted_component import PropSlotsComponent
 
+_hot_swap_enabled = False
+
+# Component classes created for module-level functions by the latest imports of their modules while hot swap is
+# enabled, by module name and qualified name of the function
+_hot_swap_classes: dict[str, dict[str, type]] = {}
+# Classes created by previous imports of modules that are being imported again, see `prepare_hot_swap`.
+# Classes are never reused by the import that created them, so different functions with the same name get different
+# classes.
+_hot_swap_previous_classes: dict[str, dict[str, type]] = {}
+
+
+def enable_hot_swap(enabled: bool = True):
+    """Enables or disables hot swap of functional components.
+
+    When hot swap is enabled and a module-level function is turned into a functional component again by a new import of
+    it's module (`prepare_hot_swap` must be called before the import, e.g. before the module is reloaded), the component
+    class created for the previous version of the function is reused.
+    Render function of that class is replaced and mounted instances of it are re-rendered, so they keep their state
+    instead of being re-mounted.
+    If the new version of the function renders a different sequence of hooks than an instance rendered last time, hooks
+    of that instance are reset.
+
+    Only components created while hot swap is enabled can be hot swapped.
+    """
+    global _hot_swap_enabled
+
+    _hot_swap_enabled = enabled
+
+    if not enabled:
+        _hot_swap_classes.clear()
+        _hot_swap_previous_classes.clear()
+
+
+def prepare_hot_swap(module_name: str):
+    """Prepares hot swap of functional components of a module that is about to be imported again (e.g. reloaded).
+
+    Components defined by the next import of the module reuse classes of components with the same qualified names
+    defined by the previous import.
+    """
+    # Classes not reused by the previous import are kept, as that import might have failed before reaching their functions
+    _hot_swap_previous_classes[module_name] = {
+        **_hot_swap_previous_classes.get(module_name, {}),
+        **_hot_swap_classes.pop(module_name, {}),
+    }
+
+
+def _hot_swap(component_class, fn):
+    component_class.render_function = staticmethod(fn)
+
+    for component in list(component_class.hot_swap_instances):
+        if not component.is_mounted():
+            continue
+
+        if isinstance(component, ComponentWithHooks):
+            component.hot_swapped = True
+
+        component.enqueue_update()
+
 
 def functional_component(
         fn=None,
@@ -52,9 +111,52 @@ def functional_component(
             elif has_slot_props and slots is None:
                 statics['allowed_slots'] = set(map(PropSlotsComponent.default_prop_name_to_slot_name, slot_props))
 
+        hot_swap_key = None
+
+        if _hot_swap_enabled and '<locals>' not in fn.__qualname__ and '<lambda>' not in fn.__qualname__:
+            hot_swap_key = (fn.__module__, fn.__qualname__)
+            # Previous class can be reused only if it has the same base classes and slots
+            shape = (bases, statics.get('allowed_slots'), sorted(slots.items()) if isinstance(slots, dict) else None)
+            # Each class is reused at most once per import of the module
+            previous_class = _hot_swap_previous_classes.get(fn.__module__, {}).pop(fn.__qualname__, None)
+
+            if previous_class is not None and previous_class.hot_swap_shape == shape:
+                _hot_swap(previous_class, fn)
+                _hot_swap_classes.setdefault(fn.__module__, {})[fn.__qualname__] = previous_class
+
+                return update_wrapper(component_inserter(previous_class), previous_class)
+
         class FunctionComponent(*bases):
+            render_function = staticmethod(fn)
+
             def render(self):
-                return fn(**self.props)
+                return self.render_function(**self.props)
+
+            if hot_swap_key is not None:
+                hot_swap_shape = shape
+                hot_swap_instances = WeakSet()
+
+                # True if the component was hot swapped and has not rendered since then
+                hot_swapped = False
+
+                def mount(self, parent):
+                    super().mount(parent)
+                    self.hot_swap_instances.add(self)
+
+                if hooks:
+                    def render_children(self):
+                        if not self.hot_swapped:
+                            return super().render_children()
+
+                        self.hot_swapped = False
+
+                        try:
+                            # Hook processor checks hooks of the new render against classes of hooks recorded by the
+                            # last render, position by position
+                            return super().render_children()
+                        except HookSequenceError:
+                            self.reset_hooks()
+                            return super().render_children()
 
             # noinspection PyMethodMayBeStatic
             def class_id(self):
@@ -63,6 +165,9 @@ def functional_component(
         for k, v in statics.items():
             setattr(FunctionComponent, k, v)
 
+        if hot_swap_key is not None:
+            _hot_swap_classes.setdefault(fn.__module__, {})[fn.__qualname__] = FunctionComponent
+
         return update_wrapper(component_inserter(FunctionComponent), FunctionComponent)
 
     if fn:
@@ -1,7 +1,10 @@
+import threading
 from abc import ABCMeta, abstractmethod, ABC
+from collections import deque
+from itertools import repeat
+from typing import Callable, Optional
 
 from ._components import Component, DynamicComponent, ComponentsCollection, Ref
-from ._render_context import enter_render_context, get_render_context
 
 
 class Hook(metaclass=ABCMeta):
@@ -19,8 +22,28 @@ class Hook(metaclass=ABCMeta):
     def on_unmount(self):
         pass
 
+    def add_to_census(self, census: dict):
+        census['hooks'][self.__class__] += 1
+
+
+class _NoHookProcessor:
+    """Stands for hook processor while no component with hooks is being rendered."""
+
+    def __getattr__(self, name):
+        raise AssertionError('Hook rendered outside appropriate context')
+
+
+class _CurrentProcessor(threading.local):
+    # Hook processor of component being rendered on current thread.
+    # Hooks read it with a single attribute lookup, class attribute provides the value for threads that never rendered.
+    processor = _NoHookProcessor()
+
+
+_current = _CurrentProcessor()
+
 
 class ComponentHookProcessor(metaclass=ABCMeta):
+    # Deprecated: current processor is no longer stored in render context, use `ComponentHookProcessor.current()`
     CONTEXT_ID = 'ComponentHookProcessor'
 
     def __init__(self, component):
@@ -30,13 +53,13 @@ class ComponentHookProcessor(metaclass=ABCMeta):
     def component(self):
         return self.__component
 
-    @classmethod
-    def current(cls) -> 'ComponentHookProcessor':
-        ctx = get_render_context(cls.CONTEXT_ID)
+    @staticmethod
+    def current() -> 'ComponentHookProcessor':
+        processor = _current.processor
 
-        assert ctx, 'Hook rendered outside appropriate context'
+        assert not isinstance(processor, _NoHookProcessor), 'Hook rendered outside appropriate context'
 
-        return ctx
+        return processor
 
     @abstractmethod
     def process_hook(self, hook_class, *args, **kwargs):
@@ -54,74 +77,100 @@ class ComponentHookProcessor(metaclass=ABCMeta):
     def on_unmount(self):
         ...
 
+    @abstractmethod
+    def reset(self):
+        """Discards all hooks, so they are created again on next render, as on the first render."""
+        ...
+
 
 class HookSequenceError(Exception):
     pass
 
 
-class _NextHookProcessor(ComponentHookProcessor):
-    def __init__(self, component: Component, hooks):
+class _EndOfHooks:
+    """Marks the end of hooks of a component."""
+
+
+_END_OF_HOOKS = _EndOfHooks()
+
+
+class SlotHookProcessor(ComponentHookProcessor):
+    """Hook processor that keeps hooks of a component in a flat list of slots indexed by hook call position.
+
+    Hooks are created on first render and reused by position on subsequent renders.
+    """
+    def __init__(self, component):
         super().__init__(component)
-        self.__hooks = hooks
+        self.hooks: list[Hook] = []
+        # Hooks followed by `_END_OF_HOOKS`, once the first render has succeeded
+        self.__slots: Optional[tuple] = None
+        # Returns the next hook of current render or `_END_OF_HOOKS` if there are no more hooks (always, during the
+        # first render)
+        self.__next_hook: Callable = repeat(_END_OF_HOOKS).__next__
 
     def start(self):
-        self.__iterator = iter(self.__hooks)
+        slots = self.__slots
+
+        if slots is None:
+            # Hooks created by a failed first render are discarded
+            self.__discard_hooks()
+            self.__next_hook = repeat(_END_OF_HOOKS).__next__
+        else:
+            self.__next_hook = iter(slots).__next__
 
     def process_hook(self, hook_class, *args, **kwargs):
-        try:
-            hook = next(self.__iterator)
-        except StopIteration:
-            raise HookSequenceError(f'Wrong number of hooks rendered in {self.component.class_id()}.\
-                            At least one more {hook_class} is going to be rendered.')
+        hook = self.__next_hook()
 
-        if hook.__class__ is not hook_class:
-            raise HookSequenceError(f'Broken hook order. Hook {hook_class} rendered instead of {hook.__class__}.')
+        if hook.__class__ is hook_class:
+            return hook.next_call(*args, **kwargs)
 
-        return hook.next_call(*args, **kwargs)
+        if self.__slots is None:
+            hook = hook_class(self.component)
+            self.hooks.append(hook)
 
-    def finish(self) -> 'ComponentHookProcessor':
-        try:
-            h = next(self.__iterator)
+            return hook.first_call(*args, **kwargs)
 
+        if hook is _END_OF_HOOKS:
             raise HookSequenceError(f'Wrong number of hooks rendered in {self.component.class_id()}.\
-                            At least one more {h.__class__} hook expected.')
-        except StopIteration:
-            pass  # ok!
+                            At least one more {hook_class} is going to be rendered.')
 
-        del self.__iterator
+        raise HookSequenceError(f'Broken hook order. Hook {hook_class} rendered instead of {hook.__class__}.')
+
+    def finish(self) -> 'ComponentHookProcessor':
+        if self.__slots is None:
+            self.__slots = (*self.hooks, _END_OF_HOOKS)
+        else:
+            hook = self.__next_hook()
+
+            if hook is not _END_OF_HOOKS:
+                raise HookSequenceError(f'Wrong number of hooks rendered in {self.component.class_id()}.\
+                            At least one more {hook.__class__} hook expected.')
 
         return self
 
     def on_unmount(self):
-        for hook in self.__hooks:
+        for hook in self.hooks:
             hook.on_unmount()
 
+    def __discard_hooks(self):
+        self.on_unmount()
+        self.hooks = []
 
-class InitialHookProcessor(ComponentHookProcessor):
-    def __init__(self, component):
-        super().__init__(component)
+    def reset(self):
+        self.__discard_hooks()
+        self.__slots = None
+        self.__next_hook = repeat(_END_OF_HOOKS).__next__
 
-    def start(self):
-        self.__hooks = []
 
-    def process_hook(self, hook_class, *args, **kwargs):
-        hook = hook_class(self.component)
-        self.__hooks.append(hook)
-
-        return hook.first_call(*args, **kwargs)
-
-    def finish(self) -> 'ComponentHookProcessor':
-        return _NextHookProcessor(self.component, self.__hooks)
-
-    def on_unmount(self):
-        pass
+# Deprecated alias, `SlotHookProcessor` handles both the first and subsequent renders
+InitialHookProcessor = SlotHookProcessor
 
 
 class ComponentWithHooks(DynamicComponent, ABC):
     def mount(self, parent):
         super().mount(parent)
 
-        self.__hook_processor: ComponentHookProcessor = InitialHookProcessor(self)
+        self.__hook_processor: ComponentHookProcessor = SlotHookProcessor(self)
 
     def unmount(self):
         self.__hook_processor.on_unmount()
@@ -131,16 +180,35 @@ class ComponentWithHooks(DynamicComponent, ABC):
     def render_children(self) -> ComponentsCollection:
         hp = self.__hook_processor
         hp.start()
-        revert = enter_render_context(ComponentHookProcessor.CONTEXT_ID, hp)
+
+        current = _current
+        prev_processor = current.processor
+        current.processor = hp
+
         try:
             result = super().render_children()
         finally:
-            revert()
+            current.processor = prev_processor
 
         self.__hook_processor = hp.finish()
 
         return result
 
+    def reset_hooks(self):
+        """Discards all hooks of this component and their state, so they are created again on next render."""
+        self.__hook_processor.reset()
+
+    def add_to_census(self, census: dict):
+        super().add_to_census(census)
+
+        for hook in self.__hook_processor.hooks:
+            hook.add_to_census(census)
+
+    def get_owned_objects(self):
+        yield from super().get_owned_objects()
+        yield self.__hook_processor
+        yield from self.__hook_processor.hooks
+
 
 class _StateHook(Hook):
     def __init__(self, component: Component):
@@ -148,44 +216,114 @@ class _StateHook(Hook):
         self.__component = component
 
     def set_state(self, value):
-        self.__component.set_state(self, value)
+        if self.__value == value:
+            return
+
+        self.__value = value
+        self.__component.enqueue_update()
 
     def first_call(self, default):
-        self.__component.set_state(self, default)
+        self.__value = default
         return default, self.set_state
 
     def next_call(self, *_):
-        return self.__component.get_state(self), self.set_state
+        return self.__value, self.set_state
 
 
 def use_state(default=None):
-    return ComponentHookProcessor.current().process_hook(
+    return _current.processor.process_hook(
         _StateHook,
         default
     )
 
 
+class _ReducerHook(Hook):
+    def __init__(self, component: Component):
+        super().__init__(component)
+        self.__component = component
+        self.__render_thread_id = threading.get_ident()
+        self.__actions = deque()
+        self.__update_requested = False
+        self.__unmounted = False
+
+    def __request_update(self):
+        if self.__component.is_mounted():
+            self.__component.enqueue_update()
+
+    def dispatch(self, action):
+        if self.__unmounted:
+            return
+
+        self.__actions.append(action)
+
+        if self.__update_requested:
+            return
+
+        self.__update_requested = True
+
+        if threading.get_ident() == self.__render_thread_id:
+            self.__request_update()
+        else:
+            self.__tree.enqueue_task('update', self.__request_update)
+
+    def first_call(self, reducer, initial):
+        # Tree of the component is not accessible after it is unmounted, but dispatch may be called after that
+        self.__tree = self.__component.tree
+        self.__state = initial
+        return initial, self.dispatch
+
+    def next_call(self, reducer, *_):
+        self.__update_requested = False
+
+        state = self.__state
+        actions = self.__actions
+
+        while actions:
+            state = reducer(state, actions.popleft())
+
+        self.__state = state
+        return state, self.dispatch
+
+    def on_unmount(self):
+        self.__unmounted = True
+        self.__actions.clear()
+
+
+def use_reducer(reducer: Callable, initial=None):
+    """Returns current state and a function that dispatches actions changing the state.
+
+    state, dispatch = use_reducer(lambda state, action: ..., initial_state)
+
+    Dispatched actions are queued and applied to the state by calling the reducer (one passed on the latest render) just
+    before the next render of the component, so a series of actions causes a single update.
+    `dispatch` may be called from any thread.
+    """
+    return _current.processor.process_hook(
+        _ReducerHook,
+        reducer,
+        initial
+    )
+
+
 class _ToggleHook(Hook):
     def __init__(self, component: Component):
         super().__init__(component)
         self.__component = component
 
     def toggle(self):
-        self.__component.set_state(
-            self,
-            not self.__component.get_state(self)
-        )
+        self.__value = not self.__value
+        self.__component.enqueue_update()
 
     def first_call(self, initial):
-        self.__component.set_state(self, initial)
+        self.__value = initial
         return initial, self.toggle
 
     def next_call(self, *_):
-        return self.__component.get_state(self), self.toggle
+        return self.__value, self.toggle
 
 
 def use_toggle(initial: bool = False):
-    return ComponentHookProcessor.current().process_hook(
+    return _current.processor.process_hook(
         _ToggleHook,
         initial
     )
@@ -207,7 +345,7 @@ class _PreviousHook(Hook):
 
 
 def use_previous(value, initial=None):
-    return ComponentHookProcessor.current().process_hook(
+    return _current.processor.process_hook(
         _PreviousHook,
         value,
         initial
@@ -241,7 +379,7 @@ def use_function_hook(hook_class, arg_1=_sentinel, *args, **kwargs):
     def fn0(x):
         ...
     """
-    ctx = ComponentHookProcessor.current()
+    ctx = _current.processor
 
     if callable(arg_1):
         return ctx.process_hook(hook_class, arg_1, *args, **kwargs)
@@ -344,12 +482,12 @@ def use_callback_proxy(callback):
     def cb2(...):
         ...
     """
-    return ComponentHookProcessor.current().process_hook(_CallbackProxyHook, callback)
+    return _current.processor.process_hook(_CallbackProxyHook, callback)
 
 
 def use_self():
     """Pseudo-hook that returns reference to currently rendered component."""
-    return ComponentHookProcessor.current().component
+    return _current.processor.component
 
 
 class _EffectHook(Hook):
@@ -392,7 +530,12 @@ class _EffectHook(Hook):
         self.__enqueue_effect(effect)
 
     def on_unmount(self):
-        self.__component.tree.enqueue_task(self.__queue, self.__revert_previous)
+        revert = self.__revert_previous
+        # Effect that is still enqueued must not run after unmount
+        self.__next_effect = None
+
+        if callable(revert):
+            self.__component.tree.enqueue_batched_task(self.__queue, revert)
 
 
 def use_effect(*args, queue='effect'):
@@ -435,7 +578,60 @@ class _RefHook(Hook, Ref):
     def next_call(self):
         return self
 
+    def add_to_census(self, census: dict):
+        super().add_to_census(census)
+        census['refs'] += 1
+
 
 def use_ref() -> Ref:
     """Returns the same unique `Ref` instance on every render."""
-    return ComponentHookProcessor.current().process_hook(_RefHook)
+    return _current.processor.process_hook(_RefHook)
+
+
+class _AnimationFrameHook(Hook):
+    def __init__(self, component: Component):
+        super().__init__(component)
+        self.__component = component
+        self.__unsubscribe = None
+
+    def __on_frame(self, elapsed):
+        self.__callback(elapsed)
+
+    def __set_active(self, active):
+        if active and not self.__unsubscribe:
+            self.__unsubscribe = self.__component.tree.frame_clock.subscribe(self.__on_frame)
+        elif not active and self.__unsubscribe:
+            self.__unsubscribe()
+            self.__unsubscribe = None
+
+    def first_call(self, callback, active=True):
+        self.__callback = callback
+        self.__set_active(active)
+
+    def next_call(self, callback, active=True):
+        self.first_call(callback, active)
+
+    def on_unmount(self):
+        self.__set_active(False)
+
+
+def use_animation_frame(*args):
+    """Calls a function on every frame of tree's frame clock while the component is mounted.
+
+    The function receives number of milliseconds elapsed since the previous frame.
+    Function passed on the latest render is called.
+
+    @use_animation_frame
+    def on_frame(elapsed):
+        ...
+
+    # Calls the function only while `running` is true
+    # WARNING: `running` MUST NOT be a callable!
+    @use_animation_frame(running)
+    def on_frame(elapsed):
+        ...
+
+    Frames are skipped when the event loop can't keep up with frame rate, so animations should depend on elapsed time
+    rather than on number of frames.
+    """
+    return use_function_hook(_AnimationFrameHook, *args)
@@ -0,0 +1,176 @@
+import threading
+from typing import Callable, Optional
+
+from ._components import DynamicComponent, ParentComponent, Component, Tree
+
+"""
+_lazy.py
+
+Contains components that are loaded when they are rendered for the first time, so modules of components that are
+never rendered (e.g. screens the user never opens) are not imported.
+"""
+
+
+class LazyLoadError(Exception):
+    pass
+
+
+class _LazyPlaceholder(DynamicComponent, ParentComponent):
+    """Component rendered in place of a lazy component.
+
+    Renders fallback component until the lazy component is loaded and the loaded component after that.
+    The placeholder is rendered instead of the loaded component even after loading completes, so the loaded component is
+    not re-mounted when its parent re-renders.
+    """
+
+    def __init__(self, lazy: 'LazyComponent', /, key=None, **props):
+        # Props (including `ref`) are passed to the loaded component
+        super().__init__(key=key)
+        self.props = props
+        self.lazy = lazy
+
+    def update_props_from(self, other: '_LazyPlaceholder') -> bool:
+        lazy_changed = other.lazy is not self.lazy
+        self.lazy = other.lazy
+
+        return super().update_props_from(other) or lazy_changed
+
+    def props_equal_to(self, other: '_LazyPlaceholder') -> bool:
+        # Placeholders of different lazy components have the same class and default keys
+        return other.lazy is self.lazy and super().props_equal_to(other)
+
+    def unmount(self):
+        self.lazy.remove_waiting(self)
+
+        super().unmount()
+
+    def render(self):
+        lazy = self.lazy
+        component = lazy.get_component(self)
+
+        if component is not None:
+            component(**self.props)
+        elif lazy.fallback is not None:
+            lazy.fallback()
+
+    def on_lazy_loaded(self):
+        if self.is_mounted():
+            self.enqueue_update()
+
+
+class LazyComponent:
+    """Component inserter that loads the actual component inserter when it is rendered for the first time.
+
+    Loader runs on a background thread, so loading doesn't block the tree.
+    Until loading completes, fallback component is rendered instead.
+    When loading completes, rendered instances are updated to render the loaded component.
+    If loading fails, rendered instances raise `LazyLoadError` from their updates, so the error is handled by
+    `Tree.handle_error`.
+
+    Use `lazy` to create lazy components.
+    """
+
+    def __init__(self, loader: Callable[[], Callable], fallback: Optional[Callable] = None):
+        self.fallback = fallback
+        self.__loader = loader
+        self.__lock = threading.Lock()
+        self.__loaded = threading.Event()
+        self.__thread: Optional[threading.Thread] = None
+        self.__component: Optional[Callable] = None
+        self.__error: Optional[Exception] = None
+        # Trees of mounted placeholders waiting for loading to complete
+        self.__waiting: dict[_LazyPlaceholder, Tree] = {}
+
+    def __call__(self, **props) -> Component:
+        placeholder = _LazyPlaceholder(self, **props)
+        placeholder.insert()
+        return placeholder
+
+    @property
+    def is_loaded(self) -> bool:
+        """`True` iff loading has completed, successfully or not."""
+        return self.__loaded.is_set()
+
+    @property
+    def component(self) -> Optional[Callable]:
+        """The loaded component inserter or `None` if it is not loaded (yet)."""
+        return self.__component
+
+    @property
+    def error(self) -> Optional[Exception]:
+        """Error raised by loader or `None` if it has not failed (yet)."""
+        return self.__error
+
+    def preload(self):
+        """Starts loading of the component in background, unless it is already started."""
+        with self.__lock:
+            self.__start_loading()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Starts loading of the component, unless it is already started, and waits for it to complete.
+
+        :param timeout: maximal time to wait, in seconds; waits forever when `None`
+        :returns: `True` iff loading has completed, successfully or not
+        """
+        self.preload()
+
+        return self.__loaded.wait(timeout)
+
+    def __start_loading(self):
+        if self.__thread is None:
+            self.__thread = threading.Thread(target=self.__load, name='LazyComponentLoader', daemon=True)
+            self.__thread.start()
+
+    def __load(self):
+        component, error = None, None
+
+        try:
+            component = self.__loader()
+        except Exception as e:
+            error = e
+
+        with self.__lock:
+            self.__component = component
+            self.__error = error
+            self.__loaded.set()
+            waiting = self.__waiting
+            self.__waiting = {}
+
+        for placeholder, tree in waiting.items():
+            tree.enqueue_task('update', placeholder.on_lazy_loaded)
+
+    def get_component(self, placeholder: _LazyPlaceholder) -> Optional[Callable]:
+        """Returns the loaded component or `None` if it is not loaded yet.
+
+        If the component is not loaded, starts loading and remembers given placeholder to update it when loading
+        completes.
+
+        :raises LazyLoadError: if loading has failed
+        """
+        with self.__lock:
+            if not self.__loaded.is_set():
+                self.__waiting[placeholder] = placeholder.tree
+                self.__start_loading()
+                return None
+
+        if self.__error is not None:
+            raise LazyLoadError('Error loading lazy component') from self.__error
+
+        return self.__component
+
+    def remove_waiting(self, placeholder: _LazyPlaceholder):
+        with self.__lock:
+            self.__waiting.pop(placeholder, None)
+
+
+def lazy(loader: Callable[[], Callable], fallback: Optional[Callable] = None) -> LazyComponent:
+    """Creates a component that is loaded by given loader when it is rendered for the first time.
+
+    Usage:
+
+    settings_screen = lazy(lambda: import_module('myapp.settings').settings_screen, fallback=loading_indicator)
+
+    :param loader: function returning the component inserter; called once, on a background thread
+    :param fallback: component inserter rendered (without props) until the component is loaded
+    """
+    return LazyComponent(loader, fallback)
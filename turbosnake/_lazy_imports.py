@@ -0,0 +1,43 @@
+import importlib
+from typing import Callable
+
+"""
+_lazy_imports.py
+
+Contains helper for packages that import their public names lazily, on first access (see PEP 562), so importing a
+package doesn't import all of it's modules.
+"""
+
+
+def lazy_exports(
+        package_name: str,
+        namespace: dict,
+        exports: dict[str, tuple[str, ...]],
+) -> tuple[Callable[[str], object], Callable[[], list[str]], tuple[str, ...]]:
+    """Creates module-level `__getattr__`, `__dir__` and `__all__` of a package that exports names lazily.
+
+    A name is imported from it's module when it is accessed for the first time.
+    Then it is stored in the package namespace, so `__getattr__` is not called for it again.
+
+    :param package_name: name of the package (`__name__` of it's `__init__` module)
+    :param namespace: globals of the package
+    :param exports: names exported by the package, by names of modules (relative to the package) they are defined in
+    :return: `__getattr__`, `__dir__` and `__all__` of the package
+    """
+    modules_by_name = {name: module for module, names in exports.items() for name in names}
+
+    def __getattr__(name: str):
+        module_name = modules_by_name.get(name)
+
+        if module_name is None:
+            raise AttributeError(f'module {package_name!r} has no attribute {name!r}')
+
+        value = getattr(importlib.import_module(module_name, package_name), name)
+        namespace[name] = value
+
+        return value
+
+    def __dir__():
+        return sorted(namespace.keys() | modules_by_name.keys())
+
+    return __getattr__, __dir__, tuple(modules_by_name)
@@ -0,0 +1,322 @@
+from typing import Type, Optional, Any, Union, Callable, Iterable, Hashable
+
+from ._components import Component, sort_in_document_order
+from ._utils import get_component_class
+
+"""
+_selectors.py
+
+Contains selectors - helpers that find mounted components by class, key and properties - and index of components that
+makes such queries cheap on large trees.
+"""
+
+# Default value of `key` parameter of queries, that matches components with any key
+ANY_KEY = object()
+
+# Stored in index in place of values of properties missing in component's props
+_missing = object()
+
+
+def _construct_predicate(component: Union[None, Type[Component], Callable] = None,
+                         props: Optional[dict[str, Any]] = None,
+                         key: Hashable = ANY_KEY,
+                         ):
+    component_class = None
+    if component:
+        component_class = get_component_class(component)
+
+    def predicate(c):
+        if component_class:
+            if not isinstance(c, component_class):
+                return False
+
+        if key is not ANY_KEY and c.key != key:
+            return False
+
+        if props:
+            component_props = c.props
+
+            for k in props.keys():
+                if k not in component_props or component_props[k] != props[k]:
+                    return False
+
+        return True
+
+    return predicate
+
+
+def _is_hashable(value) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+
+    return True
+
+
+class ComponentIndex:
+    """Index of mounted components of a tree by class, key and values of selected properties.
+
+    The index is maintained incrementally as components are mounted, updated and unmounted.
+    Creating an index attaches it to the tree, replacing previously attached one:
+
+    ComponentIndex(tree, props=('name',))
+
+    selector = Selector.of_tree(tree)
+    selector.descendants(tk_button, props=dict(name='ok'))  # Uses the index
+    """
+
+    def __init__(self, tree, props: Iterable[str] = ()):
+        self.tree = tree
+        self.prop_names: tuple[str, ...] = tuple(props)
+
+        self._by_class: dict[type, dict[Component, None]] = {}
+        self._by_key: dict[Hashable, dict[Component, None]] = {}
+        self._by_prop: dict[str, dict[Hashable, dict[Component, None]]] = {name: {} for name in self.prop_names}
+        # Components whose values of some indexed properties are not hashable, they are checked on every query
+        self._unindexed: dict[Component, None] = {}
+        # Indexed property values of every component
+        self._values: dict[Component, tuple] = {}
+
+        tree.component_index = self
+
+        root = tree.root
+
+        if root is not None:
+            stack = [root]
+
+            while stack:
+                c = stack.pop()
+                self.add(c)
+                stack.extend(c.mounted_children())
+
+    def __len__(self):
+        return len(self._values)
+
+    def __get_values(self, component: Component) -> tuple:
+        props = component.props
+        return tuple(props.get(name, _missing) for name in self.prop_names)
+
+    def __add_values(self, component: Component, values: tuple):
+        self._values[component] = values
+
+        for name, value in zip(self.prop_names, values):
+            if value is _missing:
+                continue
+
+            if not _is_hashable(value):
+                self._unindexed[component] = None
+                continue
+
+            self._by_prop[name].setdefault(value, {})[component] = None
+
+    def __remove_values(self, component: Component):
+        values = self._values.pop(component)
+        self._unindexed.pop(component, None)
+
+        for name, value in zip(self.prop_names, values):
+            if value is _missing or not _is_hashable(value):
+                continue
+
+            by_value = self._by_prop[name]
+            components = by_value[value]
+            del components[component]
+
+            if not components:
+                del by_value[value]
+
+    def add(self, component: Component):
+        """Adds a newly mounted component to the index."""
+        self._by_class.setdefault(component.__class__, {})[component] = None
+
+        if _is_hashable(component.key):
+            self._by_key.setdefault(component.key, {})[component] = None
+
+        self.__add_values(component, self.__get_values(component))
+
+    def remove(self, component: Component):
+        """Removes a component being unmounted from the index."""
+        cls = component.__class__
+        components = self._by_class[cls]
+        del components[component]
+
+        if not components:
+            del self._by_class[cls]
+
+        if _is_hashable(component.key):
+            components = self._by_key[component.key]
+            del components[component]
+
+            if not components:
+                del self._by_key[component.key]
+
+        self.__remove_values(component)
+
+    def on_props_updated(self, component: Component):
+        """Re-indexes a component whose properties have changed."""
+        values = self.__get_values(component)
+
+        if values != self._values[component]:
+            self.__remove_values(component)
+            self.__add_values(component, values)
+
+    def find(self,
+             component: Union[None, Type[Component], Callable] = None,
+             props: Optional[dict[str, Any]] = None,
+             key: Hashable = ANY_KEY,
+             ) -> list[Component]:
+        """Returns all mounted components matching given criteria, in document order."""
+        candidate_sets = []
+
+        if component:
+            component_class = get_component_class(component)
+            candidate_sets.append([
+                c
+                for cls, components in self._by_class.items()
+                if issubclass(cls, component_class)
+                for c in components
+            ])
+
+        if key is not ANY_KEY and _is_hashable(key):
+            candidate_sets.append(self._by_key.get(key, ()))
+
+        if props:
+            unindexed = self._unindexed
+
+            for name, value in props.items():
+                if name in self._by_prop and _is_hashable(value):
+                    candidate_sets.append([*self._by_prop[name].get(value, ()), *unindexed])
+
+        if candidate_sets:
+            candidates = min(candidate_sets, key=len)
+        else:
+            candidates = self._values
+
+        predicate = _construct_predicate(component, props, key)
+
+        return sort_in_document_order([c for c in candidates if predicate(c)])
+
+    def find_descendants(self, ascendants: Iterable[Component], *args, **kwargs) -> list[Component]:
+        """Returns mounted descendants of any of given components matching given criteria, in document order.
+
+        Accepts the same criteria as `find`.
+        """
+        ascendants = set(ascendants)
+        tree = self.tree
+
+        def is_descendant(c):
+            parent = c.parent
+
+            while parent is not tree:
+                if parent in ascendants:
+                    return True
+
+                parent = parent.parent
+
+            return False
+
+        return [c for c in self.find(*args, **kwargs) if is_descendant(c)]
+
+
+class Selector:
+    def __init__(self, components: Iterable[Component], index: Optional[ComponentIndex] = None):
+        self._components = components
+        self._index = index
+
+    @staticmethod
+    def of_tree(tree) -> 'Selector':
+        """Returns selector of root component of given tree, that uses index attached to the tree if there is one."""
+        return Selector([tree.root], tree.component_index)
+
+    def __iter__(self):
+        return iter(self._components)
+
+    def only(self) -> Component:
+        it = iter(self._components)
+        try:
+            value = next(it)
+        except StopIteration:
+            raise Exception('No components match the selector')
+
+        try:
+            next(it)
+        except StopIteration:
+            pass
+        else:
+            raise Exception(f'More than one ({len(self.all())}) components match the selector')
+
+        return value
+
+    def one(self) -> Component:
+        try:
+            return next(iter(self._components))
+        except StopIteration:
+            raise Exception('No components selected while at least one expected')
+
+    def all(self) -> list[Component]:
+        return list(self._components)
+
+    def count(self) -> int:
+        return len(self.all())
+
+    _construct_predicate = staticmethod(_construct_predicate)
+
+    def descendants_matching(self, predicate) -> 'Selector':
+        result: dict[Component, None] = {}
+
+        def traverse(component):
+            for child in component.mounted_children():
+                if predicate(child):
+                    result[child] = None
+                traverse(child)
+
+        components = list(self._components)
+
+        for c in components:
+            traverse(c)
+
+        if len(components) > 1:
+            return Selector(sort_in_document_order(result), self._index)
+
+        return Selector(list(result), self._index)
+
+    def descendants(self,
+                    component: Union[None, Type[Component], Callable] = None,
+                    props: Optional[dict[str, Any]] = None,
+                    key: Hashable = ANY_KEY,
+                    ) -> 'Selector':
+        index = self._index
+
+        if index is not None:
+            return Selector(index.find_descendants(self._components, component, props, key), index)
+
+        return self.descendants_matching(_construct_predicate(component, props, key))
+
+    def children_matching(self, predicate) -> 'Selector':
+        return Selector(
+            [child for component in self for child in component.mounted_children() if predicate(child)],
+            self._index
+        )
+
+    def children(self,
+                 component: Union[None, Type[Component], Callable] = None,
+                 props: Optional[dict[str, Any]] = None,
+                 key: Hashable = ANY_KEY,
+                 ) -> 'Selector':
+        return self.children_matching(_construct_predicate(component, props, key))
+
+    def parents_matching(self, predicate) -> 'Selector':
+        return Selector(
+            [
+                component.parent for component in self if
+                component.parent is not component.tree and predicate(component.parent)
+            ],
+            self._index
+        )
+
+    def parents(self,
+                component: Union[None, Type[Component], Callable] = None,
+                props: Optional[dict[str, Any]] = None,
+                key: Hashable = ANY_KEY,
+                ) -> 'Selector':
+        return self.parents_matching(_construct_predicate(component, props, key))
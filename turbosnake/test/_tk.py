@@ -0,0 +1,68 @@
+import tkinter as tk
+import unittest
+from typing import Callable
+
+from turbosnake import functional_component, use_state
+from turbosnake.ttk import TkTree
+
+
+def create_tk_root() -> tk.Tk:
+    """Creates Tk root window, skipping the test if there is no display to create it on."""
+    try:
+        root = tk.Tk()
+    except tk.TclError as e:
+        raise unittest.SkipTest(f'Tk is not available: {e}')
+
+    root.withdraw()
+
+    return root
+
+
+class TkTreeTestCase(unittest.TestCase):
+    """Base class for tests of tk components, skipped if there is no display.
+
+    Records Tcl commands sent by components through tree's command batch.
+    """
+
+    tree_options: dict = {}
+
+    def setUp(self):
+        self.root = create_tk_root()
+        self.addCleanup(self.root.destroy)
+        self.tree = TkTree(widget=self.root, **self.tree_options)
+        self.commands: list[tuple[str, ...]] = []
+
+        batch = self.tree.tcl_batch
+        add = batch.add
+
+        def record(*words):
+            self.commands.append(tuple(map(str, words)))
+            add(*words)
+
+        batch.add = record
+
+    def render(self, render: Callable, state) -> Callable:
+        """Renders a component that calls `render` with it's state and returns function that changes the state.
+
+        The function returns commands sent after the change.
+        """
+        set_state = None
+
+        @functional_component
+        def app():
+            nonlocal set_state
+            value, set_state = use_state(state)
+            render(value)
+
+        with self.tree:
+            app()
+
+        self.root.update()
+
+        def update(new_state) -> list[tuple[str, ...]]:
+            self.commands.clear()
+            set_state(new_state)
+            self.root.update()
+            return list(self.commands)
+
+        return update
@@ -0,0 +1,74 @@
+import unittest
+
+from turbosnake.ttk import tk_canvas, tk_canvas_rect, tk_canvas_oval
+from turbosnake.ttk._canvas import _flatten_coords
+from ._tk import TkTreeTestCase
+
+
+class FlattenCoordsTest(unittest.TestCase):
+    def test_flatten_coords(self):
+        self.assertEqual((0, 1, 2, 3), _flatten_coords([(0, 1), (2, 3)]))
+        self.assertEqual((0, 1, 2, 3), _flatten_coords([0, 1, (2, 3)]))
+
+
+class CanvasItemsTest(TkTreeTestCase):
+    def render_items(self, items):
+        if items is None:
+            return
+
+        with tk_canvas():
+            for key, props in items:
+                (tk_canvas_oval if key == 'oval' else tk_canvas_rect)(key=key, **props)
+
+    def get_canvas(self):
+        canvas, = self.tree.get_tk_children()
+        return canvas
+
+    def get_tags(self) -> dict:
+        return {item.key: item.tag for item in self.get_canvas().canvas_items.get_items()}
+
+    def test_create_and_update_items(self):
+        update = self.render(self.render_items, [('rect', dict(coords=((0, 0), (10, 10))))])
+        path = self.get_canvas().widget._w
+        rect = self.get_tags()['rect']
+
+        commands = update([('rect', dict(coords=((0, 0), (10, 10)))), ('oval', dict(coords=(1, 2, 3, 4), fill='red'))])
+        oval = self.get_tags()['oval']
+
+        # Options equal to defaults are not sent
+        self.assertEqual([(path, 'create', 'oval', '1', '2', '3', '4', '-fill', 'red', '-tags', oval)], commands)
+
+        commands = update([('rect', dict(coords=((0, 0), (20, 20)))), ('oval', dict(coords=(1, 2, 3, 4), fill='red'))])
+
+        self.assertEqual([(path, 'coords', rect, '0', '0', '20', '20')], commands)
+
+        commands = update([('rect', dict(coords=((0, 0), (20, 20)))), ('oval', dict(coords=(1, 2, 3, 4), fill='blue'))])
+
+        self.assertEqual([(path, 'itemconfigure', oval, '-fill', 'blue')], commands)
+
+        commands = update([('oval', dict(coords=(1, 2, 3, 4), fill='blue'))])
+
+        self.assertEqual([(path, 'delete', rect)], commands)
+
+    def test_restack_moved_items(self):
+        rect = ('rect', dict(coords=(0, 0, 10, 10)))
+        oval = ('oval', dict(coords=(0, 0, 10, 10)))
+        update = self.render(self.render_items, [rect, oval])
+        path = self.get_canvas().widget._w
+        tags = self.get_tags()
+
+        commands = update([oval, rect])
+
+        self.assertEqual([(path, 'lower', tags['oval'], tags['rect'])], commands)
+
+        commands = update([rect, oval])
+
+        self.assertEqual([(path, 'lower', tags['rect'], tags['oval'])], commands)
+
+    def test_delete_items_with_canvas(self):
+        update = self.render(self.render_items, [('rect', dict(coords=(0, 0, 10, 10)))])
+        path = self.get_canvas().widget._w
+
+        commands = update(None)
+
+        self.assertEqual([('destroy', path)], commands)
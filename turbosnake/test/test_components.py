@@ -1,5 +1,8 @@
-from turbosnake import fragment, DynamicComponent, Component, Ref, ComponentNotFoundError
-from turbosnake._components import Fragment
+import sys
+
+from turbosnake import fragment, DynamicComponent, Component, Ref, ComponentNotFoundError, Wrapper, UpdateGate, \
+    component_inserter, functional_component, use_state
+from turbosnake._components import Fragment, sort_in_document_order
 from turbosnake.test_helpers import TreeTestCase
 
 
@@ -148,3 +151,139 @@ class ComponentTest(TreeTestCase):
             list(res),
             [ref1.current, ref2.current]
         )
+
+    def test_has_props_changed(self):
+        changes = []
+
+        class Child(Component):
+            def update(self):
+                super().update()
+                changes.append((self.has_props_changed(('a',)), self.has_props_changed(('b',))))
+
+        class Parent(DynamicComponent):
+            def render(self):
+                Child(**self.get_state_or_init('props', dict(a=1, b=1))).insert()
+
+        with self.tree:
+            Parent().insert()
+        self.tree.run_tasks()
+
+        self.tree.root.set_state('props', dict(a=2, b=1))
+        self.tree.run_tasks()
+
+        self.tree.root.set_state('props', dict(a=2, b=2))
+        self.tree.run_tasks()
+
+        # Props are compared to ones of the previous update, even after `Component.update` has completed
+        self.assertEqual([(False, False), (True, False), (False, True)], changes)
+
+
+class SortInDocumentOrderTest(TreeTestCase):
+    def test_sort(self):
+        refs = [Ref() for _ in range(4)]
+
+        with self.tree:
+            with fragment(ref=refs[0]):
+                with fragment(ref=refs[1]):
+                    fragment(ref=refs[2])
+                fragment(ref=refs[3])
+        self.tree.run_tasks()
+
+        components = [ref.current for ref in refs]
+
+        self.assertEqual(components, sort_in_document_order(components[::-1]))
+        self.assertEqual(components[2:], sort_in_document_order(components[:1:-1], ancestor=components[0]))
+
+    def test_sort_deeper_than_recursion_limit(self):
+        leaf_ref = Ref()
+
+        @functional_component
+        def nested(depth, **_):
+            if depth:
+                nested(depth=depth - 1)
+            else:
+                fragment(ref=leaf_ref)
+
+        with self.tree:
+            nested(depth=sys.getrecursionlimit() + 100)
+        self.tree.run_tasks()
+
+        self.assertEqual([self.tree.root, leaf_ref.current], sort_in_document_order([leaf_ref.current, self.tree.root]))
+
+
+class _Gated(Wrapper):
+    """Wrapper that suspends updates of it's descendants while `gate` is suspended."""
+
+    def mount(self, parent):
+        super().mount(parent)
+        self.gate = UpdateGate(self.tree, self.update_gate)
+
+    @property
+    def child_update_gate(self):
+        return self.gate
+
+
+class UpdateGateTest(TreeTestCase):
+    def test_defer_updates_while_suspended(self):
+        renders = []
+        setters = {}
+
+        @functional_component
+        def counter(name):
+            value, setters[name] = use_state(0)
+            renders.append((name, value))
+
+        with self.tree:
+            with component_inserter(_Gated)(key='outer'):
+                with component_inserter(_Gated)(key='inner'):
+                    counter(name='a')
+                counter(name='b')
+
+        self.tree.run_tasks()
+        outer = self.root_selector().only()
+        inner = self.root_selector().children(key='inner').only()
+        renders.clear()
+
+        outer.gate.suspend()
+        setters['a'](1)
+        setters['b'](1)
+        self.tree.run_tasks()
+        self.assertEqual([], renders)
+
+        # Inner gate passes updates to suspended outer gate
+        inner.gate.suspend()
+        inner.gate.resume()
+        self.tree.run_tasks()
+        self.assertEqual([], renders)
+
+        outer.gate.resume()
+        self.tree.run_tasks()
+        self.assertEqual([('a', 1), ('b', 1)], sorted(renders))
+
+    def test_skip_unmounted_components_on_resume(self):
+        renders = []
+        setters = {}
+
+        @functional_component
+        def counter():
+            value, setters['set'] = use_state(0)
+            renders.append(value)
+
+        @functional_component
+        def root():
+            show, setters['show'] = use_state(True)
+
+            with component_inserter(_Gated)(key='gated'):
+                if show:
+                    counter()
+
+        self.render(root)
+        gated = self.root_selector().children().only()
+        gated.gate.suspend()
+        setters['set'](1)
+        setters['show'](False)
+        self.tree.run_tasks()
+
+        gated.gate.resume()
+        self.tree.run_tasks()
+        self.assertEqual([0], renders)
@@ -0,0 +1,92 @@
+from turbosnake import Context, functional_component, use_context, use_state, use_ref, fragment, use_self, Ref, \
+    LeakChecker, Component
+from turbosnake._context import _ContextHook
+from turbosnake._hooks import _StateHook, _RefHook
+from turbosnake.test_helpers import TreeTestCase
+
+ctx = Context('test')
+
+
+@functional_component
+def context_user(**_):
+    use_context(ctx)
+    use_state(0)
+
+
+@functional_component
+def app(component_ref):
+    use_ref()
+
+    with ctx.provider(value='foo'):
+        context_user(key=1)
+        context_user(key=2)
+
+    Component(ref=component_ref).insert()
+
+
+class CensusTest(TreeTestCase):
+    def test_census(self):
+        self.render(app, component_ref=Ref())
+
+        census = self.tree.census()
+
+        self.assertEqual(2, census['components']['FunctionalComponent<context_user>'])
+        self.assertEqual(1, census['components'][Component])
+        self.assertEqual({_RefHook: 1, _ContextHook: 2, _StateHook: 2}, census['hooks'])
+        self.assertEqual([('test', 2)], census['context_observers'])
+        self.assertEqual(2, census['refs'])
+        self.assertEqual({'update': 0, 'effect': 0}, census['pending_tasks'])
+
+        self.tree.root.enqueue_update()
+
+        self.assertEqual({'update': 1, 'effect': 0}, self.tree.census()['pending_tasks'])
+
+
+class LeakCheckerTest(TreeTestCase):
+    def test_no_leaks(self):
+        self.render(app, component_ref=Ref())
+
+        checker = LeakChecker(self.tree.root)
+        self.render(fragment)
+
+        self.assertEqual([], checker.collect_leaks())
+
+    def test_report_leaked_objects(self):
+        holder = []
+
+        @functional_component
+        def holding():
+            holder.append(use_self())
+
+        self.render(holding)
+
+        checker = LeakChecker(self.tree.root)
+        self.render(fragment)
+
+        leaks = checker.collect_leaks()
+
+        self.assertEqual('component FunctionalComponent<holding> (key=None)', leaks[0].description)
+        self.assertEqual(['list of 1 items'], leaks[0].referrers)
+
+        # Other objects of the component are held by the component only
+        for leak in leaks[1:]:
+            self.assertEqual([], leak.referrers)
+
+    def test_report_ref_holding_component(self):
+        ref = Ref()
+
+        @functional_component(hooks=False)
+        def referenced():
+            pass
+
+        self.render(referenced, ref=ref)
+
+        checker = LeakChecker(self.tree.root)
+        self.render(fragment)
+
+        leaks = checker.collect_leaks()
+
+        self.assertEqual(1, len(leaks))
+        # Depending on Python version, the referrer is either the ref or it's `__dict__`
+        self.assertEqual(1, len(leaks[0].referrers))
+        self.assertIn(repr(ref), leaks[0].referrers[0])
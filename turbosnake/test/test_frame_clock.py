@@ -0,0 +1,78 @@
+from unittest.mock import Mock, call
+
+from turbosnake import functional_component, use_animation_frame, use_state, fragment
+from turbosnake.test_helpers import TreeTestCase
+
+
+class FrameClockTest(TreeTestCase):
+    def test_tick_while_subscribed(self):
+        clock = self.tree.frame_clock
+        callback = Mock()
+
+        unsubscribe = clock.subscribe(callback)
+        self.assertTrue(clock.is_ticking)
+
+        self.tree.advance_time(20)
+        callback.assert_called_once_with(17)
+
+        unsubscribe()
+        self.assertFalse(clock.is_ticking)
+        self.assertEqual(0, self.tree.pending_delayed_tasks)
+
+    def test_skip_frames_when_late(self):
+        clock = self.tree.frame_clock
+        callback = Mock()
+        clock.subscribe(callback)
+
+        # A long blocking operation - the clock should not try to catch up with missed frames
+        self.tree.simulate_blocking(90)
+        self.tree.advance_time(0)
+
+        callback.assert_called_once_with(90)
+        self.assertEqual(1, self.tree.pending_delayed_tasks)
+
+        # Next frame stays aligned to frame grid
+        self.tree.advance_time(9)
+        self.assertEqual(1, callback.call_count)
+
+        self.tree.advance_time(1)
+        self.assertEqual([call(90), call(10)], callback.call_args_list)
+
+    def test_use_animation_frame(self):
+        set_running = None
+        rendered_positions = []
+
+        @functional_component
+        def animated():
+            nonlocal set_running
+            running, set_running = use_state(True)
+            position, set_position = use_state(0)
+            rendered_positions.append(position)
+
+            @use_animation_frame(running)
+            def on_frame(elapsed):
+                set_position(position + elapsed)
+
+        self.render(animated)
+
+        self.tree.advance_time(20)
+        self.tree.advance_time(20)
+        self.assertEqual([0, 17, 34], rendered_positions)
+
+        set_running(False)
+        self.tree.run_tasks()
+        self.assertFalse(self.tree.frame_clock.is_ticking)
+
+    def test_unsubscribe_on_unmount(self):
+        frame = Mock()
+
+        @functional_component
+        def animated():
+            use_animation_frame(frame)
+
+        self.render(animated)
+        self.assertTrue(self.tree.frame_clock.is_ticking)
+
+        self.render(fragment)
+        self.assertFalse(self.tree.frame_clock.is_ticking)
+        frame.assert_not_called()
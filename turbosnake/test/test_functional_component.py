@@ -1,4 +1,6 @@
-from turbosnake import Component, ParentComponent, fragment, functional_component, ComponentsCollection
+from turbosnake import Component, ParentComponent, fragment, functional_component, ComponentsCollection, \
+    enable_hot_swap, prepare_hot_swap, use_state, use_ref
+from turbosnake._utils import get_component_class
 from turbosnake.test_helpers import TreeTestCase
 
 
@@ -82,3 +84,206 @@ class FunctionalComponentTest(TreeTestCase):
                 child()
 
         self.assertTreeMatchesSnapshot()
+
+
+class HotSwapTest(TreeTestCase):
+    def setUp(self):
+        super().setUp()
+        enable_hot_swap()
+        self.addCleanup(enable_hot_swap, False)
+
+    @staticmethod
+    def define(source):
+        # Defines a module-level function, as if it was loaded from a module that is (re)imported
+        prepare_hot_swap('hot_swap_test_module')
+        namespace = {'__name__': 'hot_swap_test_module', 'functional_component': functional_component,
+                     'use_state': use_state, 'use_ref': use_ref, 'renders': []}
+        exec(source, namespace)
+        return namespace['counter'], namespace['renders']
+
+    def test_keep_state(self):
+        counter, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(0)\n'
+            '    renders.append(("v1", count, set_count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        component = self.render(counter)
+        renders[-1][2](5)
+        self.tree.run_tasks()
+
+        counter, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(0)\n'
+            '    renders.append(("v2", count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.tree.run_tasks()
+
+        self.assertEqual([('v2', 5)], renders)
+        self.assertTrue(component.is_mounted())
+        # The new definition creates instances of the same class, so they update mounted instances
+        self.assertIsInstance(component, get_component_class(counter))
+
+    def test_reset_incompatible_hooks(self):
+        counter, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(0)\n'
+            '    renders.append(("v1", count, set_count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        component = self.render(counter)
+        renders[-1][2](5)
+        self.tree.run_tasks()
+
+        _, renders = self.define(
+            'def counter():\n'
+            '    ref = use_ref()\n'
+            '    count, set_count = use_state(1)\n'
+            '    renders.append(("v2", count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.tree.run_tasks()
+
+        self.assertEqual([('v2', 1)], renders)
+        self.assertTrue(component.is_mounted())
+
+    def test_reset_on_hook_sequence_error(self):
+        counter, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(0)\n'
+            '    renders.append(("v1", count, set_count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.render(counter)
+        renders[-1][2](5)
+        self.tree.run_tasks()
+
+        _, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(1)\n'
+            '    other, set_other = use_state(2)\n'
+            '    renders.append(("v2", count, other))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.tree.run_tasks()
+
+        self.assertEqual([('v2', 1, 2)], renders)
+
+    def test_reset_on_removed_hook(self):
+        counter, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(0)\n'
+            '    other, set_other = use_state(2)\n'
+            '    renders.append(("v1", count, set_count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.render(counter)
+        renders[-1][2](5)
+        self.tree.run_tasks()
+
+        _, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(1)\n'
+            '    renders.append(("v2", count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.tree.run_tasks()
+
+        self.assertEqual([('v2', 5), ('v2', 1)], renders)
+
+    def test_compare_hooks_called_by_helpers(self):
+        counter, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(0)\n'
+            '    renders.append(("v1", count, set_count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.render(counter)
+        renders[-1][2](5)
+        self.tree.run_tasks()
+
+        # Same hooks called by a helper function keep the state
+        _, renders = self.define(
+            'def use_count():\n'
+            '    return use_state(0)\n'
+            'def counter():\n'
+            '    count, set_count = use_count()\n'
+            '    renders.append(("v2", count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.tree.run_tasks()
+
+        self.assertEqual([('v2', 5)], renders)
+
+        # Different hooks called by a helper function reset it
+        _, renders = self.define(
+            'def use_count():\n'
+            '    use_ref()\n'
+            '    return use_state(0)\n'
+            'def counter():\n'
+            '    count, set_count = use_count()\n'
+            '    renders.append(("v3", count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.tree.run_tasks()
+
+        self.assertEqual([('v3', 0)], renders)
+
+    def test_remount_on_changed_shape(self):
+        counter, _ = self.define(
+            'def counter():\n'
+            '    pass\n'
+            'counter = functional_component(counter)\n'
+        )
+        component = self.render(counter)
+
+        counter, _ = self.define(
+            'def counter(children):\n'
+            '    children()\n'
+            'counter = functional_component(counter)\n'
+        )
+
+        self.assertNotIsInstance(component, get_component_class(counter))
+
+    def test_separate_classes_of_functions_with_same_name(self):
+        namespace = {'__name__': 'hot_swap_test_module', 'functional_component': functional_component}
+        prepare_hot_swap('hot_swap_test_module')
+        exec(
+            'def counter():\n'
+            '    pass\n'
+            'first = functional_component(counter)\n'
+            'def counter():\n'
+            '    pass\n'
+            'second = functional_component(counter)\n'
+            'lambdas = functional_component(lambda: None), functional_component(lambda: None)\n',
+            namespace
+        )
+
+        self.assertIsNot(get_component_class(namespace['first']), get_component_class(namespace['second']))
+        self.assertIsNot(get_component_class(namespace['lambdas'][0]), get_component_class(namespace['lambdas'][1]))
+
+    def test_keep_state_after_failed_import(self):
+        counter, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(0)\n'
+            '    renders.append(("v1", count, set_count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        component = self.render(counter)
+        renders[-1][2](5)
+        self.tree.run_tasks()
+
+        with self.assertRaises(RuntimeError):
+            self.define('raise RuntimeError("broken")\n')
+
+        counter, renders = self.define(
+            'def counter():\n'
+            '    count, set_count = use_state(0)\n'
+            '    renders.append(("v2", count))\n'
+            'counter = functional_component(counter)\n'
+        )
+        self.tree.run_tasks()
+
+        self.assertEqual([('v2', 5)], renders)
+        self.assertIsInstance(component, get_component_class(counter))
@@ -1,7 +1,8 @@
+from threading import Thread
 from unittest.mock import Mock
 
 from turbosnake import functional_component, use_self, Ref, use_state, Component, use_toggle, fragment, use_previous, \
-    use_ref, use_effect
+    use_ref, use_effect, use_reducer, use_animation_frame
 from turbosnake._hooks import HookSequenceError, use_callback_proxy, use_callback, use_memo
 from turbosnake.test_helpers import TreeTestCase
 
@@ -75,6 +76,39 @@ class HookErrorsTest(TreeTestCase):
         with self.assertRaises(HookSequenceError):
             self.tree.run_tasks()
 
+    def test_unmount_hooks_of_failed_first_render(self):
+        effect, frame = Mock(), Mock()
+        fail = True
+        component = None
+
+        @functional_component
+        def tc():
+            nonlocal component
+            component = use_self()
+
+            if fail:
+                use_effect(effect)
+                use_animation_frame(frame)
+                raise ValueError()
+
+        with self.tree:
+            tc()
+
+        with self.assertRaises(ValueError):
+            self.tree.run_tasks()
+
+        self.assertTrue(self.tree.frame_clock.is_ticking)
+
+        # Render the component again, as its update task does
+        fail = False
+        component.update()
+        self.tree.run_tasks()
+        self.tree.advance_time(100)
+
+        self.assertFalse(self.tree.frame_clock.is_ticking)
+        effect.assert_not_called()
+        frame.assert_not_called()
+
 
 class UseSelfTest(TreeTestCase):
     def test_use_self(self):
@@ -128,6 +162,86 @@ class UseStateTest(TreeTestCase):
         )
 
 
+class UseReducerTest(TreeTestCase):
+    @staticmethod
+    def reducer(state, action):
+        return state + [action]
+
+    def test_fold_actions_before_render(self):
+        dispatch = None
+        rendered = []
+
+        @functional_component
+        def tc():
+            nonlocal dispatch
+            state, dispatch = use_reducer(self.reducer, [])
+            rendered.append(state)
+
+        self.render(tc)
+
+        prev_dispatch = dispatch
+        dispatch('a')
+        dispatch('b')
+        dispatch('c')
+        self.tree.run_tasks()
+
+        self.assertEqual([[], ['a', 'b', 'c']], rendered)
+        self.assertEqual(prev_dispatch, dispatch)
+
+    def test_dispatch_from_other_thread(self):
+        dispatch = None
+        rendered = []
+
+        @functional_component
+        def tc():
+            nonlocal dispatch
+            state, dispatch = use_reducer(self.reducer, [])
+            rendered.append(state)
+
+        self.render(tc)
+
+        thread = Thread(target=lambda: (dispatch(1), dispatch(2)))
+        thread.start()
+        thread.join()
+
+        self.tree.run_tasks()
+
+        self.assertEqual([[], [1, 2]], rendered)
+
+    def test_ignore_dispatch_after_unmount(self):
+        dispatch = None
+        rendered = []
+
+        @functional_component
+        def tc():
+            nonlocal dispatch
+            state, dispatch = use_reducer(self.reducer, [])
+            rendered.append(state)
+
+        self.render(tc)
+
+        with self.tree:
+            fragment()
+        self.tree.run_tasks()
+
+        errors = []
+
+        def dispatch_from_thread():
+            try:
+                dispatch('b')
+            except Exception as e:
+                errors.append(e)
+
+        thread = Thread(target=dispatch_from_thread)
+        thread.start()
+        thread.join()
+        dispatch('a')
+        self.tree.run_tasks()
+
+        self.assertEqual([], errors)
+        self.assertEqual([[]], rendered)
+
+
 class UseToggleTest(TreeTestCase):
     def test_use_toggle(self):
         toggle = None
@@ -286,6 +400,31 @@ class UseEffectTest(TreeTestCase):
 
         rollback.assert_called_once_with()
 
+    def test_rollback_on_unmount_of_many_components(self):
+        rollback = Mock()
+
+        @functional_component
+        def tc(i, **_):
+            @use_effect
+            def fx():
+                if i % 2:
+                    return lambda: rollback(i)
+
+        @functional_component
+        def tcs():
+            for i in range(6):
+                tc(i=i, key=i)
+
+        with self.tree:
+            tcs()
+        self.tree.run_tasks()
+
+        with self.tree:
+            fragment()
+        self.tree.run_tasks()
+
+        self.assertEqual([((1,),), ((3,),), ((5,),)], rollback.call_args_list)
+
     def test_rollback_and_reapply(self):
         effect, rollback = Mock(), Mock()
         set_state = None
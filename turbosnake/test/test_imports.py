@@ -0,0 +1,63 @@
+import json
+import subprocess
+import sys
+import unittest
+from os import path
+
+import turbosnake
+import turbosnake.ttk
+
+_PROJECT_ROOT = path.dirname(path.dirname(path.dirname(path.abspath(__file__))))
+
+# Slow to import modules used by some turbosnake modules, importing the packages alone must not import them
+_HEAVY_MODULES = ('tkinter', 'asyncio', 'threading', 'inspect')
+
+
+def _import_in_new_interpreter(statement: str) -> list[str]:
+    # Returns modules imported by the statement
+    code = (
+        'import sys, json\n'
+        'before = set(sys.modules)\n'
+        f'{statement}\n'
+        'print(json.dumps(sorted(set(sys.modules) - before)))\n'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=_PROJECT_ROOT, capture_output=True, text=True, check=True,
+    )
+
+    return json.loads(result.stdout)
+
+
+class LazyImportsTest(unittest.TestCase):
+    def test_import_core_lazily(self):
+        modules = _import_in_new_interpreter('import turbosnake')
+
+        self.assertEqual(['turbosnake', 'turbosnake._lazy_imports'], [m for m in modules if 'turbosnake' in m])
+        self.assertEqual([], [m for m in modules if m.split('.')[0] in _HEAVY_MODULES])
+
+    def test_import_ttk_lazily(self):
+        modules = _import_in_new_interpreter('import turbosnake.ttk')
+
+        self.assertEqual(
+            ['turbosnake', 'turbosnake._lazy_imports', 'turbosnake.ttk'],
+            [m for m in modules if 'turbosnake' in m],
+        )
+        self.assertEqual([], [m for m in modules if m.split('.')[0] in _HEAVY_MODULES])
+
+    def test_import_only_used_modules(self):
+        modules = _import_in_new_interpreter('from turbosnake import Tree')
+
+        self.assertNotIn('turbosnake._slotted_component', modules)
+        self.assertNotIn('turbosnake._async', modules)
+
+    def test_all_exports_available(self):
+        for package in (turbosnake, turbosnake.ttk):
+            for name in package.__all__:
+                self.assertIsNotNone(getattr(package, name))
+                self.assertIn(name, dir(package))
+
+    def test_missing_attribute(self):
+        with self.assertRaises(AttributeError):
+            # noinspection PyUnresolvedReferences
+            turbosnake.no_such_name
@@ -0,0 +1,139 @@
+from turbosnake.ttk import tk_label, tk_packed_frame, tk_grid_frame, tk_place_frame
+from ._tk import TkTreeTestCase
+
+
+def _filter_commands(commands, first_word):
+    return [command for command in commands if command[0] == first_word]
+
+
+class LayoutTestCase(TkTreeTestCase):
+    def get_paths(self) -> dict:
+        """Returns paths of widgets of children of the frame rendered by the test by their keys."""
+        frame, = self.tree.get_tk_children()
+        return {child.key: child.widget._w for child in frame.get_tk_children()}
+
+
+class PackLayoutTest(LayoutTestCase):
+    def render_labels(self, labels: list, **frame_props):
+        """Renders packed frame with labels with given keys, or (key, props) pairs."""
+        with tk_packed_frame(**frame_props):
+            for label in labels:
+                key, props = label if isinstance(label, tuple) else (label, {})
+                tk_label(text=key, key=key, **props)
+
+    def test_pack_children_in_order(self):
+        update = self.render(self.render_labels, ['a', 'c'])
+        commands = update(['a', 'b', 'c'])
+        paths = self.get_paths()
+
+        # Only the new child is packed
+        self.assertEqual([paths['b']], [command[2] for command in _filter_commands(commands, 'pack')])
+        self.assertEqual(('-after', paths['a']), _filter_commands(commands, 'pack')[0][-2:])
+
+        commands = update(['c', 'a', 'b'])
+
+        self.assertEqual([('pack', 'configure', paths['c'], '-before', paths['a'])], _filter_commands(commands, 'pack'))
+
+        commands = update(['c', 'b'])
+
+        self.assertEqual([], _filter_commands(commands, 'pack'))
+
+        commands = update(['a', 'c', 'b'])
+        paths = self.get_paths()
+
+        self.assertEqual(('-before', paths['c']), _filter_commands(commands, 'pack')[0][-2:])
+        self.assertEqual(paths['a'], _filter_commands(commands, 'pack')[0][2])
+
+    def test_repack_changed_options(self):
+        update = self.render(self.render_labels, ['a', 'b'])
+        paths = self.get_paths()
+
+        commands = update([('a', {'side': 'left', 'expand': False}), 'b'])
+
+        self.assertEqual([('pack', 'configure', paths['a'], '-side', 'left')], _filter_commands(commands, 'pack'))
+
+        commands = update([('a', {'side': 'left', 'px': 4}), 'b'])
+
+        self.assertEqual([('pack', 'configure', paths['a'], '-padx', '4')], _filter_commands(commands, 'pack'))
+
+    def test_repack_all_when_default_side_changes(self):
+        update = self.render(lambda side: self.render_labels(['a', 'b'], default_side=side), 'top')
+        paths = self.get_paths()
+
+        commands = update('left')
+
+        self.assertEqual(('pack', 'forget', paths['a'], paths['b']), _filter_commands(commands, 'pack')[0])
+        self.assertEqual(
+            [(paths['a'], 'left'), (paths['b'], 'left')],
+            [(command[2], command[4]) for command in _filter_commands(commands, 'pack')[1:]],
+        )
+
+
+class GridLayoutTest(LayoutTestCase):
+    def get_frame_path(self):
+        frame, = self.tree.get_tk_children()
+        return frame.widget._w
+
+    def test_configure_changed_rows_and_columns(self):
+        update = self.render(lambda weights: tk_grid_frame(row_weights=weights, column_min_sizes=(10,)), (1, 2))
+        frame = self.get_frame_path()
+
+        commands = update((1, 3))
+
+        self.assertEqual([('grid', 'rowconfigure', frame, '1', '-weight', '3')], _filter_commands(commands, 'grid'))
+
+        # Rows that are not configured anymore are reset
+        commands = update((1,))
+
+        self.assertEqual([('grid', 'rowconfigure', frame, '1', '-weight', '0')], _filter_commands(commands, 'grid'))
+
+        commands = update((2,))
+
+        self.assertEqual([('grid', 'rowconfigure', frame, '0', '-weight', '2')], _filter_commands(commands, 'grid'))
+
+    def test_configure_changed_child_options(self):
+        def render(position):
+            with tk_grid_frame():
+                tk_label(text='a', key='a', row=position[0], column=position[1])
+                tk_label(text='b', key='b', row=1)
+
+        update = self.render(render, (0, 0))
+        paths = self.get_paths()
+
+        commands = update((0, 1))
+
+        self.assertEqual([('grid', 'configure', paths['a'], '-column', '1')], _filter_commands(commands, 'grid'))
+
+
+class PlaceLayoutTest(LayoutTestCase):
+    def render_label(self, props: dict, **frame_props):
+        with tk_place_frame(**frame_props):
+            tk_label(text='a', key='a', **props)
+
+    def test_place_changed_options(self):
+        update = self.render(self.render_label, dict(x=0, y=0))
+        paths = self.get_paths()
+
+        commands = update(dict(x=10, y=0))
+
+        self.assertEqual([('place', 'configure', paths['a'], '-x', '10')], _filter_commands(commands, 'place'))
+
+        commands = update(dict(x=10, y=0, relwidth=0.5))
+
+        self.assertEqual([('place', 'configure', paths['a'], '-relwidth', '0.5')], _filter_commands(commands, 'place'))
+
+        # Relative coordinate replaces absolute one
+        commands = update(dict(x='50%', y=0, relwidth=0.5))
+
+        self.assertEqual(
+            [('place', 'configure', paths['a'], '-x', '0', '-relx', '0.5')],
+            _filter_commands(commands, 'place'),
+        )
+
+    def test_update_children_when_default_anchor_changes(self):
+        update = self.render(lambda anchor: self.render_label(dict(x=0), default_anchor=anchor), 'nw')
+        paths = self.get_paths()
+
+        commands = update('center')
+
+        self.assertEqual([('place', 'configure', paths['a'], '-anchor', 'center')], _filter_commands(commands, 'place'))
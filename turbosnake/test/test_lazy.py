@@ -0,0 +1,124 @@
+import threading
+
+from turbosnake import functional_component, lazy, LazyLoadError, use_state, fragment
+from turbosnake.test_helpers import TreeTestCase
+
+
+@functional_component
+def loading():
+    pass
+
+
+@functional_component
+def screen(children, title):
+    children()
+
+
+@functional_component
+def settings():
+    pass
+
+
+@functional_component
+def box(children):
+    children()
+
+
+class LazyComponentTest(TreeTestCase):
+    def test_render_fallback_until_loaded(self):
+        can_load = threading.Event()
+
+        def loader():
+            can_load.wait()
+            return screen
+
+        lazy_screen = lazy(loader, fallback=loading)
+
+        with self.tree:
+            with lazy_screen(title='Lazy'):
+                fragment(key='content')
+
+        self.tree.run_tasks()
+        self.assertEqual(1, self.root_selector().children(loading).count())
+        self.assertFalse(lazy_screen.is_loaded)
+
+        can_load.set()
+        self.assertTrue(lazy_screen.wait(5))
+        self.tree.run_tasks()
+
+        loaded = self.root_selector().children().only()
+        self.assertIs(screen.__wrapped__, loaded.__class__)
+        self.assertEqual('Lazy', loaded.props['title'])
+        self.assertEqual(1, self.root_selector().descendants(key='content').count())
+
+    def test_keep_loaded_component_mounted(self):
+        lazy_screen = lazy(lambda: screen)
+        set_title = None
+
+        @functional_component
+        def root():
+            nonlocal set_title
+            title, set_title = use_state('foo')
+            with lazy_screen(title=title):
+                pass
+
+        self.render(root)
+        lazy_screen.wait(5)
+        self.tree.run_tasks()
+
+        loaded = self.root_selector().children().children(screen).only()
+        set_title('bar')
+        self.tree.run_tasks()
+
+        self.assertIs(loaded, self.root_selector().children().children(screen).only())
+        self.assertEqual('bar', loaded.props['title'])
+
+    def test_report_load_error(self):
+        def loader():
+            raise ImportError('No module')
+
+        lazy_screen = lazy(loader, fallback=loading)
+        self.render(lazy_screen)
+        lazy_screen.wait(5)
+
+        with self.assertRaises(LazyLoadError) as cm:
+            self.tree.run_tasks()
+
+        self.assertIsInstance(cm.exception.__cause__, ImportError)
+        self.assertIsInstance(lazy_screen.error, ImportError)
+
+    def test_preload(self):
+        calls = []
+        lazy_screen = lazy(lambda: calls.append('load') or screen)
+
+        lazy_screen.preload()
+        lazy_screen.wait(5)
+        lazy_screen.preload()
+
+        self.assertEqual(['load'], calls)
+        self.assertIs(screen, lazy_screen.component)
+
+    def test_switch_between_lazy_components(self):
+        lazy_loading = lazy(lambda: loading)
+        lazy_settings = lazy(lambda: settings)
+        lazy_loading.wait(5)
+        lazy_settings.wait(5)
+        set_flag = None
+
+        @functional_component
+        def root():
+            nonlocal set_flag
+            flag, set_flag = use_state(False)
+
+            with box():
+                (lazy_settings if flag else lazy_loading)()
+
+        self.render(root)
+        self.tree.run_tasks()
+        self.assertEqual(1, self.root_selector().descendants(loading).count())
+
+        set_flag(True)
+        self.tree.run_tasks()
+
+        self.assertEqual(0, self.root_selector().descendants(loading).count())
+        self.assertEqual(1, self.root_selector().descendants(settings).count())
@@ -0,0 +1,62 @@
+from turbosnake.ttk import tk_menu, tk_menu_command
+from ._tk import TkTreeTestCase
+
+
+class TkMenuTest(TkTreeTestCase):
+    def render_menu(self, items, tearoff=0):
+        with tk_menu(label='menu', title=None, tearoff=tearoff):
+            for key, label in items:
+                tk_menu_command(key=key, label=label)
+
+    def get_menu_path(self) -> str:
+        # Menus are not tk children of their parents
+        menu, = self.tree.root.mounted_children()
+        return menu.widget._w
+
+    def test_update_entries_incrementally(self):
+        update = self.render(self.render_menu, [('a', 'A'), ('b', 'B'), ('c', 'C')])
+        path = self.get_menu_path()
+
+        commands = update([('a', 'A'), ('c', 'C')])
+
+        self.assertEqual([(path, 'delete', '1')], commands)
+
+        commands = update([('c', 'C'), ('a', 'A')])
+
+        self.assertEqual([(path, 'delete', '1'), (path, 'insert', '0')], [c[:3] for c in commands])
+
+        commands = update([('c', 'New label'), ('a', 'A')])
+
+        # Command of the entry is not re-registered
+        self.assertEqual([(path, 'entryconfigure', '0', '-label', 'New label')], commands)
+
+    def test_skip_tear_off_entry(self):
+        update = self.render(lambda items: self.render_menu(items, tearoff=1), [('a', 'A'), ('b', 'B')])
+        path = self.get_menu_path()
+
+        commands = update([('b', 'B')])
+
+        self.assertEqual([(path, 'delete', '1')], commands)
+
+    def test_toggle_tear_off_entry(self):
+        update = self.render(lambda state: self.render_menu(*state), ([('a', 'A'), ('b', 'B')], 0))
+        path = self.get_menu_path()
+
+        def summarize(commands):
+            return [c[:3] if c[1] == 'insert' else c for c in commands]
+
+        commands = update(([('a', 'A'), ('b', 'B')], 1))
+
+        # Entries are re-created after the tear-off entry
+        self.assertEqual(
+            [(path, 'configure', '-tearoff', '1'), (path, 'delete', '0', 'end'), (path, 'insert', '1'),
+             (path, 'insert', '2')],
+            summarize(commands),
+        )
+
+        commands = update(([('b', 'B')], 0))
+
+        self.assertEqual(
+            [(path, 'configure', '-tearoff', '0'), (path, 'delete', '0', 'end'), (path, 'insert', '0')],
+            summarize(commands),
+        )
@@ -0,0 +1,133 @@
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import unittest
+from os import path
+
+from turbosnake.tools import _preview_server
+from turbosnake.tools._preview_server import is_preview_server_supported
+
+_PROJECT_ROOT = path.dirname(path.dirname(path.dirname(path.abspath(__file__))))
+
+_MANAGER_SOURCE = '''
+import os
+import sys
+
+from turbosnake import Tree
+
+
+class ManualTree(Tree):
+    def schedule_task(self, callback):
+        pass
+
+    def schedule_delayed_task(self, delay, callback):
+        return lambda: None
+
+    @property
+    def event_loop(self):
+        return None
+
+
+def create_tree(**_):
+    return ManualTree()
+
+
+def render_preview_components(components):
+    pass
+
+
+def run_main_loop(tree, exit_code, **_):
+    print('preview in', os.getcwd(), 'with', os.environ['PREVIEW_TEST_VALUE'])
+    sys.exit(exit_code)
+'''
+
+_CLIENT_SOURCE = '''
+import sys
+
+from turbosnake.tools._preview_server import run_preview_on_server
+
+sys.exit(run_preview_on_server('preview_root.py', 'preview_manager', {'exit_code': 3}, socket_path=sys.argv[1]))
+'''
+
+
+@unittest.skipUnless(is_preview_server_supported(), 'preview server is not supported on this platform')
+class PreviewServerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.socket_path = path.join(self.directory, 'preview.sock')
+
+        for name, source in (('preview_manager', _MANAGER_SOURCE), ('preview_root', ''), ('client', _CLIENT_SOURCE)):
+            with open(path.join(self.directory, f'{name}.py'), 'w') as f:
+                f.write(source)
+
+        self.env = {**os.environ, 'PYTHONPATH': path.pathsep.join((self.directory, _PROJECT_ROOT))}
+
+        self.server = subprocess.Popen(
+            [sys.executable, _preview_server.__file__, self.socket_path, 'preview_manager'],
+            cwd=self.directory, env=self.env, stdin=subprocess.DEVNULL,
+        )
+        self.addCleanup(self.stop_server)
+
+        deadline = time.monotonic() + 10
+
+        while not path.exists(self.socket_path):
+            self.assertIsNone(self.server.poll(), 'Server has exited')
+            self.assertLess(time.monotonic(), deadline, 'Server has not started')
+            time.sleep(0.05)
+
+    def stop_server(self):
+        if self.server.poll() is None:
+            self.server.terminate()
+
+        self.server.wait(10)
+
+    def run_client(self, value):
+        return subprocess.run(
+            [sys.executable, 'client.py', self.socket_path],
+            cwd=self.directory, env={**self.env, 'PREVIEW_TEST_VALUE': value},
+            capture_output=True, text=True, timeout=30,
+        )
+
+    def test_run_previews(self):
+        for value in ('foo', 'bar'):
+            result = self.run_client(value)
+
+            self.assertEqual(3, result.returncode, result.stderr)
+            self.assertIn(f'preview in {self.directory} with {value}', result.stdout)
+
+        self.assertIsNone(self.server.poll())
+
+        self.server.terminate()
+        self.server.wait(10)
+
+        self.assertFalse(path.exists(self.socket_path))
+
+    def test_check_peer(self):
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as conn:
+            conn.connect(self.socket_path)
+
+            # Connections of the same user are accepted
+            _preview_server._check_peer(conn)
+
+        self.assertTrue(_preview_server._is_private_directory(path.dirname(_preview_server.get_socket_path())))
+
+    def test_keep_foreign_file_at_socket_path(self):
+        file_path = path.join(self.directory, 'not-a-socket')
+
+        with open(file_path, 'w') as f:
+            f.write('data')
+
+        result = subprocess.run(
+            [sys.executable, _preview_server.__file__, file_path, 'preview_manager'],
+            cwd=self.directory, env=self.env, stdin=subprocess.DEVNULL, capture_output=True, timeout=30,
+        )
+
+        self.assertNotEqual(0, result.returncode)
+
+        with open(file_path) as f:
+            self.assertEqual('data', f.read())
@@ -0,0 +1,156 @@
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+from os import path
+from typing import Optional
+
+from turbosnake.tools._file_watcher import MtimeFileWatcher, InotifyFileWatcher
+from turbosnake.tools._preview_worker import ModuleTracker
+
+
+class FileWatcherTestMixin:
+    def create_watcher(self):
+        raise NotImplementedError()
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.watcher = self.create_watcher()
+        self.addCleanup(self.watcher.close)
+
+    def write(self, name, text, mtime=None):
+        file_path = path.join(self.directory, name)
+
+        with open(file_path, 'w') as f:
+            f.write(text)
+
+        if mtime is not None:
+            os.utime(file_path, (mtime, mtime))
+
+        return file_path
+
+    def test_report_changed_files(self):
+        foo = self.write('foo.py', 'foo', mtime=1000)
+        bar = self.write('bar.py', 'bar', mtime=1000)
+        self.watcher.watch_all([foo, bar])
+
+        self.assertEqual(set(), self.watcher.poll())
+
+        self.write('foo.py', 'foo 2', mtime=2000)
+
+        self.assertEqual({foo}, self.watcher.poll())
+        self.assertEqual(set(), self.watcher.poll())
+
+        os.unlink(bar)
+
+        self.assertEqual({bar}, self.watcher.poll())
+
+    def test_ignore_not_watched_files(self):
+        foo = self.write('foo.py', 'foo', mtime=1000)
+        self.watcher.watch(foo)
+
+        self.write('bar.py', 'bar', mtime=2000)
+
+        self.assertEqual(set(), self.watcher.poll())
+
+
+class MtimeFileWatcherTest(FileWatcherTestMixin, unittest.TestCase):
+    def create_watcher(self):
+        return MtimeFileWatcher()
+
+
+@unittest.skipUnless(sys.platform.startswith('linux'), 'inotify is available on Linux only')
+class InotifyFileWatcherTest(FileWatcherTestMixin, unittest.TestCase):
+    def create_watcher(self):
+        return InotifyFileWatcher()
+
+
+class ModuleTrackerTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+        self.package = f'tracker_test_{id(self)}'
+        os.mkdir(path.join(self.directory, self.package))
+        self.mtime = 1000
+
+        sys.path.insert(0, self.directory)
+        self.addCleanup(sys.path.remove, self.directory)
+        self.addCleanup(self.forget_modules)
+
+        self.write('__init__', '')
+        # root imports middle, middle imports leaf, other is not imported
+        self.write('leaf', 'value = 1\n')
+        self.write('middle', 'from . import leaf\n')
+        self.write('root', 'from . import middle\n')
+        self.write('other', '')
+
+        __import__(f'{self.package}.root')
+        self.tracker = ModuleTracker(sys.modules[f'{self.package}.root'], MtimeFileWatcher())
+
+    def forget_modules(self):
+        for name in list(sys.modules):
+            if name.startswith(self.package):
+                del sys.modules[name]
+
+    def write(self, name, source):
+        file_path = path.join(self.directory, self.package, f'{name}.py')
+
+        with open(file_path, 'w') as f:
+            f.write(source)
+
+        # Modification time must change even if the file is written twice in a second
+        self.mtime += 10
+        os.utime(file_path, (self.mtime, self.mtime))
+
+    def reload(self) -> tuple[list[str], Optional[Exception]]:
+        """Reloads changed modules, returns names of modules that were (tried to be) reloaded and reload error."""
+        # Changes are reported by the second check, when no more changes are detected
+        self.assertFalse(self.tracker.has_changes())
+        self.assertTrue(self.tracker.has_changes())
+
+        output = io.StringIO()
+        error = None
+
+        with contextlib.redirect_stdout(output):
+            try:
+                self.tracker.reload()
+            except Exception as e:
+                error = e
+
+        return [line.split()[-1][len(self.package) + 1:] for line in output.getvalue().splitlines()], error
+
+    def test_reload_changed_module_and_dependents_in_order(self):
+        self.write('leaf', 'value = 2\n')
+
+        self.assertEqual((['leaf', 'middle', 'root'], None), self.reload())
+        self.assertEqual(2, sys.modules[f'{self.package}.leaf'].value)
+        self.assertFalse(self.tracker.has_changes())
+
+    def test_reload_only_dependents(self):
+        self.write('middle', 'from . import leaf\nvalue = 2\n')
+
+        self.assertEqual((['middle', 'root'], None), self.reload())
+
+    def test_keep_modules_queued_after_failed_reload(self):
+        self.write('leaf', 'value = 2\n')
+        self.write('middle', 'raise RuntimeError("broken")\n')
+
+        reloaded, error = self.reload()
+        self.assertEqual(['leaf', 'middle'], reloaded)
+        self.assertIsInstance(error, RuntimeError)
+
+        # The failed module is reloaded again after a change in another module
+        self.write('root', 'from . import middle\nvalue = 2\n')
+
+        reloaded, error = self.reload()
+        self.assertEqual(['middle'], reloaded)
+        self.assertIsInstance(error, RuntimeError)
+
+        self.write('middle', 'from . import leaf\n')
+
+        self.assertEqual((['middle', 'root'], None), self.reload())
+        self.assertEqual(2, sys.modules[f'{self.package}.root'].value)
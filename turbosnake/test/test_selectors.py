@@ -1,4 +1,4 @@
-from turbosnake import fragment, functional_component
+from turbosnake import fragment, functional_component, ComponentIndex, use_state
 from turbosnake.test_helpers import TreeTestCase
 
 
@@ -174,3 +174,60 @@ class SelectorsTest(TreeTestCase):
             # Note: `children()` inserts a fragment, so `tc{x='1'}` is not a direct parent of `fragment{x='2'}`
             self.root_selector().descendants(fragment, props=dict(x='2')).parents().parents().only()
         )
+
+    def test_select_in_document_order(self):
+        with self.tree:
+            with fragment(key='root'):
+                with fragment(key='a', x=1):
+                    fragment(key='b', x=1)
+                fragment(key='c', x=1)
+
+        self.tree.run_tasks()
+
+        self.assertEqual(
+            ['a', 'b', 'c'],
+            [c.key for c in self.root_selector().descendants(props=dict(x=1))]
+        )
+
+    def test_select_by_key(self):
+        with self.tree:
+            with fragment(key='root'):
+                with fragment(key='a'):
+                    fragment(key='b')
+                fragment(key='b')
+
+        self.tree.run_tasks()
+
+        self.assertEqual(2, self.root_selector().descendants(key='b').count())
+        self.assertEqual(1, self.root_selector().descendants(key='a').descendants(key='b').count())
+
+
+class IndexedSelectorsTest(SelectorsTest):
+    def setUp(self):
+        super().setUp()
+        ComponentIndex(self.tree, props=('x',))
+
+    def test_maintain_index(self):
+        set_items = None
+
+        @functional_component
+        def tc():
+            nonlocal set_items
+            items, set_items = use_state([('a', 1), ('b', 2)])
+
+            for key, x in items:
+                fragment(key=key, x=x)
+
+        with self.tree:
+            tc()
+        self.tree.run_tasks()
+
+        self.assertEqual(['a'], [c.key for c in self.root_selector().descendants(props=dict(x=1))])
+
+        set_items([('b', 1), ('c', [1])])
+        self.tree.run_tasks()
+
+        self.assertEqual(['b'], [c.key for c in self.root_selector().descendants(props=dict(x=1))])
+        self.assertEqual(['c'], [c.key for c in self.root_selector().descendants(props=dict(x=[1]))])
+        self.assertEqual(0, self.root_selector().descendants(key='a').count())
+        self.assertEqual(3, len(self.tree.component_index))
@@ -0,0 +1,89 @@
+from collections import defaultdict
+
+from snapshottest.formatter import Formatter
+
+from turbosnake import fragment, functional_component
+from turbosnake.test_helpers import TreeTestCase
+from turbosnake.test_helpers._snapshot import ComponentSnapshot, write_snapshot, find_snapshot_difference
+
+
+@functional_component
+def item(children, label, **_):
+    children()
+
+
+class SnapshotSerializerTest(TreeTestCase):
+    def render_items(self, labels):
+        with self.tree:
+            with fragment():
+                for i, label in enumerate(labels):
+                    with item(label=label, index=(i,), data={'a': [1, 2.5, None]}):
+                        fragment(key='leaf')
+
+        self.tree.run_tasks()
+
+    @staticmethod
+    def formatter():
+        return Formatter(defaultdict(set))
+
+    def test_same_text_as_snapshottest(self):
+        self.render_items(['foo', 'bar'])
+        formatter = self.formatter()
+
+        self.assertEqual(
+            formatter.format(formatter.normalize(self.tree.root), 0),
+            write_snapshot(ComponentSnapshot(self.tree.root), self.formatter()),
+        )
+
+    def test_find_first_difference(self):
+        self.render_items(['foo', 'bar'])
+        formatter = self.formatter()
+        expected = formatter.normalize(self.tree.root)
+
+        self.assertIsNone(find_snapshot_difference(ComponentSnapshot(self.tree.root), expected, formatter))
+
+        self.render_items(['foo', 'baz'])
+
+        self.assertEqual(
+            "root.children[1].props['label']",
+            find_snapshot_difference(ComponentSnapshot(self.tree.root), expected, formatter)
+        )
+
+        self.render_items(['foo'])
+
+        self.assertEqual(
+            "root.children[1]",
+            find_snapshot_difference(ComponentSnapshot(self.tree.root), expected, formatter)
+        )
+
+    def test_filters(self):
+        self.render_items(['foo'])
+        formatter = self.formatter()
+
+        snapshot = ComponentSnapshot(self.tree.root, max_depth=1, prop_filter=lambda name: name == 'label')
+        normalized = formatter.normalize(snapshot)
+
+        self.assertEqual({}, normalized['props'])
+
+        child = normalized['children'][0]
+        self.assertEqual({'label': 'foo'}, child['props'])
+        self.assertEqual('<1 components>', child['children'])
+
+        self.assertEqual(formatter.format(normalized, 0), write_snapshot(snapshot, self.formatter()))
+        self.assertIsNone(find_snapshot_difference(snapshot, normalized, formatter))
+
+    def test_limit_depth_of_components_in_props(self):
+        self.render_items(['foo', 'bar'])
+        formatter = self.formatter()
+
+        snapshot = ComponentSnapshot(self.tree.root, max_depth=1)
+        normalized = formatter.normalize(snapshot)
+
+        # Children of the root fragment are in it's props as well as in it's mounted children
+        item_in_props = normalized['props']['children']['items'][0]
+        self.assertEqual('foo', item_in_props['props']['label'])
+        self.assertEqual('<1 components>', item_in_props['props']['children'])
+        self.assertEqual('<1 components>', item_in_props['children'])
+
+        self.assertEqual(formatter.format(normalized, 0), write_snapshot(snapshot, self.formatter()))
+        self.assertIsNone(find_snapshot_difference(snapshot, normalized, formatter))
@@ -0,0 +1,106 @@
+import unittest
+
+from turbosnake.ttk import style, tk_button
+from turbosnake.ttk._style import StyleBuilder, collect_unused_styles
+from ._tk import TkTreeTestCase
+
+
+class StyleBuilderTest(unittest.TestCase):
+    def test_freeze(self):
+        builder1 = StyleBuilder('TButton')
+        builder1['foreground'] = 'red'
+        builder1['background'] = 'blue'
+        builder1[('foreground', 'active')] = 'green'
+
+        builder2 = StyleBuilder('TButton')
+        builder2[('foreground', 'active')] = 'green'
+        builder2['background'] = 'blue'
+        builder2['foreground'] = 'red'
+
+        self.assertEqual(builder1.freeze(), builder2.freeze())
+
+        builder2['foreground'] = 'blue'
+
+        self.assertNotEqual(builder1.freeze(), builder2.freeze())
+        self.assertNotEqual(StyleBuilder('TButton').freeze(), StyleBuilder('TLabel').freeze())
+
+
+class StyleDependenciesTest(unittest.TestCase):
+    def test_infer_dependencies_from_parameters(self):
+        @style
+        def colored(s, color='red', **_):
+            s['foreground'] = color
+
+        self.assertEqual(('color',), colored.dependencies)
+
+        @colored.extend
+        def sized(s, size, **_):
+            s['padding'] = size
+
+        self.assertEqual(('color', 'size'), sized.dependencies)
+
+    def test_depend_on_all_props(self):
+        @style
+        def any_prop(s, **props):
+            pass
+
+        self.assertIsNone(any_prop.dependencies)
+        self.assertIsNone(style(any_prop, lambda s, color: None).dependencies)
+
+    def test_explicit_dependencies(self):
+        @style(depends_on=('b', 'a'))
+        def any_prop(s, **props):
+            pass
+
+        self.assertEqual(('a', 'b'), any_prop.dependencies)
+
+
+class DynamicStyleTest(TkTreeTestCase):
+    def setUp(self):
+        super().setUp()
+        self.calls = []
+
+        @style
+        def colored(s, color, **_):
+            self.calls.append(color)
+            s['foreground'] = color
+
+        self.colored = colored
+
+    def render_buttons(self, colors):
+        for i, color in enumerate(colors):
+            tk_button(key=i, text=str(i), style=self.colored, color=color)
+
+    def get_style_names(self) -> list[str]:
+        return [str(button.widget.cget('style')) for button in self.tree.get_tk_children()]
+
+    def test_share_styles_with_same_content(self):
+        update = self.render(self.render_buttons, ('red', 'red', 'blue'))
+        red, red2, blue = self.get_style_names()
+
+        self.assertEqual(red, red2)
+        self.assertNotEqual(red, blue)
+        self.assertEqual({red, blue}, set(self.colored.get_style_names(self.tree.style_db)))
+
+        update(('blue',))
+        collect_unused_styles()
+
+        self.assertEqual([blue], self.colored.get_style_names(self.tree.style_db))
+
+        # Names of cleared styles are reused
+        update(('blue', 'green'))
+
+        self.assertEqual([blue, red], self.get_style_names())
+
+    def test_recompute_when_dependencies_change(self):
+        update = self.render(lambda props: tk_button(style=self.colored, **props), dict(text='a', color='red'))
+
+        self.assertEqual(['red'], self.calls)
+
+        update(dict(text='b', color='red'))
+
+        self.assertEqual(['red'], self.calls)
+
+        update(dict(text='b', color='blue'))
+
+        self.assertEqual(['red', 'blue'], self.calls)
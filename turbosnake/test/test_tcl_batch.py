@@ -0,0 +1,99 @@
+import tkinter as tk
+import unittest
+from tkinter import ttk
+
+from turbosnake import functional_component, use_state
+from turbosnake.ttk import TkTree, tk_label
+from turbosnake.ttk._batch import TclCommandBatch
+from ._tk import create_tk_root
+
+
+class TclCommandBatchTest(unittest.TestCase):
+    def setUp(self):
+        # A bare Tcl interpreter, no display is needed
+        self.tcl = tk.Tcl()
+        self.batch = TclCommandBatch(self.tcl.tk)
+
+    def get(self, name):
+        return str(self.tcl.tk.call('set', name))
+
+    def test_evaluate_on_flush(self):
+        self.batch.add('set', 'a', 1)
+        self.batch.add('append', 'a', 2)
+
+        self.assertEqual('0', str(self.tcl.tk.call('info', 'exists', 'a')))
+
+        self.batch.flush()
+
+        self.assertEqual('12', self.get('a'))
+
+    def test_call_evaluates_pending_commands_first(self):
+        self.batch.add('set', 'a', 'foo bar')
+
+        self.assertEqual('foo bar', str(self.batch.call('set', 'a')))
+
+    def test_continue_after_failed_command(self):
+        self.batch.add('set', 'a', 'multi\nline')
+        self.batch.add('error', 'first failure')
+        self.batch.add('set', 'b', 2)
+        self.batch.add('no_such_command', 'multi\nline')
+        self.batch.add('set', 'c', 3)
+
+        with self.assertRaisesRegex(tk.TclError, 'first failure'):
+            self.batch.flush()
+
+        self.assertEqual(('multi\nline', '2', '3'), (self.get('a'), self.get('b'), self.get('c')))
+
+        # Failed commands are not evaluated again
+        self.batch.flush()
+
+    def test_disabled_batch(self):
+        batch = TclCommandBatch(self.tcl.tk, enabled=False)
+        batch.add('set', 'a', 1)
+
+        self.assertEqual('1', self.get('a'))
+
+
+class TkTreeBatchTest(unittest.TestCase):
+    def setUp(self):
+        self.root = create_tk_root()
+        self.addCleanup(self.root.destroy)
+
+        errors = self.errors = []
+
+        class RecordingTkTree(TkTree):
+            def handle_error(self, error, queue_name, task):
+                errors.append(error)
+
+        self.tree = RecordingTkTree(widget=self.root)
+
+    def test_clean_up_destroyed_widgets_after_failed_command(self):
+        set_shown = None
+
+        @functional_component
+        def app():
+            nonlocal set_shown
+            shown, set_shown = use_state(True)
+
+            if shown:
+                tk_label(text='foo')
+
+        with self.tree:
+            app()
+
+        self.root.update()
+        self.assertEqual(1, len(self.root.children))
+
+        self.tree.tcl_batch.add('error', 'failed command')
+        set_shown(False)
+        self.root.update()
+
+        self.assertEqual(['failed command'], [str(e) for e in self.errors])
+        self.assertEqual({}, self.root.children)
+        self.assertEqual([], self.root.winfo_children())
+
+    def test_flush_before_direct_access(self):
+        entry = ttk.Entry(self.root)
+        self.tree.tcl_batch.add(entry._w, 'insert', 0, 'foo')
+
+        self.assertEqual('foo', self.tree.tcl_batch.call(entry._w, 'get'))
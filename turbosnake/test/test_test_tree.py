@@ -0,0 +1,131 @@
+import asyncio
+import unittest
+
+from turbosnake import functional_component, use_async_call, use_effect, fragment
+from turbosnake.test_helpers import TreeTestCase, VirtualTimeEventLoop
+
+
+class TestTreeTest(TreeTestCase):
+    def test_delayed_tasks_in_order(self):
+        calls = []
+
+        self.tree.schedule_delayed_task(20, lambda: calls.append(('b', self.tree.now())))
+        self.tree.schedule_delayed_task(10, lambda: calls.append(('a', self.tree.now())))
+        cancel = self.tree.schedule_delayed_task(15, lambda: calls.append(('cancelled', self.tree.now())))
+        cancel()
+
+        self.tree.advance_time(15)
+        self.assertEqual([('a', 10)], calls)
+        self.assertEqual(15, self.tree.now())
+
+        self.tree.advance_time(5)
+        self.assertEqual([('a', 10), ('b', 20)], calls)
+        self.assertEqual(0, self.tree.pending_delayed_tasks)
+
+    def test_tasks_of_delayed_task_run_before_time_advances(self):
+        calls = []
+
+        def first():
+            calls.append('first')
+            self.tree.schedule_task(lambda: calls.append('enqueued by first'))
+
+        self.tree.schedule_delayed_task(10, first)
+        self.tree.schedule_delayed_task(11, lambda: calls.append('second'))
+
+        self.tree.advance_time(11)
+
+        self.assertEqual(['first', 'enqueued by first', 'second'], calls)
+
+    def test_event_loop_timers(self):
+        calls = []
+
+        async def sleeper(name, delay):
+            await asyncio.sleep(delay)
+            calls.append((name, self.tree.now()))
+
+        loop = self.tree.event_loop
+        loop.create_task(sleeper('slow', 0.05))
+        loop.create_task(sleeper('fast', 0.02))
+        self.tree.schedule_delayed_task(30, lambda: calls.append(('delayed', self.tree.now())))
+
+        self.tree.run_tasks()
+        self.assertEqual([], calls)
+
+        self.tree.advance_time(100)
+        self.assertEqual([('fast', 20), ('delayed', 30), ('slow', 50)], calls)
+
+    def test_use_async_call(self):
+        rendered = []
+
+        @functional_component
+        def loader():
+            @use_async_call
+            async def load():
+                await asyncio.sleep(1)
+                return 'loaded'
+
+            @use_effect
+            def start():
+                load()
+
+            rendered.append(load.future.result() if load.is_done else None)
+
+        self.render(loader)
+        self.assertEqual(None, rendered[-1])
+
+        self.tree.advance_time(999)
+        self.assertEqual(None, rendered[-1])
+
+        self.tree.advance_time(1)
+        self.assertEqual('loaded', rendered[-1])
+
+        self.render(fragment)
+
+
+class VirtualTimeEventLoopTest(unittest.TestCase):
+    def setUp(self):
+        self.time = 0
+        self.loop = VirtualTimeEventLoop(lambda: self.time)
+        self.addCleanup(self.loop.close)
+
+    def test_track_callbacks(self):
+        calls = []
+        loop = self.loop
+
+        self.assertFalse(loop.has_ready_callbacks)
+
+        loop.call_soon(lambda: loop.call_soon(calls.append, 'second'))
+        loop.call_soon(calls.append, 'cancelled').cancel()
+        loop.call_soon_threadsafe(calls.append, 'first')
+
+        self.assertTrue(loop.has_ready_callbacks)
+        self.assertEqual(2, loop.run_once())
+        self.assertEqual(['first'], calls)
+
+        self.assertTrue(loop.has_ready_callbacks)
+        self.assertEqual(1, loop.run_once())
+        self.assertEqual(['first', 'second'], calls)
+        self.assertFalse(loop.has_ready_callbacks)
+
+    def test_track_timers(self):
+        calls = []
+        loop = self.loop
+
+        loop.call_later(0.02, calls.append, 'late')
+        loop.call_later(0.01, calls.append, 'early')
+        loop.call_later(0.005, calls.append, 'cancelled').cancel()
+
+        self.assertEqual(10, loop.next_timer_time)
+        self.assertFalse(loop.has_ready_callbacks)
+
+        self.time = 10
+        self.assertTrue(loop.has_ready_callbacks)
+        self.assertEqual(1, loop.run_once())
+        self.assertEqual(['early'], calls)
+        self.assertEqual(20, loop.next_timer_time)
+
+        self.time = 20
+        self.assertEqual(1, loop.run_once())
+        self.assertEqual(['early', 'late'], calls)
+        self.assertIsNone(loop.next_timer_time)
+        self.assertFalse(loop.has_ready_callbacks)
@@ -0,0 +1,73 @@
+from turbosnake import fragment, Component, functional_component, use_state
+from turbosnake.test_helpers import TreeTestCase
+from turbosnake.ttk._core import TkChildrenIndex
+
+
+class TkChildrenIndexTest(TreeTestCase):
+    def render_keys(self, keys):
+        set_keys = None
+
+        @functional_component
+        def app():
+            nonlocal set_keys
+            current_keys, set_keys = use_state(keys)
+
+            for key in current_keys:
+                # Children are not direct children of the index owner, like tk children wrapped in other components
+                with fragment(key=key):
+                    Component().insert()
+
+        self.render(app)
+
+        def update(new_keys):
+            set_keys(new_keys)
+            self.tree.run_tasks()
+
+        return update
+
+    def get_leaves(self) -> dict:
+        return {
+            wrapper.key: next(iter(wrapper.mounted_children()))
+            for wrapper in self.tree.root.mounted_children()
+        }
+
+    def test_iterate_in_document_order(self):
+        update = self.render_keys(['a', 'b', 'c'])
+        leaves = self.get_leaves()
+        index = TkChildrenIndex(self.tree.root)
+
+        for key in 'cab':
+            index.add(leaves[key])
+
+        self.assertEqual([leaves[k] for k in 'abc'], list(index))
+
+        update(['c', 'a', 'b'])
+        index.invalidate_order()
+
+        self.assertEqual([leaves[k] for k in 'cab'], list(index))
+
+        index.remove(leaves['a'])
+
+        self.assertEqual([leaves[k] for k in 'cb'], list(index))
+        self.assertEqual(2, len(index))
+
+        update(['c', 'd', 'b'])
+        index.add(self.get_leaves()['d'])
+
+        self.assertEqual([self.get_leaves()[k] for k in 'cdb'], list(index))
+
+    def test_forget_removed_children(self):
+        self.render_keys(['a', 'b'])
+        leaves = self.get_leaves()
+        index = TkChildrenIndex(self.tree.root)
+        index.add(leaves['a'])
+        index.add(leaves['b'])
+        list(index)
+
+        index.remove(leaves['a'])
+        index.remove(leaves['b'])
+        # Removing a component that is not a member is a no-op
+        index.remove(leaves['b'])
+
+        self.assertEqual([], list(index))
+        self.assertEqual(0, len(index))
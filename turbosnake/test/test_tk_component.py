@@ -0,0 +1,36 @@
+import tkinter as tk
+import unittest
+
+from turbosnake.ttk import tk_button
+from turbosnake.ttk._core import get_option_default
+from ._tk import TkTreeTestCase, create_tk_root
+
+
+class OptionDefaultTest(unittest.TestCase):
+    def test_resolve_alias(self):
+        root = create_tk_root()
+        self.addCleanup(root.destroy)
+        frame = tk.Frame(root)
+
+        self.assertEqual(get_option_default(frame, 'borderwidth'), get_option_default(frame, 'bd'))
+        self.assertEqual(get_option_default(frame, 'background'), get_option_default(frame, 'bg'))
+
+
+class ConfigureWidgetTest(TkTreeTestCase):
+    def test_send_changed_options_only(self):
+        update = self.render(lambda props: tk_button(**props), dict(text='a'))
+        button, = self.tree.get_tk_children()
+        path = button.widget._w
+
+        commands = update(dict(text='b'))
+
+        self.assertEqual([(path, 'configure', '-text', 'b')], commands)
+
+        commands = update(dict(text='b', disabled=True))
+
+        self.assertEqual([(path, 'configure', '-state', 'disabled')], commands)
+
+        # Props that don't affect widget configuration don't send anything
+        commands = update(dict(text='b', disabled=True, on_click=print))
+
+        self.assertEqual([], commands)
@@ -0,0 +1,43 @@
+from turbosnake.ttk import tk_packed_frame, tk_label, tk_button
+from ._tk import TkTreeTestCase
+
+
+class SubtreeTeardownTest(TkTreeTestCase):
+    tree_options = dict(widget_pool_limit=4)
+
+    def render_frames(self, shown, show_label=True):
+        if shown:
+            with tk_packed_frame():
+                if show_label:
+                    tk_label(text='label')
+
+                with tk_packed_frame(key='nested'):
+                    tk_button(text='button')
+
+    def test_destroy_subtree_with_single_command(self):
+        update = self.render(self.render_frames, True)
+        frame, = self.tree.get_tk_children()
+        frame_widget = frame.widget
+        _, nested_frame = frame.get_tk_children()
+        nested_widget = nested_frame.widget
+
+        commands = update(False)
+
+        self.assertEqual([('destroy', frame_widget._w)], commands)
+        # Widgets of descendants are destroyed with the frame instead of being parked
+        self.assertEqual(0, len(self.tree.widget_pool))
+        self.assertEqual({}, self.root.children)
+        self.assertEqual({}, nested_widget.children)
+
+    def test_park_removed_child(self):
+        update = self.render(lambda show_label: self.render_frames(True, show_label), True)
+        frame, = self.tree.get_tk_children()
+        label, _ = frame.get_tk_children()
+        label_path = label.widget._w
+
+        commands = update(False)
+
+        # Only the removed child is handled
+        self.assertEqual(1, len(self.tree.widget_pool))
+        self.assertIn(('pack', 'forget', label_path), commands)
+        self.assertEqual([], [c for c in commands if c[0] == 'destroy'])
@@ -0,0 +1,173 @@
+import unittest
+
+from turbosnake.ttk import tk_button
+from turbosnake.ttk._pool import WidgetPool
+from ._tk import TkTreeTestCase
+
+
+class BlankWidgetComponent:
+    created = 0
+
+    @classmethod
+    def create_blank_widget(cls, tk_parent):
+        cls.created += 1
+        return object()
+
+
+class OtherComponent:
+    pass
+
+
+class WidgetPoolTest(unittest.TestCase):
+    def setUp(self):
+        self.pool = WidgetPool(limit=2)
+        self.parent = object()
+        self.reset_widgets = []
+
+    def park(self, widget, component_class=BlankWidgetComponent, parent=None):
+        return self.pool.park(component_class, parent or self.parent, widget, self.reset_widgets.append)
+
+    def test_take_parked_widget(self):
+        widget = object()
+
+        self.assertTrue(self.park(widget))
+        self.assertEqual([widget], self.reset_widgets)
+        self.assertEqual(1, len(self.pool))
+
+        self.assertIsNone(self.pool.take(OtherComponent, self.parent))
+        self.assertIsNone(self.pool.take(BlankWidgetComponent, object()))
+        self.assertIs(widget, self.pool.take(BlankWidgetComponent, self.parent))
+        self.assertIsNone(self.pool.take(BlankWidgetComponent, self.parent))
+        self.assertEqual(0, len(self.pool))
+
+    def test_limit(self):
+        widgets = [object() for _ in range(3)]
+
+        self.assertEqual([True, True, False], [self.park(w) for w in widgets])
+        # Widget that is going to be destroyed is not reset
+        self.assertEqual(widgets[:2], self.reset_widgets)
+
+        # The limit is per component class and parent
+        self.assertTrue(self.park(object(), OtherComponent))
+        self.assertTrue(self.park(object(), parent=object()))
+        self.assertEqual(4, len(self.pool))
+
+    def test_total_limit(self):
+        destroyed = []
+        self.pool = WidgetPool(limit=2, total_limit=3, destroy=destroyed.append)
+        widgets = [object() for _ in range(4)]
+
+        self.assertTrue(self.park(widgets[0]))
+        self.assertTrue(self.park(widgets[1], OtherComponent))
+        self.assertTrue(self.park(widgets[2], parent=object()))
+        self.assertTrue(self.park(widgets[3]))
+
+        # The widget parked earliest is evicted
+        self.assertEqual([widgets[0]], destroyed)
+        self.assertEqual(3, len(self.pool))
+        self.assertIs(widgets[3], self.pool.take(BlankWidgetComponent, self.parent))
+        self.assertIsNone(self.pool.take(BlankWidgetComponent, self.parent))
+
+        # Taken widgets are not evicted
+        self.assertTrue(self.park(object()))
+        self.assertTrue(self.park(object()))
+        self.assertEqual([widgets[0], widgets[1]], destroyed)
+
+    def test_zero_limit(self):
+        self.pool.limit = 0
+
+        self.assertFalse(self.park(object()))
+        self.assertEqual([], self.reset_widgets)
+
+    def test_discard_parent(self):
+        self.park(object())
+        self.park(object(), OtherComponent)
+        self.park(object(), parent=object())
+
+        self.pool.discard_parent(self.parent)
+
+        self.assertEqual(1, len(self.pool))
+        self.assertIsNone(self.pool.take(BlankWidgetComponent, self.parent))
+
+    def test_prewarm(self):
+        scheduled = []
+        BlankWidgetComponent.created = 0
+        self.pool.limit = 5
+
+        self.pool.prewarm(BlankWidgetComponent, self.parent, 10, scheduled.append, chunk_size=2)
+
+        self.assertEqual(0, len(self.pool))
+
+        while scheduled:
+            scheduled.pop(0)()
+
+        self.assertEqual(5, BlankWidgetComponent.created)
+        self.assertEqual(5, len(self.pool))
+
+    def test_prewarm_up_to_total_limit(self):
+        scheduled = []
+        BlankWidgetComponent.created = 0
+        self.pool.total_limit = 3
+        self.park(object(), OtherComponent)
+
+        self.pool.prewarm(BlankWidgetComponent, self.parent, 2, scheduled.append, chunk_size=1)
+
+        while scheduled:
+            scheduled.pop(0)()
+
+        self.assertEqual(2, BlankWidgetComponent.created)
+
+        self.pool.prewarm(BlankWidgetComponent, object(), 2, scheduled.append)
+
+        while scheduled:
+            scheduled.pop(0)()
+
+        # Pre-warming doesn't evict parked widgets
+        self.assertEqual(2, BlankWidgetComponent.created)
+        self.assertEqual(3, len(self.pool))
+
+    def test_stop_prewarm_when_parent_is_discarded(self):
+        scheduled = []
+        BlankWidgetComponent.created = 0
+
+        self.pool.prewarm(BlankWidgetComponent, self.parent, 2, scheduled.append, chunk_size=1)
+        scheduled.pop(0)()
+        self.pool.discard_parent(self.parent)
+        scheduled.pop(0)()
+
+        self.assertEqual(1, BlankWidgetComponent.created)
+        self.assertEqual([], scheduled)
+        self.assertEqual(0, len(self.pool))
+
+
+class WidgetReuseTest(TkTreeTestCase):
+    tree_options = dict(widget_pool_limit=1)
+
+    def render_button(self, props):
+        if props is not None:
+            tk_button(**props)
+
+    def get_button(self):
+        button, = self.tree.get_tk_children()
+        return button.widget
+
+    def test_reset_options_of_previous_owner(self):
+        update = self.render(self.render_button, dict(text='first', cursor='hand2', style='Toolbutton'))
+        widget = self.get_button()
+
+        update(None)
+        self.assertEqual(1, len(self.tree.widget_pool))
+
+        update(dict(text='second'))
+
+        self.assertIs(widget, self.get_button())
+        self.assertEqual('second', str(widget.cget('text')))
+        self.assertEqual('', str(widget.cget('cursor')))
+        self.assertEqual('', str(widget.cget('style')))
+
+    def test_reset_option_changed_to_none(self):
+        update = self.render(self.render_button, dict(text='button', cursor='hand2'))
+
+        update(dict(text='button', cursor=None))
+
+        self.assertEqual('', str(self.get_button().cget('cursor')))
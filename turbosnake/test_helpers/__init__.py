@@ -1 +1,3 @@
 from ._test_helpers import TreeTestCase, TestTree
+from ._selectors import Selector
+from ._event_loop import VirtualTimeEventLoop
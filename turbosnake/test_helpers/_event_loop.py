@@ -0,0 +1,104 @@
+import asyncio
+from typing import Callable, Optional
+
+"""
+_event_loop.py
+
+Contains asyncio event loop driven by tests, running in virtual time.
+"""
+
+
+class _NoIOSelector:
+    # The loop never waits for I/O, it is driven by `run_once` calls
+    def select(self, timeout=None):
+        return []
+
+
+class VirtualTimeEventLoop(asyncio.BaseEventLoop):
+    """asyncio event loop that runs only when asked to and takes time from given clock function.
+
+    The loop doesn't support I/O, only callbacks, timers, tasks and futures.
+    It never blocks waiting for timers - they are executed by `run_once` as soon as the clock reaches their time.
+
+    The loop keeps track of handles it has scheduled by itself, instead of inspecting internal queues of
+    `asyncio.BaseEventLoop`.
+
+    :param clock: function returning current time in milliseconds
+    """
+
+    def __init__(self, clock: Callable[[], float]):
+        super().__init__()
+        self.__clock = clock
+        self._selector = _NoIOSelector()
+        # Handles of callbacks scheduled by `call_soon` that will be executed by the next `run_once`
+        self.__ready: list[asyncio.Handle] = []
+        # Handles of timers that have not been executed yet, in order they were scheduled
+        self.__timers: dict[asyncio.TimerHandle, None] = {}
+
+    def time(self):
+        return self.__clock() / 1000
+
+    def _process_events(self, event_list):
+        pass
+
+    def _write_to_self(self):
+        pass
+
+    def call_soon(self, callback, *args, context=None):
+        handle = super().call_soon(callback, *args, context=context)
+        self.__ready.append(handle)
+        return handle
+
+    def call_soon_threadsafe(self, callback, *args, context=None):
+        handle = super().call_soon_threadsafe(callback, *args, context=context)
+        self.__ready.append(handle)
+        return handle
+
+    def call_at(self, when, callback, *args, context=None):
+        def run_timer():
+            self.__timers.pop(handle, None)
+            callback(*args)
+
+        handle = super().call_at(when, run_timer, context=context)
+        self.__timers[handle] = None
+        return handle
+
+    def __count_ready(self) -> int:
+        now = self.__clock()
+
+        return sum(1 for handle in self.__ready if not handle.cancelled()) + sum(
+            1 for handle in self.__timers if not handle.cancelled() and handle.when() * 1000 <= now
+        )
+
+    @property
+    def has_ready_callbacks(self) -> bool:
+        """`True` iff some callbacks are ready to be executed by `run_once`."""
+        return self.__count_ready() > 0
+
+    @property
+    def next_timer_time(self) -> Optional[float]:
+        """Time (in milliseconds of the clock) of the earliest scheduled timer or `None` if there are no timers."""
+        timers = self.__timers
+
+        for handle in [handle for handle in timers if handle.cancelled()]:
+            del timers[handle]
+
+        when = min((handle.when() for handle in timers), default=None)
+
+        return None if when is None else when * 1000
+
+    def run_once(self) -> int:
+        """Executes callbacks that are ready at current time, including due timers.
+
+        Callbacks scheduled by executed callbacks are not executed.
+
+        :returns: number of executed callbacks
+        """
+        n_ready = self.__count_ready()
+        # All callbacks ready now are executed, callbacks scheduled by them are tracked for the next run
+        self.__ready = []
+
+        super().call_soon(self.stop)
+        self.run_forever()
+
+        return n_ready
@@ -0,0 +1,355 @@
+from collections import defaultdict
+from typing import Optional, Callable
+
+from snapshottest.formatter import Formatter
+from snapshottest.formatters import BaseFormatter as BaseSnapshotFormatter
+
+from turbosnake import Component, ComponentsCollection
+
+"""
+_snapshot.py
+
+Contains serializer of component trees to snapshottest snapshots.
+
+Trees are serialized directly to text of snapshot files, walking the tree once, instead of being converted to nested
+dicts and lists that are then formatted by snapshottest.
+The text is identical to one snapshottest would produce for the same tree, so existing snapshots remain valid.
+"""
+
+
+class ComponentSnapshot:
+    """A component to be matched against a snapshot, together with filters that limit what the snapshot contains.
+
+    :param max_depth: maximal depth of components included in the snapshot, relative to the component; children of
+                      components at this depth, as well as components in their properties, are replaced by a string
+                      containing their number
+    :param prop_filter: predicate that accepts property name and returns `True` iff the property should be included
+    """
+
+    def __init__(
+            self,
+            component: Component,
+            max_depth: Optional[int] = None,
+            prop_filter: Optional[Callable[[str], bool]] = None,
+    ):
+        self.component = component
+        self.max_depth = max_depth
+        self.prop_filter = prop_filter
+
+    def iter_props(self, component: Component):
+        """Iterator over (name, value) pairs of properties of given component that are included in the snapshot."""
+        prop_filter = self.prop_filter
+
+        for name, value in component.props.items():
+            if prop_filter is None or prop_filter(name):
+                yield name, value
+
+    def iter_children(self, component: Component, depth: int):
+        """Returns children of given component at given depth included in the snapshot or a string that replaces them."""
+        children = list(component.mounted_children())
+
+        if self.max_depth is not None and depth >= self.max_depth and children:
+            return f'<{len(children)} components>'
+
+        return children
+
+    def replace_nested(self, value, depth: int) -> Optional[str]:
+        """Returns a string that replaces given component or collection of components at given depth, or `None` if it
+        is included in the snapshot.
+
+        Components in properties of a component are one level deeper than the component, like it's children.
+        """
+        max_depth = self.max_depth
+
+        if max_depth is None or depth <= max_depth:
+            return None
+
+        if isinstance(value, ComponentsCollection):
+            return f'<{len(value)} components>' if value else None
+
+        return '<1 components>'
+
+    def normalize_nested(self, value):
+        """Returns value of a property of the component with components in it replaced or wrapped in `ComponentSnapshot`s
+        with the same filters, for snapshottest's formatter."""
+        if isinstance(value, (Component, ComponentsCollection)):
+            replacement = self.replace_nested(value, 1)
+
+            if replacement is not None:
+                return replacement
+
+            if isinstance(value, Component):
+                return ComponentSnapshot(
+                    value,
+                    None if self.max_depth is None else self.max_depth - 1,
+                    self.prop_filter,
+                )
+
+            return {'__class__': ComponentsCollection, 'items': [self.normalize_nested(item) for item in value]}
+
+        if type(value) is dict:
+            return {k: self.normalize_nested(v) for k, v in value.items()}
+
+        if type(value) in (list, tuple):
+            return type(value)(map(self.normalize_nested, value))
+
+        return value
+
+
+def _sorted_keys(d: dict, formatter: Formatter) -> list:
+    # Same order as used by snapshottest's SortedDict
+    keys = [(formatter.normalize(k), k) for k in d]
+
+    try:
+        return sorted(keys)
+    except TypeError:
+        return keys
+
+
+class _SnapshotWriter:
+    def __init__(self, snapshot: ComponentSnapshot, formatter: Formatter):
+        self.snapshot = snapshot
+        self.formatter = formatter
+        self.chunks: list[str] = []
+
+    def __line(self, indent):
+        self.chunks.append(self.formatter.lfchar + self.formatter.htchar * indent)
+
+    def write(self, value, indent, depth):
+        if isinstance(value, (Component, ComponentsCollection)):
+            replacement = self.snapshot.replace_nested(value, depth)
+
+            if replacement is not None:
+                value = replacement
+
+        if isinstance(value, Component):
+            self.write_component(value, indent, depth)
+        elif isinstance(value, ComponentsCollection):
+            self.write_dict({'__class__': ComponentsCollection, 'items': list(value)}, indent, depth)
+        elif type(value) is dict:
+            self.write_dict(value, indent, depth)
+        elif type(value) is list:
+            self.chunks.append('[')
+            self.write_sequence(value, indent, depth)
+            self.chunks.append(']')
+        elif type(value) is tuple:
+            self.chunks.append('(')
+            self.write_sequence(value, indent, depth)
+            self.chunks.append(',)' if len(value) == 1 else ')')
+        else:
+            formatter = self.formatter
+            self.chunks.append(formatter.format(formatter.normalize(value), indent))
+
+    def write_sequence(self, items, indent, depth):
+        first = True
+
+        for item in items:
+            if not first:
+                self.chunks.append(',')
+            first = False
+
+            self.__line(indent + 1)
+            self.write(item, indent + 1, depth)
+
+        self.__line(indent)
+
+    def write_dict(self, d: dict, indent, depth):
+        self.write_items([(k, d[k]) for _, k in _sorted_keys(d, self.formatter)], indent, depth)
+
+    def write_items(self, items, indent, depth):
+        chunks = self.chunks
+        chunks.append('{')
+        first = True
+
+        for key, value in items:
+            if not first:
+                chunks.append(',')
+            first = False
+
+            self.__line(indent + 1)
+            self.write(key, indent, depth)
+            chunks.append(': ')
+            self.write(value, indent + 1, depth)
+
+        self.__line(indent)
+        chunks.append('}')
+
+    def write_component(self, component: Component, indent, depth):
+        snapshot = self.snapshot
+        props = dict(snapshot.iter_props(component))
+
+        # Keys are listed in sorted order
+        self.write_items(
+            (
+                ('__class__', component.class_id()),
+                ('__component__', True),
+                ('children', snapshot.iter_children(component, depth)),
+                ('key', component.key),
+                ('props', props),
+            ),
+            indent,
+            depth + 1,
+        )
+
+
+def write_snapshot(snapshot: ComponentSnapshot, formatter: Formatter, indent: int = 0) -> str:
+    """Returns text of snapshot of given component in snapshottest format."""
+    writer = _SnapshotWriter(snapshot, formatter)
+    writer.write(snapshot.component, indent, 0)
+    return ''.join(writer.chunks)
+
+
+def find_snapshot_difference(snapshot: ComponentSnapshot, expected, formatter: Formatter) -> Optional[str]:
+    """Compares snapshot of a component with previously stored snapshot value, without building the whole snapshot.
+
+    Values are compared in the same order they appear in snapshot text.
+
+    :returns: path to the first differing value or `None` if there is no difference
+    """
+
+    def compare(value, expected, path, depth):
+        if isinstance(value, (Component, ComponentsCollection)):
+            replacement = snapshot.replace_nested(value, depth)
+
+            if replacement is not None:
+                value = replacement
+
+        if isinstance(value, Component):
+            if not isinstance(expected, dict) or expected.get('__component__') is not True:
+                return path
+
+            return (
+                    compare(value.class_id(), expected.get('__class__'), f'{path}.__class__', depth) or
+                    compare(snapshot.iter_children(value, depth), expected.get('children'), f'{path}.children',
+                            depth + 1) or
+                    compare(value.key, expected.get('key'), f'{path}.key', depth) or
+                    compare(dict(snapshot.iter_props(value)), expected.get('props'), f'{path}.props', depth + 1)
+            )
+
+        if isinstance(value, ComponentsCollection):
+            if not isinstance(expected, dict):
+                return path
+
+            return (
+                    compare(ComponentsCollection, expected.get('__class__'), f'{path}.__class__', depth) or
+                    compare(list(value), expected.get('items'), f'{path}.items', depth)
+            )
+
+        if type(value) is dict:
+            if not isinstance(expected, dict):
+                return path
+
+            normalized_keys = _sorted_keys(value, formatter)
+
+            for normalized_key, key in normalized_keys:
+                if normalized_key not in expected:
+                    return f'{path}[{key!r}]'
+
+                difference = compare(value[key], expected[normalized_key], f'{path}[{key!r}]', depth)
+
+                if difference:
+                    return difference
+
+            if len(expected) != len(normalized_keys):
+                missing = [k for k in expected if k not in dict(normalized_keys)]
+                return f'{path}[{missing[0]!r}]'
+
+            return None
+
+        if type(value) in (list, tuple):
+            if type(expected) is not type(value):
+                return path
+
+            for i, (item, expected_item) in enumerate(zip(value, expected)):
+                difference = compare(item, expected_item, f'{path}[{i}]', depth)
+
+                if difference:
+                    return difference
+
+            if len(value) != len(expected):
+                return f'{path}[{min(len(value), len(expected))}]'
+
+            return None
+
+        if formatter.normalize(value) != expected:
+            return path
+
+        return None
+
+    return compare(snapshot.component, expected, 'root', 0)
+
+
+class _SnapshotText:
+    """Text of a snapshot, stored instead of the component, so the snapshot reflects the tree at the moment of assertion.
+    """
+
+    def __init__(self, text: str, imports: dict[str, set[str]]):
+        self.text = text
+        self.imports = imports
+
+
+class SnapshotTextFormatter(BaseSnapshotFormatter):
+    def can_format(self, value):
+        return isinstance(value, _SnapshotText)
+
+    def format(self, value, indent, formatter):
+        for module, names in value.imports.items():
+            formatter.imports[module].update(names)
+
+        return value.text
+
+
+class ComponentSnapshotFormatter(BaseSnapshotFormatter):
+    def can_format(self, value):
+        return isinstance(value, (Component, ComponentSnapshot))
+
+    @staticmethod
+    def to_snapshot(value) -> ComponentSnapshot:
+        if isinstance(value, ComponentSnapshot):
+            return value
+
+        return ComponentSnapshot(value)
+
+    def format(self, value, indent, formatter):
+        return write_snapshot(self.to_snapshot(value), formatter, indent)
+
+    def store(self, test, value):
+        formatter = Formatter(defaultdict(set))
+        text = write_snapshot(self.to_snapshot(value), formatter)
+
+        return _SnapshotText(text, formatter.imports)
+
+    def normalize(self, value, formatter):
+        snapshot = self.to_snapshot(value)
+        component = snapshot.component
+        children = snapshot.iter_children(component, 0)
+        max_depth = snapshot.max_depth
+
+        return formatter.normalize({
+            '__class__': component.class_id(),
+            '__component__': True,
+            'children': children if isinstance(children, str) else [
+                ComponentSnapshot(child, None if max_depth is None else max_depth - 1, snapshot.prop_filter)
+                for child in children
+            ],
+            'key': component.key,
+            'props': {name: snapshot.normalize_nested(value) for name, value in snapshot.iter_props(component)},
+        })
+
+    def assert_value_matches_snapshot(self, test, test_value, snapshot_value, formatter):
+        snapshot = self.to_snapshot(test_value)
+        path = find_snapshot_difference(snapshot, snapshot_value, formatter)
+
+        if path is None:
+            return
+
+        try:
+            # Compare texts to get a readable diff
+            test.assert_equals(
+                write_snapshot(snapshot, Formatter(defaultdict(set))),
+                Formatter(defaultdict(set)).format(snapshot_value, 0),
+            )
+        except AssertionError as e:
+            raise AssertionError(f'Snapshot differs at {path}:\n{e}') from None
+
+        raise AssertionError(f'Snapshot differs at {path}')
@@ -1,4 +1,7 @@
-import asyncio
+from collections import deque
+from heapq import heappush, heappop
+from itertools import count
+from typing import Optional
 
 from snapshottest import TestCase as SnapshotTestCase
 from snapshottest.formatter import Formatter
@@ -6,51 +9,140 @@ from snapshottest.formatters import BaseFormatter as BaseSnapshotFormatter
 
 from turbosnake import Tree, Component, ComponentsCollection
 from turbosnake._utils import get_component_class
+from turbosnake.test_helpers._event_loop import VirtualTimeEventLoop
 from turbosnake.test_helpers._selectors import Selector
+from turbosnake.test_helpers._snapshot import ComponentSnapshotFormatter, SnapshotTextFormatter, ComponentSnapshot
 
 
 class TestTree(Tree):
+    """Tree for tests and benchmarks, running tasks only when `run_tasks` or `advance_time` is called.
+
+    The tree uses virtual time that starts at zero and changes only when `advance_time` is called.
+    Delayed tasks and timers of the tree's asyncio event loop are executed in order of their time as the time advances.
+    """
+
     def __init__(self):
         super().__init__()
-        self.__callbacks = []
+        self.__callbacks = deque()
+        self.__time = 0.0
+        # Heap of [time, sequence number, callback] entries, callback is `None` for cancelled tasks
+        self.__delayed_tasks = []
+        self.__delayed_task_counter = count()
+        self.__event_loop: Optional[VirtualTimeEventLoop] = None
 
     @property
-    def event_loop(self) -> asyncio.AbstractEventLoop:
-        # TODO: Implement this and test asynchronous operation hook(s)
-        raise NotImplemented
+    def event_loop(self) -> VirtualTimeEventLoop:
+        """asyncio event loop running in virtual time of this tree.
+
+        The loop runs only inside `run_tasks` and `advance_time` calls, on the thread that calls them.
+        """
+        if self.__event_loop is None:
+            self.__event_loop = VirtualTimeEventLoop(self.now)
+
+        return self.__event_loop
+
+    def now(self) -> float:
+        return self.__time
 
     def schedule_task(self, callback):
         self.__callbacks.append(callback)
 
     def schedule_delayed_task(self, delay, callback):
-        # TODO: Implement some way of testing delayed tasks
-        raise NotImplemented
+        entry = [self.__time + delay, next(self.__delayed_task_counter), callback]
+        heappush(self.__delayed_tasks, entry)
+
+        def cancel():
+            entry[2] = None
+
+        return cancel
+
+    @property
+    def pending_delayed_tasks(self) -> int:
+        """Number of delayed tasks that are scheduled and not cancelled."""
+        return sum(1 for entry in self.__delayed_tasks if entry[2] is not None)
 
     def run_tasks(self):
+        """Runs enqueued tasks and ready callbacks of the event loop until there remains no more of them.
+
+        :returns: number of executed tasks and callbacks
+        """
         ran_tasks = 0
+        callbacks = self.__callbacks
+        loop = self.__event_loop
 
-        while len(self.__callbacks):
-            self.__callbacks.pop(0)()
-            ran_tasks += 1
+        while True:
+            while callbacks:
+                callbacks.popleft()()
+                ran_tasks += 1
 
-        return ran_tasks
+            if loop is None and self.__event_loop is not None:
+                loop = self.__event_loop
 
+            if loop is None or not loop.has_ready_callbacks:
+                return ran_tasks
 
-class ComponentSnapshotFormatter(BaseSnapshotFormatter):
-    def can_format(self, value):
-        return isinstance(value, Component)
+            ran_tasks += loop.run_once()
 
-    def format(self, value, indent, formatter):
-        return formatter.format(self.normalize(value, formatter), indent)
+    def __next_due_time(self) -> Optional[float]:
+        delayed_tasks = self.__delayed_tasks
 
-    def normalize(self, value, formatter):
-        return formatter.normalize({
-            '__class__': value.class_id(),
-            '__component__': True,
-            'children': list(value.mounted_children()),
-            'key': value.key,
-            'props': value.props,
-        })
+        while delayed_tasks and delayed_tasks[0][2] is None:
+            heappop(delayed_tasks)
+
+        due_time = delayed_tasks[0][0] if delayed_tasks else None
+
+        if self.__event_loop is not None:
+            timer_time = self.__event_loop.next_timer_time
+
+            if timer_time is not None and (due_time is None or timer_time < due_time):
+                due_time = timer_time
+
+        return due_time
+
+    def advance_time(self, ms: float) -> int:
+        """Advances virtual time by given number of milliseconds.
+
+        Delayed tasks and event loop timers are executed in order of their time, with the time set to their due time.
+        Tasks enqueued by them are executed before the time advances further.
+
+        :returns: number of executed tasks and callbacks
+        """
+        ran_tasks = self.run_tasks()
+        target_time = self.__time + ms
+
+        while True:
+            due_time = self.__next_due_time()
+
+            if due_time is None or due_time > target_time:
+                break
+
+            self.__time = max(self.__time, due_time)
+            delayed_tasks = self.__delayed_tasks
+
+            while delayed_tasks and delayed_tasks[0][0] <= self.__time:
+                callback = heappop(delayed_tasks)[2]
+
+                if callback is not None:
+                    callback()
+                    ran_tasks += 1
+
+            ran_tasks += self.run_tasks()
+
+        self.__time = target_time
+
+        return ran_tasks + self.run_tasks()
+
+    def simulate_blocking(self, ms: float):
+        """Advances virtual time by given number of milliseconds without executing anything, as if the event loop was
+        blocked by a long operation.
+        """
+        self.__time += ms
+
+    def close(self):
+        """Closes event loop of this tree, if it was created."""
+        if self.__event_loop is not None:
+            self.__event_loop.close()
+            self.__event_loop = None
 
 
 class ComponentsCollectionSnapshotFormatter(BaseSnapshotFormatter):
@@ -68,6 +160,7 @@ class ComponentsCollectionSnapshotFormatter(BaseSnapshotFormatter):
 
 
 Formatter.formatters.insert(0, ComponentSnapshotFormatter())
+Formatter.formatters.insert(0, SnapshotTextFormatter())
 Formatter.formatters.insert(0, ComponentsCollectionSnapshotFormatter())
 
 
@@ -76,6 +169,10 @@ class TreeTestCase(SnapshotTestCase):
         SnapshotTestCase.setUp(self)
         self.tree = TestTree()
 
+    def tearDown(self):
+        self.tree.close()
+        SnapshotTestCase.tearDown(self)
+
     def render(self, component, **props):
         with self.tree:
             component(**props)
@@ -84,14 +181,20 @@ class TreeTestCase(SnapshotTestCase):
 
         return self.tree.root
 
-    def assertTreeMatchesSnapshot(self, run_tasks=True, **kwargs):
+    def assertTreeMatchesSnapshot(self, run_tasks=True, max_depth=None, prop_filter=None, **kwargs):
+        """Asserts that the tree matches stored snapshot.
+
+        :param max_depth: maximal depth of components included in the snapshot, see `ComponentSnapshot`
+        :param prop_filter: predicate that accepts property name and returns `True` iff the property should be included
+                            in the snapshot
+        """
         if run_tasks:
             self.tree.run_tasks()
 
-        self.assertMatchSnapshot(self.tree.root, **kwargs)
+        self.assertMatchSnapshot(ComponentSnapshot(self.tree.root, max_depth, prop_filter), **kwargs)
 
     def assertIsComponentInstance(self, component, component_class_or_inserter, msg=None):
         self.assertIsInstance(component, get_component_class(component_class_or_inserter), msg)
 
     def root_selector(self) -> Selector:
-        return Selector([self.tree.root])
+        return Selector.of_tree(self.tree)
@@ -0,0 +1,165 @@
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from abc import ABC, abstractmethod
+from os import path
+from typing import Iterable
+
+"""
+_file_watcher.py
+
+Contains watchers of source file changes used by preview worker.
+"""
+
+
+class FileWatcher(ABC):
+    """Watches a set of files for changes.
+
+    Changes are not reported immediately, they are collected until the next `poll` call.
+    """
+
+    @abstractmethod
+    def watch(self, file_path: str):
+        """Adds a file to watched files. Adding a file that is already watched does nothing."""
+        ...
+
+    @abstractmethod
+    def poll(self) -> set[str]:
+        """Returns paths of watched files that have changed since the previous call."""
+        ...
+
+    def watch_all(self, file_paths: Iterable[str]):
+        for file_path in file_paths:
+            self.watch(file_path)
+
+    def close(self):
+        pass
+
+
+class MtimeFileWatcher(FileWatcher):
+    """Watcher that compares modification times of all watched files on every `poll` call."""
+
+    def __init__(self):
+        self.__mtimes: dict[str, float] = {}
+
+    @staticmethod
+    def __get_mtime(file_path):
+        try:
+            return os.stat(file_path).st_mtime
+        except OSError:
+            return None
+
+    def watch(self, file_path):
+        file_path = path.abspath(file_path)
+
+        if file_path not in self.__mtimes:
+            self.__mtimes[file_path] = self.__get_mtime(file_path)
+
+    def poll(self):
+        changed = set()
+        mtimes = self.__mtimes
+
+        for file_path, mtime in mtimes.items():
+            new_mtime = self.__get_mtime(file_path)
+
+            if new_mtime != mtime:
+                mtimes[file_path] = new_mtime
+                changed.add(file_path)
+
+        return changed
+
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_Q_OVERFLOW = 0x00004000
+
+_INOTIFY_EVENT = struct.Struct('iIII')
+
+
+class InotifyFileWatcher(FileWatcher):
+    """Watcher that uses Linux inotify API, so it doesn't touch the files until kernel reports some changes.
+
+    Directories containing watched files are watched instead of the files themselves, so files replaced by editors
+    (written to a temporary file and renamed) are still tracked.
+    """
+
+    # Events of watched directories that may mean that a file has changed
+    MASK = _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+
+    def __init__(self):
+        self.__libc = libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+        self.__fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+
+        if self.__fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+
+        self.__files: set[str] = set()
+        self.__directories: dict[int, str] = {}
+
+    def watch(self, file_path):
+        file_path = path.abspath(file_path)
+
+        if file_path in self.__files:
+            return
+
+        directory = path.dirname(file_path)
+
+        if directory not in self.__directories.values():
+            wd = self.__libc.inotify_add_watch(self.__fd, os.fsencode(directory), self.MASK)
+
+            if wd < 0:
+                raise OSError(ctypes.get_errno(), f'Cannot watch {directory}')
+
+            self.__directories[wd] = directory
+
+        self.__files.add(file_path)
+
+    def poll(self):
+        changed = set()
+
+        while True:
+            try:
+                data = os.read(self.__fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+
+            offset = 0
+
+            while offset < len(data):
+                wd, mask, _, name_length = _INOTIFY_EVENT.unpack_from(data, offset)
+                offset += _INOTIFY_EVENT.size
+                name = data[offset:offset + name_length].rstrip(b'\0')
+                offset += name_length
+
+                if mask & _IN_Q_OVERFLOW:
+                    # Some events were lost
+                    changed.update(self.__files)
+                    continue
+
+                directory = self.__directories.get(wd)
+
+                if directory is not None and name:
+                    file_path = path.join(directory, os.fsdecode(name))
+
+                    if file_path in self.__files:
+                        changed.add(file_path)
+
+    def close(self):
+        if self.__fd >= 0:
+            os.close(self.__fd)
+            self.__fd = -1
+
+
+def create_file_watcher() -> FileWatcher:
+    """Creates the most efficient file watcher available on current platform."""
+    if sys.platform.startswith('linux'):
+        try:
+            return InotifyFileWatcher()
+        except (OSError, AttributeError, TypeError):
+            pass  # inotify is not available, e.g. because of limit of inotify instances
+
+    return MtimeFileWatcher()
@@ -3,6 +3,8 @@ import os
 import os.path as path
 import sys
 
+from ._preview_server import is_preview_server_supported, run_preview_on_server
+
 
 def preview_component(component):
     component.enable_preview = True
@@ -13,8 +15,26 @@ def run_preview(
         manager_module_name,
         options,
         module_name: str = '__main__',
+        use_server: bool = True,
 ):
+    """Runs preview of components of given module.
+
+    :param use_server: if `True` and the platform supports it, preview is run by a long-lived preview server (see
+                       `_preview_server`), started on first use, instead of a new interpreter
+    """
     module = sys.modules[module_name]
+
+    if use_server and is_preview_server_supported():
+        try:
+            run_preview_on_server(
+                root_module_path=module.__file__,
+                manager_module_name=manager_module_name,
+                options=options,
+            )
+            return
+        except OSError as e:
+            print('Cannot run preview on preview server, starting new preview process:', e)
+
     worker_path = path.join(path.dirname(__file__), '_preview_worker.py')
 
     os.spawnve(
@@ -0,0 +1,403 @@
+import hashlib
+import importlib
+import json
+import os
+import selectors
+import signal
+import socket
+import stat
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+from os import path
+from typing import Optional
+
+"""
+_preview_server.py
+
+Contains a long-lived preview server and a client for it.
+
+The server keeps an interpreter with turbosnake and preview manager modules (and so tkinter) already imported.
+For every preview request it forks a worker process that inherits these modules, so preview starts without waiting
+for the interpreter to start and import them again.
+Standard streams of the client are passed to the worker, so output of the preview goes to the same terminal as if
+the worker was started by the client itself.
+
+The server exits after it has no running workers for `idle_timeout` seconds.
+
+The socket is created in a directory accessible by current user only, and both the server and the client check that
+the other side of a connection runs as the same user, as the client sends it's standard streams and environment to the
+server and the server runs code on client's request.
+"""
+
+# Length of request JSON or exit status of a worker
+_HEADER = struct.Struct('!i')
+# Credentials of the other side of a unix socket connection: pid, uid and gid
+_PEER_CREDENTIALS = struct.Struct('iII')
+
+_CONNECT_TIMEOUT = 10.0
+_CONNECT_INTERVAL = 0.05
+_REAP_INTERVAL = 0.2
+DEFAULT_IDLE_TIMEOUT = 10 * 60
+
+
+def is_preview_server_supported() -> bool:
+    """Returns `True` iff preview server can run on current platform.
+
+    The server is supported on Linux only: on macOS, a process that has loaded Tk (and so Cocoa) cannot be safely forked
+    without exec.
+    """
+    return (
+            sys.platform.startswith('linux')
+            and hasattr(os, 'fork')
+            and hasattr(socket, 'send_fds')
+            and hasattr(socket, 'SO_PEERCRED')
+    )
+
+
+def _is_private_directory(directory_path: str) -> bool:
+    try:
+        st = os.lstat(directory_path)
+    except OSError:
+        return False
+
+    return stat.S_ISDIR(st.st_mode) and st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def _get_private_directory() -> str:
+    """Returns path of a directory for sockets of preview servers accessible by current user only, creating it if
+    necessary.
+
+    :raises PermissionError: if the directory exists but is not private (e.g. was created by another user)
+    """
+    runtime_directory = os.getenv('XDG_RUNTIME_DIR')
+
+    if runtime_directory and _is_private_directory(runtime_directory):
+        directory_path = path.join(runtime_directory, 'turbosnake')
+    else:
+        directory_path = path.join(tempfile.gettempdir(), f'turbosnake-{os.getuid()}')
+
+    try:
+        os.mkdir(directory_path, 0o700)
+    except FileExistsError:
+        pass
+
+    if not _is_private_directory(directory_path):
+        raise PermissionError(f'Directory {directory_path} is accessible by other users')
+
+    return directory_path
+
+
+def get_socket_path() -> str:
+    """Returns path of socket of the server compatible with current interpreter and turbosnake installation.
+
+    Interpreters and turbosnake packages at different locations use different servers.
+
+    :raises PermissionError: if a directory private for current user cannot be created for the socket
+    """
+    import turbosnake
+
+    key = hashlib.sha1(f'{sys.executable}\0{path.dirname(turbosnake.__file__)}'.encode()).hexdigest()[:16]
+
+    return path.join(_get_private_directory(), f'preview-{key}.sock')
+
+
+def _check_peer(conn: socket.socket):
+    """Checks that the other side of a connection runs as current user.
+
+    :raises PermissionError: if it does not
+    """
+    _, uid, _ = _PEER_CREDENTIALS.unpack(
+        conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, _PEER_CREDENTIALS.size)
+    )
+
+    if uid != os.getuid():
+        raise PermissionError(f'Preview server connection peer runs as another user (uid={uid})')
+
+
+def _receive_exactly(conn: socket.socket, size: int) -> bytes:
+    data = b''
+
+    while len(data) < size:
+        chunk = conn.recv(size - len(data))
+
+        if not chunk:
+            raise ConnectionError('Connection closed before the whole message was received')
+
+        data += chunk
+
+    return data
+
+
+def _run_worker_process(conn: socket.socket, fds: list[int], request: dict):
+    # Runs in forked worker process, never returns
+    exit_code = 1
+
+    try:
+        for target_fd, fd in enumerate(fds):
+            os.dup2(fd, target_fd)
+            os.close(fd)
+
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+
+        os.chdir(request['cwd'])
+        os.environ.clear()
+        os.environ.update(request['env'])
+        sys.path[:] = request['sys_path']
+        importlib.invalidate_caches()
+        conn.close()
+
+        from turbosnake.tools._preview_worker import run_worker
+
+        run_worker(
+            root_module_path=request['root_module_path'],
+            manager_module_name=request['manager_module_name'],
+            options=request['options'],
+        )
+        exit_code = 0
+    except SystemExit as e:
+        exit_code = e.code if isinstance(e.code, int) else 1
+    except BaseException:
+        traceback.print_exc()
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os._exit(exit_code)
+
+
+class PreviewServer:
+    """Server that forks a preview worker for every connected client.
+
+    :param socket_path: path of the unix socket to listen on
+    :param preload_modules: names of modules imported before the server starts accepting requests
+    :param idle_timeout: time (in seconds) the server waits for new requests after the last worker exits
+    """
+
+    def __init__(self, socket_path: str, preload_modules: list[str] = (), idle_timeout: float = DEFAULT_IDLE_TIMEOUT):
+        self.socket_path = socket_path
+        self.preload_modules = preload_modules
+        self.idle_timeout = idle_timeout
+
+        self.__selector = selectors.DefaultSelector()
+        self.__listener: Optional[socket.socket] = None
+        # Connections of clients by pid of their workers
+        self.__workers: dict[int, socket.socket] = {}
+
+    def __preload(self, module_names):
+        for name in module_names:
+            if name not in sys.modules:
+                # noinspection PyBroadException
+                try:
+                    importlib.import_module(name)
+                except Exception:
+                    traceback.print_exc()
+
+    def __listen(self):
+        listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+        try:
+            listener.bind(self.socket_path)
+        except OSError:
+            # Either another server is running or the socket is left by a server that didn't exit cleanly
+            try:
+                with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+                    probe.connect(self.socket_path)
+            except OSError:
+                if not self.__is_own_socket():
+                    listener.close()
+                    raise
+
+                os.unlink(self.socket_path)
+                listener.bind(self.socket_path)
+            else:
+                listener.close()
+                raise
+
+        listener.listen()
+        self.__listener = listener
+        self.__selector.register(listener, selectors.EVENT_READ)
+
+    def __is_own_socket(self) -> bool:
+        try:
+            st = os.lstat(self.socket_path)
+        except OSError:
+            return False
+
+        return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+    def __accept(self):
+        conn, _ = self.__listener.accept()
+        fds = []
+
+        try:
+            _check_peer(conn)
+            conn.settimeout(_CONNECT_TIMEOUT)
+            header, fds, _, _ = socket.recv_fds(conn, _HEADER.size, 3)
+            header += _receive_exactly(conn, _HEADER.size - len(header))
+            size, = _HEADER.unpack(header)
+            request = json.loads(_receive_exactly(conn, size))
+            conn.settimeout(None)
+
+            # Modules imported by a worker will be available for the next workers right away
+            self.__preload([request['manager_module_name']])
+
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+        except Exception:
+            traceback.print_exc()
+
+            for fd in fds:
+                os.close(fd)
+
+            conn.close()
+            return
+
+        if pid == 0:
+            self.__selector.close()
+            self.__listener.close()
+
+            for other_conn in self.__workers.values():
+                other_conn.close()
+
+            _run_worker_process(conn, fds, request)
+
+        for fd in fds:
+            os.close(fd)
+
+        self.__workers[pid] = conn
+        self.__selector.register(conn, selectors.EVENT_READ, pid)
+
+    def __reap(self):
+        for pid, conn in list(self.__workers.items()):
+            finished_pid, status = os.waitpid(pid, os.WNOHANG)
+
+            if finished_pid == 0:
+                continue
+
+            del self.__workers[pid]
+
+            if conn.fileno() in self.__selector.get_map():
+                self.__selector.unregister(conn)
+
+            try:
+                conn.sendall(_HEADER.pack(os.waitstatus_to_exitcode(status)))
+            except OSError:
+                pass  # Client has gone away
+
+            conn.close()
+
+    def serve(self):
+        """Accepts requests until the server stays idle for `idle_timeout` seconds."""
+        self.__preload(self.preload_modules)
+        self.__listen()
+        # Remove the socket when terminated
+        signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+        idle_since = time.monotonic()
+
+        try:
+            while self.__workers or time.monotonic() - idle_since < self.idle_timeout:
+                for key, _ in self.__selector.select(_REAP_INTERVAL):
+                    if key.fileobj is self.__listener:
+                        self.__accept()
+                    else:
+                        # Client has closed the connection (e.g. was interrupted), it doesn't need the preview anymore
+                        self.__selector.unregister(key.fileobj)
+                        os.kill(key.data, signal.SIGTERM)
+
+                self.__reap()
+
+                if self.__workers:
+                    idle_since = time.monotonic()
+        finally:
+            self.__selector.close()
+            self.__listener.close()
+
+            if self.__is_own_socket():
+                os.unlink(self.socket_path)
+
+
+def _start_server(socket_path: str, manager_module_name: str):
+    import turbosnake
+
+    subprocess.Popen(
+        [sys.executable, __file__, socket_path, manager_module_name],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+        env={**os.environ, 'PYTHONPATH': path.dirname(path.dirname(turbosnake.__file__))},
+    )
+
+
+def _connect(socket_path: str, manager_module_name: str) -> socket.socket:
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+
+    try:
+        try:
+            conn.connect(socket_path)
+        except OSError:
+            _start_server(socket_path, manager_module_name)
+            deadline = time.monotonic() + _CONNECT_TIMEOUT
+
+            while True:
+                try:
+                    conn.connect(socket_path)
+                    break
+                except OSError:
+                    if time.monotonic() > deadline:
+                        raise
+
+                    time.sleep(_CONNECT_INTERVAL)
+
+        _check_peer(conn)
+    except OSError:
+        conn.close()
+        raise
+
+    return conn
+
+
+def run_preview_on_server(
+        root_module_path: str,
+        manager_module_name: str,
+        options: dict,
+        socket_path: Optional[str] = None,
+) -> int:
+    """Runs preview in a worker forked by preview server, starting the server if it is not running.
+
+    Blocks until the worker exits.
+
+    :param socket_path: path of the server socket, `get_socket_path()` by default
+    :returns: exit code of the worker
+    """
+    request = json.dumps({
+        'root_module_path': root_module_path,
+        'manager_module_name': manager_module_name,
+        'options': options,
+        'cwd': os.getcwd(),
+        'env': dict(os.environ),
+        'sys_path': sys.path,
+    }).encode()
+
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    with _connect(socket_path or get_socket_path(), manager_module_name) as conn:
+        socket.send_fds(conn, [_HEADER.pack(len(request))], [0, 1, 2])
+        conn.sendall(request)
+
+        exit_code, = _HEADER.unpack(_receive_exactly(conn, _HEADER.size))
+
+        return exit_code
+
+
+if __name__ == '__main__':
+    PreviewServer(
+        socket_path=sys.argv[1],
+        preload_modules=['turbosnake', 'turbosnake.tools._preview_worker', *sys.argv[2:]],
+    ).serve()
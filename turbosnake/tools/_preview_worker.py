@@ -1,29 +1,159 @@
+import ast
 import importlib
+import importlib.util
 import json
 import os
 import sys
 import traceback
+from graphlib import TopologicalSorter, CycleError
 from os import path
 from types import ModuleType
+from typing import Optional
 
-from turbosnake import Tree, functional_component, use_state
+from turbosnake import Tree, functional_component, use_state, enable_hot_swap, prepare_hot_swap
+from turbosnake.tools._file_watcher import FileWatcher, create_file_watcher
+
+
+def _get_imported_module_names(module: ModuleType) -> set[str]:
+    """Returns names of modules that may be imported by given module, based on import statements in it's source."""
+    with open(module.__file__, 'rb') as f:
+        source_tree = ast.parse(f.read(), module.__file__)
+
+    package = module.__package__ or ''
+    names = set()
+
+    for node in ast.walk(source_tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                try:
+                    base = importlib.util.resolve_name('.' * node.level + (node.module or ''), package)
+                except (ImportError, ValueError):
+                    continue
+            else:
+                base = node.module
+
+            names.add(base)
+            # Imported names may be submodules
+            names.update(f'{base}.{alias.name}' for alias in node.names)
+
+    return names
 
 
 class ModuleTracker:
-    # TODO: Track dependencies of root module too
-    def __init__(self, root_module: ModuleType):
+    """Tracks changes in source files of root module and modules it imports (directly or indirectly) from the same
+    directory, and reloads changed modules.
+
+    Modules importing a changed module are reloaded too, as they may keep references to objects of it's previous version.
+    Modules are reloaded in order of their dependencies, so every module is reloaded after modules it imports.
+    """
+
+    def __init__(self, root_module: ModuleType, watcher: Optional[FileWatcher] = None):
         self._root_module = root_module
-        self._root_mtime = self._get_root_mtime()
+        self._directory = path.dirname(path.abspath(root_module.__file__)) + os.sep
+        self._watcher = watcher or create_file_watcher()
+
+        # Tracked modules imported by each tracked module
+        self._imports: dict[str, set[str]] = {}
+        # Names of tracked modules by their file paths
+        self._modules_by_file: dict[str, str] = {}
+        # Changed files, modules of which are not reloaded yet
+        self._changed_files: set[str] = set()
+        # Modules left not reloaded because reload of a module they were reloaded together with has failed
+        self._pending_modules: set[str] = set()
 
-    def _get_root_mtime(self):
-        return os.stat(self._root_module.__file__).st_mtime
+        self._track(root_module.__name__)
+
+    def _is_trackable(self, module: Optional[ModuleType]) -> bool:
+        file = getattr(module, '__file__', None)
+
+        return bool(file) and file.endswith('.py') and path.abspath(file).startswith(self._directory)
+
+    def _track(self, module_name: str):
+        queue = [module_name]
+
+        while queue:
+            name = queue.pop()
+            module = sys.modules[name]
+
+            imports = {
+                imported
+                for imported in _get_imported_module_names(module)
+                if imported != name and self._is_trackable(sys.modules.get(imported))
+            }
+            self._imports[name] = imports
+
+            file_path = path.abspath(module.__file__)
+            self._modules_by_file[file_path] = name
+            self._watcher.watch(file_path)
+
+            queue.extend(imported for imported in imports if imported not in self._imports)
 
     def has_changes(self):
-        return self._get_root_mtime() != self._root_mtime
+        """Returns `True` iff some tracked files have changed and no more changes were detected since the previous call.
+
+        So files saved together are reloaded at once.
+        """
+        changed = self._watcher.poll()
+
+        if changed:
+            self._changed_files.update(changed)
+            return False
+
+        return bool(self._changed_files)
+
+    def _get_affected_modules(self, changed_modules: set[str]) -> set[str]:
+        dependents: dict[str, list[str]] = {}
+
+        for name, imports in self._imports.items():
+            for imported in imports:
+                dependents.setdefault(imported, []).append(name)
+
+        affected = set()
+        queue = list(changed_modules)
+
+        while queue:
+            name = queue.pop()
+
+            if name not in affected:
+                affected.add(name)
+                queue.extend(dependents.get(name, ()))
+
+        return affected
 
     def reload(self):
-        self._root_mtime = self._get_root_mtime()
-        importlib.reload(self._root_module)
+        changed_modules = {
+            self._modules_by_file[file_path]
+            for file_path in self._changed_files
+            if file_path in self._modules_by_file
+        } | self._pending_modules
+        self._changed_files = set()
+        self._pending_modules = set()
+
+        affected = self._get_affected_modules(changed_modules)
+        sorter = TopologicalSorter({name: self._imports[name] & affected for name in affected})
+
+        try:
+            order = list(sorter.static_order())
+        except CycleError:
+            # Circular imports - there is no right order, reload the modules in order they were discovered, deepest first
+            order = [name for name in reversed(self._imports) if name in affected]
+
+        for i, name in enumerate(order):
+            print('Reloading', name)
+            prepare_hot_swap(name)
+
+            try:
+                importlib.reload(sys.modules[name])
+            except BaseException:
+                # Reload the failed module and the rest of the modules after the next change
+                self._pending_modules.update(order[i:])
+                raise
+
+            # Imports of the module might change
+            del self._imports[name]
+            self._track(name)
 
 
 def list_preview_components(module):
@@ -96,15 +226,22 @@ def preview(
     manager_module.run_main_loop(tree=tree, **options)
 
 
-def main():
-    manager_module_name = os.getenv('TURBOSNAKE_PREVIEW_MANAGER')
-    root_module_path = os.getenv('TURBOSNAKE_PREVIEW_ROOT')
-    options_string = os.getenv('TURBOSNAKE_PREVIEW_OPTIONS')
+def run_worker(root_module_path: str, manager_module_name: str, options: dict):
+    # Components of reloaded modules keep state of their mounted instances
+    enable_hot_swap()
 
     preview(
         root_module=load_root_module(root_module_path),
         manager_module=importlib.import_module(manager_module_name),
-        options=json.loads(options_string)
+        options=options,
+    )
+
+
+def main():
+    run_worker(
+        root_module_path=os.getenv('TURBOSNAKE_PREVIEW_ROOT'),
+        manager_module_name=os.getenv('TURBOSNAKE_PREVIEW_MANAGER'),
+        options=json.loads(os.getenv('TURBOSNAKE_PREVIEW_OPTIONS')),
     )
 
 
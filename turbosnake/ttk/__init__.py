@@ -1,8 +1,31 @@
-from ._adapters import tk_label, tk_button, tk_window, tk_entry, tk_scrollbar, tk_canvas, tk_radio_group, tk_frame, \
-    tk_packed_frame, tk_place_frame, tk_grid_frame
-from ._adapters import tk_window
-from ._composite import tk_scrollable_frame, tk_link
-from ._core import TkComponent, TkTree
-from ._menu import tk_menu, tk_window_menu, tk_menu_command, tk_menu_separator, tk_menu_checkbutton, tk_menu_radiobutton
-from ._style import style, StyledTkComponent, Style, StyleInstance
-from ._utils import tk_app
+from typing import TYPE_CHECKING
+
+from .._lazy_imports import lazy_exports
+
+# Public names are imported on first access, so tkinter is not imported until some of them is used
+__getattr__, __dir__, __all__ = lazy_exports(__name__, globals(), {
+    '._adapters': ('tk_label', 'tk_button', 'tk_window', 'tk_entry', 'tk_scrollbar', 'tk_canvas', 'tk_radio_group',
+                   'tk_frame', 'tk_packed_frame', 'tk_place_frame', 'tk_grid_frame'),
+    '._canvas': ('tk_canvas_rect', 'tk_canvas_oval', 'tk_canvas_line', 'tk_canvas_polygon', 'tk_canvas_text',
+                 'tk_canvas_image'),
+    '._composite': ('tk_scrollable_frame', 'tk_link'),
+    '._core': ('TkComponent', 'TkTree'),
+    '._notebook': ('tk_notebook', 'tk_notebook_tab'),
+    '._menu': ('tk_menu', 'tk_window_menu', 'tk_menu_command', 'tk_menu_separator', 'tk_menu_checkbutton',
+               'tk_menu_radiobutton'),
+    '._style': ('style', 'StyledTkComponent', 'Style', 'StyleInstance'),
+    '._utils': ('tk_app',),
+})
+
+if TYPE_CHECKING:
+    from ._adapters import tk_label, tk_button, tk_window, tk_entry, tk_scrollbar, tk_canvas, tk_radio_group, \
+        tk_frame, tk_packed_frame, tk_place_frame, tk_grid_frame
+    from ._canvas import tk_canvas_rect, tk_canvas_oval, tk_canvas_line, tk_canvas_polygon, tk_canvas_text, \
+        tk_canvas_image
+    from ._composite import tk_scrollable_frame, tk_link
+    from ._core import TkComponent, TkTree
+    from ._notebook import tk_notebook, tk_notebook_tab
+    from ._menu import tk_menu, tk_window_menu, tk_menu_command, tk_menu_separator, tk_menu_checkbutton, \
+        tk_menu_radiobutton
+    from ._style import style, StyledTkComponent, Style, StyleInstance
+    from ._utils import tk_app
@@ -4,6 +4,7 @@ from tkinter import ttk
 from typing import Callable, Optional, Literal
 
 from turbosnake import Wrapper, Component, event_prop_invoker, component, noop_handler
+from turbosnake.ttk._canvas import CanvasItemStack
 from turbosnake.ttk._core import TkContainerBase, TkComponent, configure_window
 from turbosnake.ttk._layout import LayoutManagerPropValue
 from turbosnake.ttk._style import StyledTkComponent
@@ -40,6 +41,8 @@ class TkWindow(TkContainerComponent, TkComponent, Wrapper):
         try:
             event_handler = self.props['on_close']
         except KeyError:
+            # Batched commands may refer to descendants of the window
+            self.tree.tcl_batch.flush()
             self.widget.destroy()
             return
 
@@ -124,12 +127,21 @@ def tk_grid_frame(
 
 
 class TkButton(StyledTkComponent, TkComponent):
+    tk_recyclable = True
+
+    @classmethod
+    def create_blank_widget(cls, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
+        return ttk.Button(tk_parent)
+
     def create_widget(self, tk_parent):
         return ttk.Button(
             tk_parent,
             command=event_prop_invoker(self, 'on_click')
         )
 
+    def reuse_widget(self, widget: ttk.Button):
+        self.tree.tcl_batch.configure(widget, {'command': event_prop_invoker(self, 'on_click')})
+
     def get_widget_config(self, text, disabled, cursor=None, **props):
         cfg = super().get_widget_config(**props)
 
@@ -151,6 +163,12 @@ def tk_button(
 
 
 class TkLabel(StyledTkComponent, TkComponent):
+    tk_recyclable = True
+
+    @classmethod
+    def create_blank_widget(cls, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
+        return ttk.Label(tk_parent)
+
     def create_widget(self, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
         return ttk.Label(tk_parent)
 
@@ -171,20 +189,31 @@ def tk_label(
 
 
 class TkEntry(StyledTkComponent, TkComponent):
+    tk_recyclable = True
+
+    @classmethod
+    def create_blank_widget(cls, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
+        return ttk.Entry(tk_parent)
+
     def create_widget(self, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
         widget = ttk.Entry(tk_parent)
         widget.insert(0, self.props['initial_value'])
         return widget
 
+    def reuse_widget(self, widget: ttk.Entry):
+        batch = self.tree.tcl_batch
+        batch.add(widget._w, 'delete', 0, 'end')
+        batch.add(widget._w, 'insert', 0, self.props['initial_value'])
+
     @property
     def text(self):
-        return self.widget.get()
+        return self.tree.tcl_batch.call(self.widget._w, 'get')
 
     @text.setter
     def text(self, value):
-        w: ttk.Entry = self.widget
-        w.delete(0, len(w.get()))
-        w.insert(0, value)
+        batch = self.tree.tcl_batch
+        batch.call(self.widget._w, 'delete', 0, 'end')
+        batch.call(self.widget._w, 'insert', 0, value)
 
 
 @component(TkEntry)
@@ -223,10 +252,27 @@ def tk_scrollbar(
 
 
 class TkCanvas(TkContainerComponent, TkComponent, Wrapper):
+    """Canvas widget.
+
+    May contain both widgets and canvas item components (see `_canvas.py`).
+    """
+
     @property
     def layout_props(self):
         return self.props
 
+    def mount(self, parent):
+        super().mount(parent)
+        self.canvas_items = CanvasItemStack(self)
+
+    def unmount(self):
+        super().unmount()
+        del self.canvas_items
+
+    def on_descendants_reordered(self):
+        super().on_descendants_reordered()
+        self.canvas_items.on_items_reordered()
+
     def create_widget(self, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
         return tk.Canvas(tk_parent)
 
@@ -0,0 +1,153 @@
+import tkinter as tk
+from bisect import bisect_right
+from functools import partial
+from typing import Callable, Iterable, Optional
+
+# noinspection PyProtectedMember
+from tkinter import _stringify
+
+"""
+_batch.py
+
+Contains a collector of Tcl commands that lets tk components send widget changes to Tcl interpreter in one go.
+"""
+
+GEOMETRY_MANAGERS = ('pack', 'grid', 'place')
+
+
+def _forget_destroyed_widget(widget: tk.Misc):
+    """Does the same python-side cleanup as `BaseWidget.destroy` but doesn't destroy tk widgets."""
+    for child in list(widget.children.values()):
+        _forget_destroyed_widget(child)
+
+    if widget.master and widget.master.children.get(widget._name) is widget:
+        del widget.master.children[widget._name]
+
+    tk.Misc.destroy(widget)
+
+
+class TclCommandBatch:
+    """Collects Tcl commands changing widgets and evaluates them as a single Tcl script when `flush` is called.
+
+    Only commands whose results are not needed may be batched.
+    Operations that need a return value, as well as any other direct access to widgets, should use `call` or `flush`
+    first, so they are applied after pending commands.
+
+    When batching is disabled, all commands are executed immediately.
+    """
+
+    def __init__(self, tk_app, enabled: bool = True):
+        self.__tk = tk_app
+        self.__enabled = enabled
+        self.__commands: list[str] = []
+        # Callbacks to run after evaluation of commands, with indices of commands they follow
+        self.__after_flush: list[tuple[int, Callable]] = []
+
+    def add(self, *words):
+        """Adds a command to the batch."""
+        if self.__enabled:
+            self.__commands.append(' '.join(map(_stringify, words)))
+        else:
+            self.__tk.call(*words)
+
+    def call(self, *words):
+        """Evaluates all pending commands and then the given one, returns result of the latter."""
+        self.flush()
+        return self.__tk.call(*words)
+
+    def flush(self):
+        """Evaluates all pending commands.
+
+        If some commands fail, the rest of commands are still evaluated.
+
+        :raises TclError: error of the first failed command
+        """
+        commands = self.__commands
+        after_flush = self.__after_flush
+        self.__commands = []
+        self.__after_flush = []
+        error = None
+
+        while commands:
+            failed = self.__evaluate(commands)
+
+            if failed is None:
+                failed = len(commands)
+            elif error is None:
+                error = tk.TclError(self.__tk.call('set', '::turbosnake_batch_error'))
+
+            # Callbacks of the failed command and commands after it are not called, as the commands were not evaluated
+            for index, callback in after_flush:
+                if index < failed:
+                    callback()
+
+            commands = commands[failed + 1:]
+            after_flush = [(index - failed - 1, callback) for index, callback in after_flush if index > failed]
+
+        if error is not None:
+            raise error
+
+    def __evaluate(self, commands: list[str]) -> Optional[int]:
+        # Evaluates commands as a single script, returns index of the failed command or `None` if none failed.
+        # Tcl stops evaluation of a script at the first failed command.
+        tk_app = self.__tk
+
+        if not int(tk_app.call('catch', '\n'.join(commands), '::turbosnake_batch_error', '::turbosnake_batch_options')):
+            return None
+
+        error_line = int(tk_app.call('dict', 'get', tk_app.call('set', '::turbosnake_batch_options'), '-errorline'))
+
+        # Words of a command may contain line breaks, so find the command that starts at or before the failed line
+        start_lines = []
+        line = 1
+
+        for command in commands:
+            start_lines.append(line)
+            line += command.count('\n') + 1
+
+        return max(bisect_right(start_lines, error_line) - 1, 0)
+
+    def configure(self, widget: tk.Misc, options: dict):
+        if options:
+            self.add(widget._w, 'configure', *widget._options(options))
+
+    def pack(self, widget: tk.Misc, options: dict):
+        self.add('pack', 'configure', widget._w, *widget._options(options))
+
+    def grid(self, widget: tk.Misc, options: dict):
+        self.add('grid', 'configure', widget._w, *widget._options(options))
+
+    def place(self, widget: tk.Misc, options: dict):
+        self.add('place', 'configure', widget._w, *widget._options(options))
+
+    def grid_rowconfigure(self, widget: tk.Misc, index: int, options: dict):
+        self.add('grid', 'rowconfigure', widget._w, index, *widget._options(options))
+
+    def grid_columnconfigure(self, widget: tk.Misc, index: int, options: dict):
+        self.add('grid', 'columnconfigure', widget._w, index, *widget._options(options))
+
+    def notebook_insert(self, notebook: tk.Misc, position: int, widget: tk.Misc, options: dict):
+        """Adds the widget as a tab of the notebook or moves it's tab to given position."""
+        self.add(notebook._w, 'insert', position, widget._w, *notebook._options(options))
+
+    def notebook_tab(self, notebook: tk.Misc, widget: tk.Misc, options: dict):
+        self.add(notebook._w, 'tab', widget._w, *notebook._options(options))
+
+    def notebook_select(self, notebook: tk.Misc, widget: tk.Misc):
+        self.add(notebook._w, 'select', widget._w)
+
+    def forget(self, *widgets: tk.Misc, managers: Iterable[str] = GEOMETRY_MANAGERS):
+        """Makes widgets unmanaged by given geometry managers (all of pack, grid and place by default)."""
+        paths = [widget._w for widget in widgets]
+
+        for manager in managers:
+            self.add(manager, 'forget', *paths)
+
+    def destroy(self, widget: tk.Misc):
+        """Destroys the widget and all it's descendants with a single Tcl command."""
+        if not self.__enabled:
+            widget.destroy()
+            return
+
+        self.add('destroy', widget._w)
+        self.__after_flush.append((len(self.__commands) - 1, partial(_forget_destroyed_widget, widget)))
@@ -0,0 +1,288 @@
+import tkinter as tk
+from itertools import count
+from typing import Optional, Iterable, Union, Literal, Any
+
+from turbosnake import Component, component
+from turbosnake.ttk._core import TkBase
+
+"""
+_canvas.py
+
+Contains components for items of tk canvas.
+
+Canvas items are not widgets, they are created, changed and deleted using commands of canvas widget.
+Every item component creates a single item identified by a unique tag.
+All changes are sent through tree's Tcl command batch, so the canvas is redrawn once per task processing pass.
+"""
+
+_tag_counter = count()
+
+Coords = Iterable[Union[float, Iterable[float]]]
+
+
+def _flatten_coords(coords: Coords) -> tuple:
+    flat = []
+
+    for c in coords:
+        if isinstance(c, (int, float)):
+            flat.append(c)
+        else:
+            flat.extend(c)
+
+    return tuple(flat)
+
+
+class CanvasItemStack:
+    """Keeps stacking order of canvas items in sync with order of item components in the tree."""
+    __slots__ = ('canvas', '_stacked', '_has_removed', '_restack_requested')
+
+    def __init__(self, canvas: TkBase):
+        self.canvas = canvas
+        # Items in their current stacking order, bottom first
+        self._stacked: list['TkCanvasItem'] = []
+        self._has_removed = False
+        self._restack_requested = False
+
+    def get_items(self) -> list['TkCanvasItem']:
+        """Returns item components of the canvas in order they appear in the tree."""
+        return [
+            c
+            for c in self.canvas.first_matching_descendants(lambda c: isinstance(c, (TkCanvasItem, TkBase)))
+            if isinstance(c, TkCanvasItem)
+        ]
+
+    def on_item_created(self, item: 'TkCanvasItem'):
+        # New items are placed on top of all other items
+        self._stacked.append(item)
+        self._schedule_restack()
+
+    def on_item_deleted(self, item: 'TkCanvasItem'):
+        self._has_removed = True
+
+    def on_items_reordered(self):
+        self._schedule_restack()
+
+    def _schedule_restack(self):
+        if not self._restack_requested:
+            self._restack_requested = True
+            self.canvas.tree.enqueue_task('layout', self._restack)
+
+    def _restack(self):
+        self._restack_requested = False
+
+        if not self.canvas.is_mounted():
+            return
+
+        items = self.get_items()
+
+        if self._has_removed:
+            self._stacked = [item for item in self._stacked if item.is_mounted()]
+            self._has_removed = False
+
+        stacked = self._stacked
+        batch = self.canvas.tree.tcl_batch
+        path = self.canvas.widget._w
+
+        for i, item in enumerate(items):
+            if i < len(stacked) and stacked[i] is item:
+                continue
+
+            stacked.remove(item)
+            stacked.insert(i, item)
+
+            if i > 0:
+                batch.add(path, 'raise', item.tag, items[i - 1].tag)
+            elif len(stacked) > 1:
+                batch.add(path, 'lower', item.tag, stacked[1].tag)
+
+
+class TkCanvasItem(Component):
+    """Base class for components of canvas items.
+
+    Item coordinates are taken from `coords` property, item options are taken from properties listed in `ITEM_OPTIONS`
+    with their default values. `None` property values are replaced by defaults.
+    """
+
+    # Type of canvas item, as accepted by canvas' `create` command
+    canvas_item_type: str
+
+    ITEM_OPTIONS: dict[str, Any] = {}
+
+    def get_canvas(self) -> TkBase:
+        canvas = self.first_matching_ascendant(TkBase.__instancecheck__)
+
+        assert hasattr(canvas, 'canvas_items'), 'Canvas items must be mounted under canvas component'
+
+        return canvas
+
+    def get_item_options(self) -> dict:
+        props = self.props
+        options = {}
+
+        for name, default in self.ITEM_OPTIONS.items():
+            value = props.get(name, None)
+            options[name] = default if value is None else value
+
+        return options
+
+    def mount(self, parent):
+        super().mount(parent)
+
+        canvas = self.get_canvas()
+        widget: tk.Canvas = canvas.widget
+        self.canvas = canvas
+        self.tag = f'_ts{next(_tag_counter)}'
+        self.__coords = coords = _flatten_coords(self.props['coords'])
+        self.__options = options = self.get_item_options()
+
+        # Options equal to defaults are not sent on creation
+        defaults = self.ITEM_OPTIONS
+        create_options = {k: v for k, v in options.items() if defaults[k] != v}
+        create_options['tags'] = self.tag
+
+        canvas.tree.tcl_batch.add(
+            widget._w, 'create', self.canvas_item_type, *coords, *widget._options(create_options)
+        )
+        canvas.canvas_items.on_item_created(self)
+
+    def update(self):
+        super().update()
+
+        widget: tk.Canvas = self.canvas.widget
+        batch = self.canvas.tree.tcl_batch
+
+        coords = _flatten_coords(self.props['coords'])
+
+        if coords != self.__coords:
+            self.__coords = coords
+            batch.add(widget._w, 'coords', self.tag, *coords)
+
+        applied = self.__options
+        delta = {k: v for k, v in self.get_item_options().items() if applied[k] != v}
+
+        if delta:
+            applied.update(delta)
+            batch.add(widget._w, 'itemconfigure', self.tag, *widget._options(delta))
+
+    def unmount(self):
+        canvas = self.canvas
+
+        # Items of canvas being unmounted are deleted together with the canvas widget
+        if not canvas.tk_subtree_unmounting:
+            canvas.tree.tcl_batch.add(canvas.widget._w, 'delete', self.tag)
+            canvas.canvas_items.on_item_deleted(self)
+
+        super().unmount()
+
+        del self.canvas
+
+
+class TkCanvasRectangle(TkCanvasItem):
+    canvas_item_type = 'rectangle'
+    ITEM_OPTIONS = dict(fill='', outline='black', width=1.0, dash='', state='')
+
+
+@component(TkCanvasRectangle)
+def tk_canvas_rect(
+        *,
+        coords: Coords,
+        fill: Optional[str],
+        outline: Optional[str],
+        width: Optional[float],
+        dash: Optional[str],
+        state: Optional[Literal['normal', 'disabled', 'hidden']],
+        **_):
+    ...
+
+
+class TkCanvasOval(TkCanvasItem):
+    canvas_item_type = 'oval'
+    ITEM_OPTIONS = dict(fill='', outline='black', width=1.0, dash='', state='')
+
+
+@component(TkCanvasOval)
+def tk_canvas_oval(
+        *,
+        coords: Coords,
+        fill: Optional[str],
+        outline: Optional[str],
+        width: Optional[float],
+        dash: Optional[str],
+        state: Optional[Literal['normal', 'disabled', 'hidden']],
+        **_):
+    ...
+
+
+class TkCanvasLine(TkCanvasItem):
+    canvas_item_type = 'line'
+    ITEM_OPTIONS = dict(fill='black', width=1.0, dash='', arrow='none', capstyle='butt', smooth=0, state='')
+
+
+@component(TkCanvasLine)
+def tk_canvas_line(
+        *,
+        coords: Coords,
+        fill: Optional[str],
+        width: Optional[float],
+        dash: Optional[str],
+        arrow: Optional[Literal['none', 'first', 'last', 'both']],
+        capstyle: Optional[Literal['butt', 'projecting', 'round']],
+        smooth: Optional[bool],
+        state: Optional[Literal['normal', 'disabled', 'hidden']],
+        **_):
+    ...
+
+
+class TkCanvasPolygon(TkCanvasItem):
+    canvas_item_type = 'polygon'
+    ITEM_OPTIONS = dict(fill='black', outline='', width=1.0, dash='', smooth=0, state='')
+
+
+@component(TkCanvasPolygon)
+def tk_canvas_polygon(
+        *,
+        coords: Coords,
+        fill: Optional[str],
+        outline: Optional[str],
+        width: Optional[float],
+        dash: Optional[str],
+        smooth: Optional[bool],
+        state: Optional[Literal['normal', 'disabled', 'hidden']],
+        **_):
+    ...
+
+
+class TkCanvasText(TkCanvasItem):
+    canvas_item_type = 'text'
+    ITEM_OPTIONS = dict(text='', fill='black', font='TkDefaultFont', anchor='center', justify='left', width=0, state='')
+
+
+@component(TkCanvasText)
+def tk_canvas_text(
+        *,
+        coords: Coords,
+        text: str,
+        fill: Optional[str],
+        font: Optional[Any],
+        anchor: Optional[str],
+        justify: Optional[Literal['left', 'right', 'center']],
+        width: Optional[float],
+        state: Optional[Literal['normal', 'disabled', 'hidden']],
+        **_):
+    ...
+
+
+class TkCanvasImage(TkCanvasItem):
+    canvas_item_type = 'image'
+    ITEM_OPTIONS = dict(image='', anchor='center', state='')
+
+
+@component(TkCanvasImage)
+def tk_canvas_image(
+        *,
+        coords: Coords,
+        image: Any,
+        anchor: Optional[str],
+        state: Optional[Literal['normal', 'disabled', 'hidden']],
+        **_):
+    ...
@@ -5,11 +5,16 @@ import traceback
 from abc import abstractmethod, ABCMeta, ABC
 from functools import cache
 from tkinter.ttk import Style
-from typing import Optional, Generator
+from typing import Optional, Iterator
+from weakref import WeakSet
 
 from turbosnake import Component, Tree
+from turbosnake._components import sort_in_document_order
+from turbosnake._utils import get_component_class
 from turbosnake._utils0 import create_daemon_event_loop
+from turbosnake.ttk._batch import TclCommandBatch
 from turbosnake.ttk._layout import get_layout_manager_class, DEFAULT_LAYOUT_MANAGER, LayoutManagerABC
+from turbosnake.ttk._pool import WidgetPool
 
 """
 _core.py
@@ -18,7 +23,90 @@ Contains basic low-level parts of turbosnake-ttk adapter.
 """
 
 
+# Default values of widget options by widget class and option name
+_option_defaults: dict[tuple[type, str], object] = {}
+
+
+def get_option_default(widget: tk.Misc, name: str):
+    """Returns default value of given option of the widget."""
+    key = (type(widget), name)
+
+    try:
+        return _option_defaults[key]
+    except KeyError:
+        pass
+
+    description = widget.tk.splitlist(widget.tk.call(widget._w, 'configure', '-' + name))
+
+    if len(description) == 2:
+        # Description of an alias (e.g. "-bd -borderwidth") contains only the name of the option it stands for
+        default = get_option_default(widget, str(description[1]).lstrip('-'))
+    else:
+        # Fourth item of option description is it's default value
+        default = description[3]
+
+    _option_defaults[key] = default
+    return default
+
+
+class TkChildrenIndex:
+    """Ordered collection of tk components whose closest tk ascendant is given tree or tk component.
+
+    Membership is maintained as children are mounted and unmounted.
+    Order of children is restored lazily, when the children are requested after new children were mounted or existing
+    ones were moved, by sorting them in document order.
+    """
+    __slots__ = ('owner', '_members', '_ordered', '_has_removed')
+
+    def __init__(self, owner):
+        self.owner = owner
+        self._members: dict['TkComponent', None] = {}
+        # Members in document order, may also contain removed children if `_has_removed` is set
+        self._ordered: Optional[list['TkComponent']] = []
+        self._has_removed = False
+
+    def add(self, child: 'TkComponent'):
+        self._members[child] = None
+        self._ordered = None
+
+    def remove(self, child: 'TkComponent'):
+        if self._members.pop(child, 0) is None:
+            if self._members:
+                self._has_removed = True
+            else:
+                # Don't keep the last removed children until the next iteration
+                self._ordered = []
+                self._has_removed = False
+
+    def invalidate_order(self):
+        if len(self._members) > 1:
+            self._ordered = None
+
+    def __iter__(self):
+        ordered = self._ordered
+        members = self._members
+
+        if ordered is None:
+            self._ordered = ordered = sort_in_document_order(members, self.owner)
+        elif self._has_removed:
+            self._ordered = ordered = [child for child in ordered if child in members]
+
+        self._has_removed = False
+
+        return iter(ordered)
+
+    def __len__(self):
+        return len(self._members)
+
+
 class TkBase(metaclass=ABCMeta):
+    tk_children: TkChildrenIndex
+
+    # Set while this component and all it's descendants are being unmounted.
+    # Descendants of such component don't have to notify it about their unmount or destroy their widgets as the widgets
+    # are destroyed together with widget of this component.
+    tk_subtree_unmounting: bool = False
+
     @property
     @abstractmethod
     def widget(self) -> tk.BaseWidget:
@@ -34,17 +122,24 @@ class TkBase(metaclass=ABCMeta):
         ...
 
     def on_tk_child_mounted(self, child):
-        ...
+        if not child.tk_ignore_subtree:
+            self.tk_children.add(child)
 
     def on_tk_child_updated(self, child):
         ...
 
     def on_tk_child_unmounted(self, child):
-        ...
+        self.tk_children.remove(child)
 
-    @abstractmethod
-    def get_tk_children(self) -> Generator['TkComponent', None, None]:
-        ...
+    def on_descendants_reordered(self):
+        self.tk_children.invalidate_order()
+
+    def get_tk_children(self) -> Iterator['TkComponent']:
+        """Returns iterator over tk children of this component in order they appear in the tree.
+
+        Components that have `tk_ignore_subtree` flag are not included.
+        """
+        return iter(self.tk_children)
 
 
 class TkContainerBase(TkBase, ABC):
@@ -81,11 +176,9 @@ class TkContainerBase(TkBase, ABC):
         super().on_tk_child_unmounted(child)
         self._layout_manager.on_child_removed(child)
 
-
-def _get_tk_children(component: Component) -> Generator['TkComponent', None, None]:
-    for child in component.first_matching_descendants(TkComponent.__instancecheck__):
-        if not child.tk_ignore_subtree:
-            yield child
+    def on_descendants_reordered(self):
+        super().on_descendants_reordered()
+        self._layout_manager.on_children_reordered()
 
 
 def configure_window(
@@ -117,14 +210,36 @@ class TkTree(Tree, TkContainerBase, TkBase):
     def get_window(self):
         return self
 
-    def __init__(self, widget=None, event_loop_factory=create_daemon_event_loop, **options):
+    def __init__(
+            self,
+            widget=None,
+            event_loop_factory=create_daemon_event_loop,
+            widget_pool_limit=0,
+            widget_pool_total_limit=256,
+            batch_tcl_commands=True,
+            **options
+    ):
+        """
+        :param widget_pool_limit: maximal number of widgets of unmounted recyclable components kept for reuse per
+                                  (component class, parent widget) pair; widget recycling is disabled when it's zero
+        :param widget_pool_total_limit: maximal number of widgets kept for reuse in total; when it's reached, the
+                                        widget parked earliest is destroyed to make room for a new one
+        :param batch_tcl_commands: whenever widget changes made by components should be sent to Tcl interpreter as a
+                                   single script at the end of each task processing pass
+        """
         super().__init__(queues=(*super().TASK_QUEUES, 'layout', 'layout_effect'))
 
         self.__widget = widget or tk.Tk()
+        self.tk_children = TkChildrenIndex(self)
+        self.__tcl_batch = TclCommandBatch(self.__widget.tk, enabled=batch_tcl_commands)
         configure_window(self.__widget, **options)
         self.init_container(**options)
 
         self.__style_db = Style(self.__widget)
+        self.__widget_pool = WidgetPool(widget_pool_limit, widget_pool_total_limit, self.__tcl_batch.destroy)
+
+        # Dynamic styles that have configured some ttk styles in this tree
+        self.dynamic_styles: WeakSet = WeakSet()
 
         self.__event_loop_factory = event_loop_factory
 
@@ -148,16 +263,62 @@ class TkTree(Tree, TkContainerBase, TkBase):
     def style_db(self) -> Style:
         return self.__style_db
 
+    @property
+    def tcl_batch(self) -> TclCommandBatch:
+        """Batch of Tcl commands that is evaluated at the end of each task processing pass."""
+        return self.__tcl_batch
+
+    def on_tasks_processed(self):
+        super().on_tasks_processed()
+
+        try:
+            self.__tcl_batch.flush()
+        except tk.TclError as e:
+            # The batch is flushed outside of tasks, so it's errors are handled here
+            self.handle_error(e, 'tcl_batch', self.__tcl_batch.flush)
+
+    @property
+    def widget_pool(self) -> WidgetPool:
+        return self.__widget_pool
+
+    def prewarm_widgets(self, component, tk_parent: TkBase, count: int):
+        """Creates up to `count` widgets for recyclable components of given type mounted under given parent during
+        idle time.
+
+        :param component: recyclable component class or inserter
+        :param tk_parent: tree or tk component the widgets will be created in
+        """
+        component_class = get_component_class(component)
+
+        assert component_class.tk_recyclable, f'{component_class.__name__} is not recyclable'
+
+        self.__widget_pool.prewarm(component_class, tk_parent.widget, count, self.__widget.after_idle)
+
     def handle_error(self, error, queue_name, task):
         traceback.print_exc()
         # TODO: Do something smarter with exceptions...
         sys.exit(1)
 
-    def get_tk_children(self):
-        if isinstance(self.root, TkComponent):
-            yield self.root
-        else:
-            yield from _get_tk_children(self.root)
+    def on_descendants_reordered(self):
+        TkContainerBase.on_descendants_reordered(self)
+
+    def census(self) -> dict:
+        """Counts objects held by this tree.
+
+        In addition to entries collected by `Tree.census`, returned dictionary contains:
+        - `styles` - names of ttk styles configured by dynamic styles, including unused ones waiting for cleanup
+        - `widget_pool` - number of widgets parked in widget pool
+        """
+        census = super().census()
+        style_db = self.__style_db
+        census['styles'] = sorted(
+            name
+            for dynamic_style in self.dynamic_styles
+            for name in dynamic_style.get_style_names(style_db)
+        )
+        census['widget_pool'] = len(self.__widget_pool)
+
+        return census
 
     def main_loop(self):
         self.__widget.mainloop()
@@ -166,6 +327,11 @@ class TkTree(Tree, TkContainerBase, TkBase):
 class TkComponent(Component, TkBase):
     tk_ignore_subtree: bool = False
 
+    # Whenever widgets of this component may be kept in tree's widget pool after unmount and reused by other instances
+    # of the same class.
+    # Recyclable components must implement `create_blank_widget` and `reuse_widget`.
+    tk_recyclable: bool = False
+
     @property
     def widget(self) -> tk.Widget:
         return self.__widget
@@ -182,38 +348,109 @@ class TkComponent(Component, TkBase):
         tk_parent: TkBase = self.get_tk_parent()
 
         self.tk_parent = tk_parent
+        self.tk_children = TkChildrenIndex(self)
         self.__widget: Optional[tk.Widget] = None
         self._create_and_configure_widget()
         tk_parent.on_tk_child_mounted(self)
 
     def unmount(self):
-        self.tk_parent.on_tk_child_unmounted(self)
+        tk_parent = self.tk_parent
+        destroyed_with_parent = tk_parent.tk_subtree_unmounting
+
+        if not destroyed_with_parent:
+            tk_parent.on_tk_child_unmounted(self)
+
+        self.tk_subtree_unmounting = True
+
+        tree = self.tree
 
         super().unmount()
 
-        if self.__widget:
-            self.__widget.destroy()
+        widget = self.__widget
+
+        if widget:
+            pool = tree.widget_pool
+            pool.discard_parent(widget)
 
+            # Recyclable components don't have tk children, so it's safe to park widget of a component whose
+            # descendants have skipped destruction of their widgets
+            if not destroyed_with_parent and \
+                    not (self.tk_recyclable and pool.park(self.__class__, tk_parent.widget, widget, self.reset_widget)):
+                tree.tcl_batch.destroy(widget)
+
+        del self.tk_subtree_unmounting
         del self.tk_parent
+        del self.tk_children
         del self.__widget
+        del self.__applied_config
 
     def get_tk_parent(self) -> TkBase:
-        return self.first_matching_ascendant(TkBase.__instancecheck__)
+        parent = self.parent
+
+        if isinstance(parent, TkBase):
+            return parent
+
+        return parent.first_matching_ascendant(TkBase.__instancecheck__)
 
-    def get_tk_children(self) -> Generator['TkComponent', None, None]:
-        return _get_tk_children(self)
+    def on_descendants_reordered(self):
+        # Order of descendants matters only for this component, not for it's tk parent
+        TkBase.on_descendants_reordered(self)
 
     def _create_and_configure_widget(self):
         if self.__widget:
-            self.__widget.destroy()
+            self.tree.tcl_batch.destroy(self.__widget)
+
+        widget = None
+
+        if self.tk_recyclable:
+            widget = self.tree.widget_pool.take(self.__class__, self.tk_parent.widget)
+
+            if widget:
+                self.reuse_widget(widget)
+
+        if not widget:
+            widget = self.create_widget(self.tk_parent.widget)
 
-        widget = self.create_widget(self.tk_parent.widget)
         self.__widget = widget
 
+        self.reset_applied_config()
         self.configure_widget(widget)
 
+    def reset_applied_config(self):
+        """Forgets widget configuration applied earlier, so the next `configure_widget` call sends all the options.
+
+        Must be called whenever the widget is re-created or its options are changed bypassing `configure_widget`.
+        """
+        self.__applied_config = {}
+
     def configure_widget(self, widget):
-        widget.config(**self.get_widget_config(**self.props))
+        """Sends to the widget the options returned by `get_widget_config` that have changed since the last call.
+
+        Options changed to `None` are reset to their defaults.
+        """
+        applied = self.__applied_config
+        changed = {}
+
+        for name, value in self.get_widget_config(**self.props).items():
+            try:
+                previous = applied[name]
+            except KeyError:
+                pass
+            else:
+                if previous == value:
+                    continue
+
+                if value is None and previous is not None:
+                    # tkinter drops options with `None` values
+                    changed[name] = get_option_default(widget, name)
+                    applied[name] = None
+                    continue
+
+            changed[name] = value
+            applied[name] = value
+
+        if changed:
+            self.tree.tcl_batch.configure(widget, changed)
 
     def update(self):
         super().update()
@@ -226,8 +463,42 @@ class TkComponent(Component, TkBase):
     def create_widget(self, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
         ...
 
+    @classmethod
+    def create_blank_widget(cls, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
+        """Creates a widget not bound to any component instance.
+
+        Used to pre-warm widget pool for recyclable components.
+        """
+        raise NotImplementedError(f'{cls.__name__} does not support creation of blank widgets')
+
+    def reuse_widget(self, widget: tk.BaseWidget):
+        """Called when a pooled widget is handed to this component instead of one created by `create_widget`.
+
+        Must bind to this component everything `create_widget` binds to component instance.
+        Commands changing the widget must be sent through `tree.tcl_batch`, as commands resetting it may be still
+        pending.
+        """
+        ...
+
+    def reset_widget(self, widget: tk.BaseWidget):
+        """Prepares widget of unmounted component to be parked in widget pool.
+
+        Resets options configured by this component, so the next owner doesn't inherit options it doesn't set.
+        """
+        batch = self.tk_parent.tree.tcl_batch
+        batch.forget(widget)
+        batch.configure(widget, {
+            name: get_option_default(widget, name)
+            for name, value in self.__applied_config.items()
+            if value is not None
+        })
+
     def get_widget_config(self, **props):
         return {}
 
     def get_window(self):
         return self.tk_parent.get_window()
+
+    def get_owned_objects(self):
+        yield from super().get_owned_objects()
+        yield self.__widget
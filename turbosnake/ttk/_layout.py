@@ -5,7 +5,7 @@ from turbosnake._utils0 import have_differences_by_keys
 
 
 class LayoutManagerABC(metaclass=ABCMeta):
-    __slots__ = ('container', 'settings', 'active')
+    __slots__ = ('container', 'settings', 'active', 'batch')
     SELF_LAYOUT_PROPS = ()
     CHILD_LAYOUT_PROPS = ()
 
@@ -13,6 +13,7 @@ class LayoutManagerABC(metaclass=ABCMeta):
         self.container = container
         self.settings = settings
         self.active = True
+        self.batch = container.tree.tcl_batch
 
     @abstractmethod
     def on_child_added(self, child):
@@ -29,6 +30,9 @@ class LayoutManagerABC(metaclass=ABCMeta):
     def on_child_removed(self, child):
         ...
 
+    def on_children_reordered(self):
+        ...
+
     def on_update_settings(self, new_settings: dict):
         changed = have_differences_by_keys(self.settings, new_settings, self.SELF_LAYOUT_PROPS)
         self.settings = new_settings
@@ -43,49 +47,85 @@ class LayoutManagerABC(metaclass=ABCMeta):
         self.active = False
 
 
+def _get_place_axis_options(child_props: dict, abs_prop: str, rel_prop: str, default) -> tuple:
+    """Returns absolute and relative `place` options for one of child's coordinates or dimensions.
+
+    Exactly one of the options is set from child props, the other one is reset to `default`.
+    """
+    if rel_prop in child_props:
+        assert abs_prop not in child_props, f"At most one of '{abs_prop}' and '{rel_prop}' must be set on " \
+                                            f"this component but both are present"
+
+        return default, child_props[rel_prop]
+    elif abs_prop in child_props:
+        abs_val = child_props[abs_prop]
+
+        if isinstance(abs_val, str) and abs_val.endswith('%'):
+            return default, float(abs_val[:-1]) * 0.01
+        elif isinstance(abs_val, float):
+            return default, abs_val
+        else:
+            return abs_val, default
+
+    return default, default
+
+
 class PlaceLayoutManager(LayoutManagerABC):
+    """Layout manager that places children at given positions.
+
+    Children with changed layout properties are re-configured with changed options only.
+    When only position of a child changes (e.g. when it is dragged or animated) only the position options are
+    re-calculated.
+    """
+    __slots__ = ('_applied',)
+
     CHILD_LAYOUT_PROPS = ('x', 'y', 'relx', 'rely', 'width', 'relwidth', 'height', 'relheight', 'anchor')
     SELF_LAYOUT_PROPS = ('default_anchor',)
+    CHILD_POSITION_PROPS = ('x', 'y')
+    CHILD_NON_POSITION_PROPS = ('relx', 'rely', 'width', 'relwidth', 'height', 'relheight', 'anchor')
 
     def __init__(self, container, settings):
         super().__init__(container, settings)
+        # Place options last applied to each of children
+        self._applied = {}
 
-    def on_child_added(self, child):
-        child_props = child.props
-        own_props = self.settings
-        place_options = {}
-
-        if 'anchor' in child_props:
-            place_options['anchor'] = child_props['anchor']
-        elif 'default_anchor' in own_props:
-            place_options['anchor'] = own_props['default_anchor']
+    @staticmethod
+    def _get_position_options(child_props: dict) -> dict:
+        x, relx = _get_place_axis_options(child_props, 'x', 'relx', 0)
+        y, rely = _get_place_axis_options(child_props, 'y', 'rely', 0)
+        return dict(x=x, relx=relx, y=y, rely=rely)
 
-        def relative_or_absolute_option(abs_prop: str, rel_prop: str):
-            if rel_prop in child_props:
-                assert abs_prop not in child_props, f"At most one of '{abs_prop}' and '{rel_prop}' must be set on " \
-                                                    f"this component but both are present"
+    def _get_place_options(self, child) -> dict:
+        child_props = child.props
+        options = self._get_position_options(child_props)
+        options['width'], options['relwidth'] = _get_place_axis_options(child_props, 'width', 'relwidth', '')
+        options['height'], options['relheight'] = _get_place_axis_options(child_props, 'height', 'relheight', '')
+        options['anchor'] = child_props.get('anchor', self.settings.get('default_anchor', 'nw'))
+        return options
 
-                place_options[rel_prop] = child_props[rel_prop]
-            elif abs_prop in child_props:
-                abs_val = child_props[abs_prop]
+    def _apply_options(self, child, options: dict):
+        applied = self._applied[child]
+        delta = {k: v for k, v in options.items() if applied[k] != v}
 
-                if isinstance(abs_val, str) and abs_val.endswith('%'):
-                    place_options[rel_prop] = float(abs_val[:-1]) * 0.01
-                elif isinstance(abs_val, float):
-                    place_options[rel_prop] = abs_val
-                else:
-                    place_options[abs_prop] = abs_val
+        if delta:
+            applied.update(delta)
+            self.batch.place(child.widget, delta)
 
-        relative_or_absolute_option('x', 'relx')
-        relative_or_absolute_option('y', 'rely')
-        relative_or_absolute_option('width', 'relwidth')
-        relative_or_absolute_option('height', 'relheight')
+    def on_child_added(self, child):
+        self._applied[child] = options = self._get_place_options(child)
+        self.batch.place(child.widget, options)
 
-        child.widget.place(cnf=place_options)
+    def on_child_updated(self, child):
+        if child.has_props_changed(self.CHILD_NON_POSITION_PROPS):
+            self.on_child_layout_props_changed(child)
+        elif child.has_props_changed(self.CHILD_POSITION_PROPS):
+            self._apply_options(child, self._get_position_options(child.props))
 
     def on_child_layout_props_changed(self, child):
-        child.widget.place_forget()
-        self.on_child_added(child)
+        self._apply_options(child, self._get_place_options(child))
+
+    def on_child_removed(self, child):
+        self._applied.pop(child, None)
 
     def on_own_layout_props_changed(self):
         for child in self.container.get_tk_children():
@@ -93,7 +133,13 @@ class PlaceLayoutManager(LayoutManagerABC):
 
 
 class PackLayoutManager(LayoutManagerABC):
-    __slots__ = ('_repack_requested',)
+    """Layout manager that packs children in order they appear in the tree.
+
+    Children are packed incrementally: new and moved children are inserted in place using `-before`/`-after` options
+    and children with changed layout properties are re-configured with changed options only.
+    All children are re-packed only when settings of the container change.
+    """
+    __slots__ = ('_repack_requested', '_full_repack_requested', '_packed', '_applied', '_changed', '_removed')
 
     CHILD_LAYOUT_PROPS = ('side', 'px', 'py', 'expand', 'fill', 'anchor')
     SELF_LAYOUT_PROPS = ('default_side',)
@@ -101,28 +147,104 @@ class PackLayoutManager(LayoutManagerABC):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self._repack_requested = False
-
-    def _pack_child(self, child):
+        self._full_repack_requested = False
+        # Children in order they are packed in
+        self._packed = []
+        # Pack options last applied to each of packed children
+        self._applied = {}
+        # Packed children whose layout properties have changed since last repack
+        self._changed = set()
+        # True iff some packed children were removed since last repack
+        self._removed = False
+
+    def _get_pack_options(self, child) -> dict:
         p = self.settings
         cp = child.props
-        child.widget.pack(
+        return dict(
             side=cp.get('side', p.get('default_side', 'top')),
             padx=cp.get('px', 0),
             pady=cp.get('py', 0),
             expand=cp.get('expand', False),
-            fill=cp.get('fill', None),
-            anchor=cp.get('anchor', None)
+            fill=cp.get('fill', None) or 'none',
+            anchor=cp.get('anchor', None) or 'center',
         )
 
+    def _repack_all(self, children):
+        prev_applied = self._applied
+        packed = [child for child in self._packed if child in prev_applied]
+
+        if packed:
+            self.batch.forget(*(child.widget for child in packed), managers=('pack',))
+
+        applied = {}
+
+        for child in children:
+            applied[child] = options = self._get_pack_options(child)
+            self.batch.pack(child.widget, options)
+
+        self._packed = children
+        self._applied = applied
+
+    def _repack_incrementally(self, children):
+        applied = self._applied
+        changed = self._changed
+
+        if self._removed:
+            self._packed = [child for child in self._packed if child in applied]
+
+        packed = self._packed
+
+        for i, child in enumerate(children):
+            if i < len(packed) and packed[i] is child:
+                if child in changed:
+                    prev_options = applied[child]
+                    applied[child] = options = self._get_pack_options(child)
+                    delta = {k: v for k, v in options.items() if prev_options[k] != v}
+
+                    if delta:
+                        self.batch.pack(child.widget, delta)
+
+                continue
+
+            options = self._get_pack_options(child)
+
+            try:
+                prev_options = applied[child]
+            except KeyError:
+                pack_options = dict(options)
+            else:
+                packed.remove(child)
+                pack_options = {k: v for k, v in options.items() if prev_options[k] != v}
+
+            if i > 0:
+                pack_options['after'] = children[i - 1].widget
+            elif packed:
+                pack_options['before'] = packed[0].widget
+
+            packed.insert(i, child)
+            applied[child] = options
+            self.batch.pack(child.widget, pack_options)
+
+        for child in packed[len(children):]:
+            del applied[child]
+
+        del packed[len(children):]
+
     def _repack_children(self):
         if not self._repack_requested:
             return
 
-        for child in self.container.get_tk_children():
-            child.widget.pack_forget()
-            self._pack_child(child)
+        children = list(self.container.get_tk_children())
+
+        if self._full_repack_requested:
+            self._repack_all(children)
+        else:
+            self._repack_incrementally(children)
 
         self._repack_requested = False
+        self._full_repack_requested = False
+        self._changed = set()
+        self._removed = False
 
     def _schedule_repack(self):
         if not self._repack_requested:
@@ -133,45 +255,68 @@ class PackLayoutManager(LayoutManagerABC):
         self._schedule_repack()
 
     def on_child_layout_props_changed(self, child):
+        self._changed.add(child)
+        self._schedule_repack()
+
+    def on_child_removed(self, child):
+        if self._applied.pop(child, None) is not None:
+            if self._applied:
+                self._removed = True
+            else:
+                # Don't keep the last removed children until the next repack
+                self._packed = []
+                self._removed = False
+
+    def on_children_reordered(self):
         self._schedule_repack()
 
     def on_terminated(self):
         self._repack_requested = False
 
     def on_own_layout_props_changed(self):
+        self._full_repack_requested = True
         self._schedule_repack()
 
 
 class GridLayoutManager(LayoutManagerABC):
-    __slots__ = ('_row_count', '_column_count')
+    """Layout manager that places children in cells of a grid.
+
+    Only rows and columns whose weights, minimal sizes or pads have changed are re-configured and children with changed
+    layout properties are re-configured with changed options only.
+    """
+    __slots__ = ('_row_options', '_column_options', '_applied')
 
     CHILD_LAYOUT_PROPS = ('row', 'column', 'row_span', 'column_span', 'sticky')
     SELF_LAYOUT_PROPS = (
         'row_weights', 'row_min_sizes', 'row_pads', 'column_weights', 'column_min_sizes', 'column_pads'
     )
+    ROW_OR_COLUMN_OPTIONS = ('weight', 'minsize', 'pad')
 
     def __init__(self, container, settings):
         super().__init__(container, settings)
 
-        self._row_count = 0
-        self._column_count = 0
+        # (weight, minsize, pad) tuples last applied to each configured row and column
+        self._row_options = []
+        self._column_options = []
+        # Grid options last applied to each of children
+        self._applied = {}
         self._configure_rows_and_columns()
 
     def _configure_rows_and_columns(self):
-        widget = self.container.widget
-        self._row_count = self._configure_rows_or_columns(
-            widget.grid_rowconfigure,
+        batch = self.batch
+        self._row_options = self._configure_rows_or_columns(
+            batch.grid_rowconfigure,
             'row_weights',
             'row_min_sizes',
             'row_pads',
-            self._row_count
+            self._row_options
         )
-        self._column_count = self._configure_rows_or_columns(
-            widget.grid_columnconfigure,
+        self._column_options = self._configure_rows_or_columns(
+            batch.grid_columnconfigure,
             'column_weights',
             'column_min_sizes',
             'column_pads',
-            self._column_count
+            self._column_options
         )
 
     def _configure_rows_or_columns(
@@ -180,46 +325,154 @@ class GridLayoutManager(LayoutManagerABC):
             weights_prop: str,
             min_sizes_prop: str,
             pads_prop: str,
-            prev_count: int
-    ):
-        props = self.container.props
-        weights = props.get(weights_prop, ())
-        min_sizes = props.get(min_sizes_prop, ())
-        pads = props.get(pads_prop, ())
+            prev_options: list
+    ) -> list:
+        widget = self.container.widget
+        settings = self.settings
+        weights = tuple(settings.get(weights_prop, ()))
+        min_sizes = tuple(settings.get(min_sizes_prop, ()))
+        pads = tuple(settings.get(pads_prop, ()))
 
         new_count = max(len(weights), len(min_sizes), len(pads))
 
-        configure_count = max(prev_count, new_count)
+        configure_count = max(len(prev_options), new_count)
         zeros = (0,) * configure_count
-        weights += zeros
-        min_sizes += zeros
-        pads += zeros
+        default_options = (0, 0, 0)
+        new_options = []
+
+        for i, options in zip(range(configure_count), zip(weights + zeros, min_sizes + zeros, pads + zeros)):
+            prev = prev_options[i] if i < len(prev_options) else default_options
+
+            if options != prev:
+                method(widget, i, {
+                    name: value
+                    for name, value, prev_value in zip(self.ROW_OR_COLUMN_OPTIONS, options, prev)
+                    if value != prev_value
+                })
 
-        for (i, weight, min_size, pad) in zip(range(configure_count), weights, min_sizes, pads):
-            method(i, weight=weight, minsize=min_size, pad=pad)
+            if i < new_count:
+                new_options.append(options)
 
-        return new_count
+        return new_options
 
     def on_own_layout_props_changed(self):
         self._configure_rows_and_columns()
 
-    def on_child_added(self, child):
+    @staticmethod
+    def _get_grid_options(child) -> dict:
         child_props = child.props
-        grid_settings = {
+        return {
             'column': child_props.get('column', 0),
             'row': child_props.get('row', 0),
             'rowspan': child_props.get('row_span', 1),
-            'columnspan': child_props.get('column_span', 1)
+            'columnspan': child_props.get('column_span', 1),
+            'sticky': child_props.get('sticky', ''),
         }
 
-        if 'sticky' in child_props:
-            grid_settings['sticky'] = child_props['sticky']
+    def on_child_added(self, child):
+        self._applied[child] = options = self._get_grid_options(child)
+        self.batch.grid(child.widget, options)
+
+    def on_child_layout_props_changed(self, child):
+        prev_options = self._applied[child]
+        self._applied[child] = options = self._get_grid_options(child)
+        delta = {k: v for k, v in options.items() if prev_options[k] != v}
+
+        if delta:
+            self.batch.grid(child.widget, delta)
+
+    def on_child_removed(self, child):
+        self._applied.pop(child, None)
+
+
+class NotebookLayoutManager(LayoutManagerABC):
+    """Layout manager of notebooks that adds children as tabs of the notebook, in order they appear in the tree.
+
+    Tabs are synchronized in a single layout task after any changes: new and moved tabs are inserted in place and tabs
+    with changed options are re-configured with changed options only.
+    Tabs of removed children are removed by Tk when their widgets are destroyed.
+    After tabs are synchronized, container's `on_tabs_synchronized` is called with the list of tabs.
+    """
+    __slots__ = ('_sync_requested', '_tabs', '_applied')
+
+    CHILD_LAYOUT_PROPS = ('text', 'image', 'compound', 'underline', 'padding', 'sticky', 'disabled')
+
+    def __init__(self, container, settings):
+        super().__init__(container, settings)
+        self._sync_requested = False
+        # Children in order of their tabs
+        self._tabs = []
+        # Tab options last applied to each of children
+        self._applied = {}
+        self.schedule_sync()
+
+    @staticmethod
+    def _get_tab_options(child) -> dict:
+        cp = child.props
+        return dict(
+            text=cp.get('text', ''),
+            image=cp.get('image', None) or '',
+            compound=cp.get('compound', None) or 'none',
+            underline=cp.get('underline', -1),
+            padding=cp.get('padding', 0),
+            sticky=cp.get('sticky', 'nsew'),
+            state='disabled' if cp.get('disabled', False) else 'normal',
+        )
+
+    def _sync_tabs(self):
+        if not self._sync_requested:
+            return
+
+        self._sync_requested = False
+        notebook = self.container.widget
+        children = list(self.container.get_tk_children())
+        applied = self._applied
+        tabs = [child for child in self._tabs if child in applied]
+
+        for i, child in enumerate(children):
+            options = self._get_tab_options(child)
+
+            if i < len(tabs) and tabs[i] is child:
+                prev_options = applied[child]
+                delta = {k: v for k, v in options.items() if prev_options[k] != v}
+
+                if delta:
+                    self.batch.notebook_tab(notebook, child.widget, delta)
+            else:
+                if child in applied:
+                    tabs.remove(child)
 
-        child.widget.grid(grid_settings)
+                tabs.insert(i, child)
+                self.batch.notebook_insert(notebook, i, child.widget, options)
+
+            applied[child] = options
+
+        self._tabs = children
+        self.container.on_tabs_synchronized(children)
+
+    def schedule_sync(self):
+        if not self._sync_requested:
+            self._sync_requested = True
+            self.container.tree.enqueue_task('layout', self._sync_tabs)
+
+    def on_child_added(self, child):
+        self.schedule_sync()
 
     def on_child_layout_props_changed(self, child):
-        child.widget.grid_forget()
-        self.on_child_added(child)
+        self.schedule_sync()
+
+    def on_child_removed(self, child):
+        self._applied.pop(child, None)
+        self.schedule_sync()
+
+    def on_children_reordered(self):
+        self.schedule_sync()
+
+    def on_terminated(self):
+        super().on_terminated()
+        self._sync_requested = False
+        self._tabs = []
+        self._applied = {}
 
 
 DEFAULT_LAYOUT_MANAGER = 'pack'
@@ -228,9 +481,10 @@ NAMED_LAYOUT_MANAGERS: dict[str, Type[LayoutManagerABC]] = {
     'place': PlaceLayoutManager,
     'pack': PackLayoutManager,
     'grid': GridLayoutManager,
+    'notebook': NotebookLayoutManager,
 }
 
-LayoutManagerPropValue = Union[Literal['place', 'pack', 'grid'], Type[LayoutManagerABC]]
+LayoutManagerPropValue = Union[Literal['place', 'pack', 'grid', 'notebook'], Type[LayoutManagerABC]]
 
 
 def get_layout_manager_class(layout_manager: LayoutManagerPropValue) -> Type[LayoutManagerABC]:
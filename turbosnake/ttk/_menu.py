@@ -1,5 +1,5 @@
 import tkinter as tk
-from abc import abstractmethod, ABCMeta, ABC
+from abc import ABCMeta, ABC
 from typing import Optional, Callable, Any, Iterable
 
 from ._adapters import TkRadioGroup
@@ -21,11 +21,14 @@ So as menu-related components are that different from normal widgets they are pl
 class _TkMenuComponent(metaclass=ABCMeta):
     """Base class for things that may be added to menus."""
 
-    @abstractmethod
+    # Type of menu entry created for this component, one of types accepted by `add` method of `tk.Menu`
+    menu_item_type: str
+
     def add_to_menu(self, menu: tk.Menu):
-        ...
+        menu.add(self.menu_item_type, **self.get_menu_item_config())
 
-    def get_menu_item_config(self):
+    def get_menu_item_config(self) -> dict:
+        """Returns all options of menu entry of this component."""
         props = self.props
         return {
             'label': props['label'],
@@ -34,10 +37,18 @@ class _TkMenuComponent(metaclass=ABCMeta):
 
 
 class TkMenu(_TkMenuComponent, Wrapper, TkComponent):
+    """Menu component.
+
+    Entries of the menu are updated incrementally: only entries of added, removed or moved items are inserted or
+    deleted and entries of updated items are re-configured with changed options only.
+    """
     tk_ignore_subtree = True
+    menu_item_type = 'cascade'
 
-    def add_to_menu(self, menu: tk.Menu):
-        menu.add_cascade(menu=self.widget, **self.get_menu_item_config())
+    def get_menu_item_config(self) -> dict:
+        conf = super().get_menu_item_config()
+        conf['menu'] = self.widget
+        return conf
 
     def create_widget(self, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
         return tk.Menu(tk_parent)
@@ -54,11 +65,26 @@ class TkMenu(_TkMenuComponent, Wrapper, TkComponent):
         super().mount(parent)
 
         self.__layout_enqueued = False
+        # Menu items in order of their entries in the menu
+        self.__entries: list[_TkMenuComponent] = []
+        # Options last applied to entries of menu items
+        self.__entry_options: dict[_TkMenuComponent, dict] = {}
+        # Index of first entry of a menu item as of the last layout
+        self.__offset = 0
 
     def unmount(self):
         super().unmount()
 
         del self.__layout_enqueued
+        del self.__entries
+        del self.__entry_options
+        del self.__offset
+
+    def update(self):
+        super().update()
+
+        if self.has_props_changed(('tearoff',)):
+            self.__enqueue_layout()
 
     def __enqueue_layout(self):
         if self.__layout_enqueued:
@@ -73,12 +99,58 @@ class TkMenu(_TkMenuComponent, Wrapper, TkComponent):
     def __layout(self):
         self.__layout_enqueued = False
 
+        if not self.is_mounted():
+            return
+
         menu: tk.Menu = self.widget
+        batch = self.tree.tcl_batch
+        entries = self.__entries
+        entry_options = self.__entry_options
+        items = list(self.get_menu_children())
+        item_set = set(items)
+
+        # Index of first entry, tear-off entry (if present) always has index 0
+        offset = 1 if self.props.get('tearoff', 0) else 0
+
+        if offset != self.__offset:
+            # Tk has added or removed the tear-off entry, so entries are re-created instead of being tracked by index.
+            # Tk never deletes the tear-off entry itself.
+            if entries:
+                batch.add(menu._w, 'delete', 0, 'end')
+                entries.clear()
+                entry_options.clear()
+
+            self.__offset = offset
+
+        for i in range(len(entries) - 1, -1, -1):
+            item = entries[i]
+
+            if item not in item_set:
+                batch.add(menu._w, 'delete', offset + i)
+                del entries[i]
+                del entry_options[item]
 
-        menu.delete(0, 'end')
+        for i, item in enumerate(items):
+            options = item.get_menu_item_config()
 
-        for item in self.get_menu_children():
-            item.add_to_menu(menu)
+            if i < len(entries) and entries[i] is item:
+                prev_options = entry_options[item]
+                delta = {k: v for k, v in options.items() if prev_options.get(k, None) != v}
+
+                if delta:
+                    batch.add(menu._w, 'entryconfigure', offset + i, *menu._options(delta))
+                    entry_options[item] = options
+
+                continue
+
+            if item in entry_options:
+                # The item has moved, it's entry is somewhere after current position
+                batch.add(menu._w, 'delete', offset + entries.index(item, i))
+                entries.remove(item)
+
+            batch.add(menu._w, 'insert', offset + i, item.menu_item_type, *menu._options(options))
+            entries.insert(i, item)
+            entry_options[item] = options
 
     def on_tk_child_mounted(self, child):
         assert isinstance(child,
@@ -102,6 +174,10 @@ class TkMenu(_TkMenuComponent, Wrapper, TkComponent):
         if self.is_mounted():
             self.__enqueue_layout()
 
+    def on_descendants_reordered(self):
+        super().on_descendants_reordered()
+        self.__enqueue_layout()
+
 
 @component(TkMenu)
 def tk_menu(
@@ -120,9 +196,7 @@ class TkWindowMenu(TkMenu):
     def mount(self, parent):
         super().mount(parent)
 
-        self.get_window().widget.configure(
-            menu=self.widget
-        )
+        self.tree.tcl_batch.configure(self.get_window().widget, {'menu': self.widget})
 
 
 @component(TkWindowMenu)
@@ -139,13 +213,34 @@ class _TkMenuItemComponent(_TkMenuComponent, Component, ABC):
 
         menu_parent = self.get_menu_parent()
         self.menu_parent = menu_parent
+        self.__command_name = None
         menu_parent.on_menu_child_mounted(self)
 
     def unmount(self):
         self.menu_parent.on_menu_child_unmounted(self)
 
+        if self.__command_name:
+            self.menu_parent.widget.deletecommand(self.__command_name)
+
+        del self.__command_name
+
         super().unmount()
 
+    def on_menu_command(self, *_):
+        """Called when entry of this item is activated."""
+        ...
+
+    def get_command_name(self) -> str:
+        """Returns name of Tcl command that calls `on_menu_command` of this item.
+
+        The command is registered once per mounted item, so the entry doesn't have to be re-configured on every update
+        and re-inserted entries don't leave stale commands behind.
+        """
+        if not self.__command_name:
+            self.__command_name = self.menu_parent.widget.register(self.on_menu_command)
+
+        return self.__command_name
+
     def update(self):
         super().update()
 
@@ -153,16 +248,17 @@ class _TkMenuItemComponent(_TkMenuComponent, Component, ABC):
 
 
 class TkMenuCommand(_TkMenuItemComponent):
+    menu_item_type = 'command'
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
 
-        self.__command = event_prop_invoker(self, 'on_click')
+        self.on_menu_command = event_prop_invoker(self, 'on_click')
 
-    def add_to_menu(self, menu: tk.Menu):
-        menu.add_command(
-            command=self.__command,
-            **self.get_menu_item_config(),
-        )
+    def get_menu_item_config(self) -> dict:
+        conf = super().get_menu_item_config()
+        conf['command'] = self.get_command_name()
+        return conf
 
 
 @component(TkMenuCommand)
@@ -176,8 +272,10 @@ def tk_menu_command(
 
 
 class TkMenuSeparator(_TkMenuItemComponent):
-    def add_to_menu(self, menu: tk.Menu):
-        menu.add_separator()
+    menu_item_type = 'separator'
+
+    def get_menu_item_config(self) -> dict:
+        return {}
 
 
 @component(TkMenuSeparator)
@@ -186,10 +284,13 @@ def tk_menu_separator(**_):
 
 
 class TkMenuCheckbutton(_TkMenuItemComponent):
+    menu_item_type = 'checkbutton'
+
     def mount(self, parent):
         super().mount(parent)
 
         self.__var = tk.Variable(
+            master=self.menu_parent.widget,
             value=self.props['initial_value']
         )
 
@@ -198,18 +299,19 @@ class TkMenuCheckbutton(_TkMenuItemComponent):
 
         del self.__var
 
-    def __command(self, *_):
+    def on_menu_command(self, *_):
         self.props['on_change'](self.__var.get())
 
-    def add_to_menu(self, menu: tk.Menu):
+    def get_menu_item_config(self) -> dict:
         props = self.props
-        menu.add_checkbutton(
+        conf = super().get_menu_item_config()
+        conf.update(
             variable=self.__var,
             onvalue=props['on_value'],
             offvalue=props['off_value'],
-            command=self.__command,
-            **self.get_menu_item_config(),
+            command=self.get_command_name(),
         )
+        return conf
 
 
 @component(TkMenuCheckbutton)
@@ -226,6 +328,8 @@ def tk_menu_checkbutton(
 
 
 class TkMenuRadioButton(_TkMenuItemComponent):
+    menu_item_type = 'radiobutton'
+
     def mount(self, parent):
         super().mount(parent)
 
@@ -236,17 +340,18 @@ class TkMenuRadioButton(_TkMenuItemComponent):
 
         del self.__radio_group
 
-    def __command(self):
+    def on_menu_command(self, *_):
         self.__radio_group.on_selected(self.props['value'])
         self.props['on_selected']()
 
-    def add_to_menu(self, menu: tk.Menu):
-        menu.add_radiobutton(
+    def get_menu_item_config(self) -> dict:
+        conf = super().get_menu_item_config()
+        conf.update(
             value=self.props['value'],
             variable=self.__radio_group.variable,
-            command=self.__command,
-            **self.get_menu_item_config(),
+            command=self.get_command_name(),
         )
+        return conf
 
 
 @component(TkMenuRadioButton)
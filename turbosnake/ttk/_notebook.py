@@ -0,0 +1,215 @@
+import tkinter as tk
+from collections import OrderedDict
+from tkinter import ttk
+from typing import Callable, Optional, Hashable, Literal
+
+from turbosnake import Wrapper, component, noop_handler, ComponentsCollection
+from turbosnake._components import UpdateGate
+from turbosnake.ttk._core import TkComponent
+from turbosnake.ttk._adapters import TkContainerComponent
+from turbosnake.ttk._layout import NotebookLayoutManager, LayoutManagerPropValue
+from turbosnake.ttk._style import StyledTkComponent
+
+"""
+_notebook.py
+
+Contains adapter for ttk notebook widget and it's tabs.
+
+Contents of a tab are mounted when the tab is shown for the first time.
+When the tab is hidden its contents remain mounted but their updates are suspended: components whose state or props
+change are updated when the tab is shown again.
+Notebook may limit number of hidden tabs keeping their contents mounted, contents of tabs hidden for the longest time
+are unmounted when the limit is exceeded.
+"""
+
+
+class TkNotebookTab(StyledTkComponent, TkContainerComponent, TkComponent, Wrapper):
+    """Tab of a notebook, a frame that is shown by the notebook when the tab is selected."""
+
+    def mount(self, parent):
+        super().mount(parent)
+
+        assert isinstance(self.tk_parent, TkNotebook), 'Notebook tab must be a tk child of a notebook'
+
+        self.__gate = UpdateGate(self.tree, self.update_gate)
+        self.__gate.suspend()
+        self.__has_content = False
+
+    @property
+    def child_update_gate(self):
+        return self.__gate
+
+    @property
+    def is_shown(self) -> bool:
+        return self.is_mounted() and not self.__gate.suspended
+
+    @property
+    def has_content(self) -> bool:
+        """`True` iff contents of this tab are mounted or are going to be mounted on next update."""
+        return self.__has_content
+
+    def create_widget(self, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
+        return ttk.Frame(tk_parent)
+
+    def render_children(self) -> ComponentsCollection:
+        if not self.__has_content:
+            return ComponentsCollection.EMPTY
+
+        return super().render_children()
+
+    def show(self):
+        """Called by notebook when this tab is selected."""
+        if not self.__has_content:
+            self.__has_content = True
+            self.enqueue_update()
+
+        self.__gate.resume()
+
+    def hide(self):
+        """Called by notebook when another tab is selected."""
+        self.__gate.suspend()
+
+    def release_content(self):
+        """Unmounts contents of this hidden tab, they are mounted again when the tab is shown."""
+        if self.__has_content:
+            self.__has_content = False
+            self.__gate.discard_deferred()
+            self.enqueue_update()
+
+
+@component(TkNotebookTab)
+def tk_notebook_tab(
+        *,
+        text: str = '',
+        image=None,
+        compound: Optional[Literal['none', 'text', 'image', 'center', 'top', 'bottom', 'left', 'right']] = None,
+        underline: int = -1,
+        padding=0,
+        sticky: str = 'nsew',
+        disabled: bool = False,
+        layout_manager: LayoutManagerPropValue = 'pack',
+        **_):
+    ...
+
+
+class TkNotebook(StyledTkComponent, TkContainerComponent, TkComponent, Wrapper):
+    """Notebook widget, shows one of it's tabs (`tk_notebook_tab` components) at a time.
+
+    Selected tab is chosen by the user or by `selected` property containing key of the tab.
+    """
+
+    def mount(self, parent):
+        super().mount(parent)
+        self.__selected: Optional[TkNotebookTab] = None
+        # Hidden tabs with mounted contents, the tab hidden for the longest time goes first
+        self.__hidden: OrderedDict[TkNotebookTab, None] = OrderedDict()
+
+    def unmount(self):
+        super().unmount()
+        del self.__selected
+        del self.__hidden
+
+    @property
+    def selected_tab(self) -> Optional[TkNotebookTab]:
+        return self.__selected
+
+    def create_widget(self, tk_parent: tk.BaseWidget) -> tk.BaseWidget:
+        widget = ttk.Notebook(tk_parent)
+        widget.bind('<<NotebookTabChanged>>', self.__on_tab_changed)
+
+        return widget
+
+    def get_widget_config(self, width=0, height=0, **props):
+        cfg = super().get_widget_config(**props)
+
+        cfg['width'] = width
+        cfg['height'] = height
+
+        return cfg
+
+    def update(self):
+        super().update()
+
+        if self.has_props_changed(('selected', 'max_hidden_tabs')):
+            # Selection is applied after tabs are synchronized
+            self._layout_manager.schedule_sync()
+
+    def on_tk_child_unmounted(self, child):
+        super().on_tk_child_unmounted(child)
+
+        self.__hidden.pop(child, None)
+
+        if child is self.__selected:
+            self.__selected = None
+
+    def on_tabs_synchronized(self, tabs: list[TkNotebookTab]):
+        """Called by layout manager after tabs of the notebook widget are synchronized with tk children."""
+        selected_key = self.props.get('selected', None)
+        selected = self.__selected
+
+        if selected_key is not None:
+            selected = next((tab for tab in tabs if tab.key == selected_key), selected)
+
+        if selected is None and tabs:
+            selected = tabs[0]
+
+        self.__select(selected)
+
+        if selected is not None:
+            self.tree.tcl_batch.notebook_select(self.widget, selected.widget)
+
+    def __select(self, tab: Optional[TkNotebookTab]):
+        previous = self.__selected
+        hidden = self.__hidden
+
+        if tab is not previous:
+            if previous is not None:
+                previous.hide()
+
+                if previous.has_content:
+                    hidden[previous] = None
+
+            self.__selected = tab
+
+        if tab is not None:
+            hidden.pop(tab, None)
+            tab.show()
+
+        max_hidden_tabs = self.props.get('max_hidden_tabs', None)
+
+        if max_hidden_tabs is not None:
+            while len(hidden) > max_hidden_tabs:
+                evicted, _ = hidden.popitem(last=False)
+                evicted.release_content()
+
+    def __on_tab_changed(self, _event):
+        if not self.is_mounted():
+            return
+
+        selected_path = str(self.tree.tcl_batch.call(self.widget._w, 'select'))
+        tab = next((tab for tab in self.get_tk_children() if str(tab.widget) == selected_path), None)
+
+        if tab is None or tab is self.__selected:
+            return
+
+        self.__select(tab)
+        self.props['on_select'](tab.key)
+
+
+@component(TkNotebook)
+def tk_notebook(
+        *,
+        selected: Optional[Hashable] = None,
+        on_select: Callable[[Hashable], None] = noop_handler,
+        max_hidden_tabs: Optional[int] = None,
+        width: int = 0,
+        height: int = 0,
+        layout_manager: LayoutManagerPropValue = NotebookLayoutManager,
+        **_):
+    """Notebook widget.
+
+    :param selected: key of the selected tab; when `None`, the tab selected by the user (or the first one) is shown
+    :param on_select: called with key of a tab when the user selects it
+    :param max_hidden_tabs: maximal number of hidden tabs keeping their contents mounted, unlimited when `None`
+    """
+    ...
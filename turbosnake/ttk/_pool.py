@@ -0,0 +1,113 @@
+import tkinter as tk
+from typing import Callable, Type
+
+"""
+_pool.py
+
+Contains pool of widgets left by unmounted tk components that may be reused by newly mounted ones.
+"""
+
+
+class WidgetPool:
+    """Keeps widgets of unmounted recyclable tk components for reuse by components of the same class mounted under the
+    same parent widget.
+
+    Pool size is bounded by `limit` widgets per (component class, parent widget) pair and by `total_limit` widgets in
+    total. When a widget is parked in a pool that holds `total_limit` widgets, the widget parked earliest is evicted and
+    destroyed using `destroy` function. Pool with zero limit never keeps any widgets.
+    """
+
+    def __init__(self, limit: int = 0, total_limit: int = 256, destroy: Callable[[tk.Widget], None] = None):
+        self.limit = limit
+        self.total_limit = total_limit
+        self.__destroy = destroy
+        self.__widgets: dict[tk.Misc, dict[type, list[tk.Widget]]] = {}
+        # All parked widgets in order they were parked, with their (parent, component class) pairs
+        self.__parked: dict[tk.Widget, tuple[tk.Misc, type]] = {}
+
+    def take(self, component_class: Type, tk_parent: tk.Misc):
+        """Returns a parked widget for component of given class mounted under given parent or `None` if there is no such
+        widget.
+        """
+        try:
+            widget = self.__widgets[tk_parent][component_class].pop()
+        except (KeyError, IndexError):
+            return None
+
+        del self.__parked[widget]
+        return widget
+
+    def __get_widgets(self, component_class: Type, tk_parent: tk.Misc) -> list[tk.Widget]:
+        return self.__widgets.setdefault(tk_parent, {}).setdefault(component_class, [])
+
+    def __add(self, widgets: list[tk.Widget], component_class: Type, tk_parent: tk.Misc, widget: tk.Widget):
+        widgets.append(widget)
+        self.__parked[widget] = (tk_parent, component_class)
+
+    def __evict_oldest(self):
+        widget = next(iter(self.__parked))
+        tk_parent, component_class = self.__parked.pop(widget)
+        self.__widgets[tk_parent][component_class].remove(widget)
+
+        if self.__destroy is not None:
+            self.__destroy(widget)
+
+    def park(self, component_class: Type, tk_parent: tk.Misc, widget: tk.Widget, reset: Callable) -> bool:
+        """Parks widget of unmounted component.
+
+        :param reset: function that prepares the widget for reuse, called only if the widget is going to be parked
+        :returns: `True` if the widget was parked, `False` if the pool is full and the widget should be destroyed
+        """
+        if self.limit <= 0 or self.total_limit <= 0:
+            return False
+
+        widgets = self.__get_widgets(component_class, tk_parent)
+
+        if len(widgets) >= self.limit:
+            return False
+
+        while len(self.__parked) >= self.total_limit:
+            self.__evict_oldest()
+
+        reset(widget)
+        self.__add(widgets, component_class, tk_parent, widget)
+        return True
+
+    def discard_parent(self, tk_parent: tk.Misc):
+        """Forgets all widgets parked under given parent.
+
+        Should be called before the parent widget is destroyed as the parked widgets are destroyed together with it.
+        """
+        for widgets in self.__widgets.pop(tk_parent, {}).values():
+            for widget in widgets:
+                del self.__parked[widget]
+
+    def prewarm(self, component_class: Type, tk_parent: tk.Misc, count: int, schedule: Callable, chunk_size: int = 8):
+        """Fills the pool with up to `count` blank widgets for given component class in background.
+
+        Widgets are created using `create_blank_widget` class method of the component class in chunks of `chunk_size`,
+        each chunk in a separate callback scheduled using `schedule` function, so the event loop remains responsive
+        while the pool is being filled.
+        """
+        count = min(count, self.limit)
+
+        if count <= 0:
+            return
+
+        widgets = self.__get_widgets(component_class, tk_parent)
+
+        def create_chunk():
+            if self.__widgets.get(tk_parent, {}).get(component_class) is not widgets:
+                return  # The parent was discarded in the meantime
+
+            # Pre-warming doesn't evict widgets parked by unmounted components
+            for _ in range(min(chunk_size, count - len(widgets), self.total_limit - len(self.__parked))):
+                self.__add(widgets, component_class, tk_parent, component_class.create_blank_widget(tk_parent))
+
+            if len(widgets) < count and len(self.__parked) < self.total_limit:
+                schedule(create_chunk)
+
+        schedule(create_chunk)
+
+    def __len__(self):
+        return len(self.__parked)
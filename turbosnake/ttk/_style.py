@@ -1,7 +1,8 @@
 import inspect
 from abc import abstractmethod, ABC, ABCMeta
 from tkinter.ttk import Style as TtkStyle
-from typing import Union, Iterable, Optional, Callable
+from typing import Union, Iterable, Optional, Callable, Hashable
+from weakref import WeakSet
 
 from turbosnake._utils0 import RandomIdSet
 from turbosnake.ttk._core import TkComponent
@@ -24,6 +25,7 @@ class StyledTkComponent(TkComponent, ABC):
                     if style_instance.style is style:
                         style_instance.update(self)
                     else:
+                        style_instance.release()
                         self.__style_instance = style_instance = style.instantiate(self)
 
                 config['style'] = style_instance.name
@@ -145,15 +147,59 @@ class StyleBuilder:
         style_db.configure(name, **self.__config)
         style_db.map(name, **self.__map)
 
+    def reset(self, style_db: TtkStyle, name: str):
+        """Reverts changes made by `apply` to given style.
+
+        Options are set to values of base class and state-specific values are removed.
+        """
+        base_class = self.base_class
+        style_db.configure(name, **{key: style_db.lookup(base_class, key) for key in self.__config})
+        style_db.map(name, **{key: () for key in self.__map})
+
+    def freeze(self) -> Hashable:
+        """Returns a hashable value that is equal for builders producing identical styles."""
+        return (
+            self.base_class,
+            frozenset((key, _freeze(value)) for key, value in self.__config.items()),
+            frozenset((key, _freeze(value)) for key, value in self.__map.items()),
+        )
+
+
+def _freeze(value) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(map(_freeze, value))
+
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+
+    return value
+
 
 _global_style_id_set = RandomIdSet()
 
 
+class _WidgetClassCache:
+    """Remembers class of the last widget passed to `get`, so it isn't requested from Tcl on every update."""
+    __slots__ = ('widget', 'widget_class')
+
+    def __init__(self):
+        self.widget = None
+        self.widget_class = None
+
+    def get(self, widget) -> str:
+        if widget is not self.widget:
+            self.widget_class = widget.winfo_class()
+            self.widget = widget
+
+        return self.widget_class
+
+
 class _StaticStyleInstance(StyleInstance):
     def __init__(self, _style: '_StaticStyle', component: TkComponent):
         self.__style = _style
-        self.__class = component.widget.winfo_class()
-        self.__name = _style.configure_for_component(component)
+        self.__widget_class_cache = _WidgetClassCache()
+        self.__class = self.__widget_class_cache.get(component.widget)
+        self.__name = _style.configure_for_component(component, self.__class)
 
     @property
     def style(self) -> Style:
@@ -164,11 +210,11 @@ class _StaticStyleInstance(StyleInstance):
         return self.__name
 
     def update(self, component: TkComponent):
-        clz = component.widget.winfo_class()
+        clz = self.__widget_class_cache.get(component.widget)
         if clz == self.__class:
             return
 
-        self.__name = self.__style.configure_for_component(component)
+        self.__name = self.__style.configure_for_component(component, clz)
         self.__class = clz
 
     def release(self):
@@ -183,16 +229,17 @@ class _StaticStyle(Style):
     def __init__(self,
                  configuration_callbacks: list[Callable],
                  name_prefix: str,
+                 depends_on: Optional[Iterable[str]] = None,
                  ):
         if not name_prefix:
             name_prefix = _global_style_id_set.generate()
 
         if len(configuration_callbacks) == 1:
             self.apply = configuration_callbacks[0]
-        else:
-            self.__callbacks = configuration_callbacks
 
+        self.__callbacks = configuration_callbacks
         self.__name_prefix = name_prefix
+        self.__depends_on = depends_on
 
         # Map from widget class to name of this style
         # e.g. for _StaticStyle with __name_prefix='Foo' and class 'TButton' there will be entry
@@ -200,10 +247,11 @@ class _StaticStyle(Style):
         self.__style_names: dict[str, str] = {}
 
     def __call__(self, callback):
-        return style(*self.__callbacks, callback, name_prefix=self.__name_prefix)
+        return style(*self.__callbacks, callback, name_prefix=self.__name_prefix, depends_on=self.__depends_on)
 
-    def configure_for_component(self, component: TkComponent) -> str:
-        widget_class = component.widget.winfo_class()
+    def configure_for_component(self, component: TkComponent, widget_class: Optional[str] = None) -> str:
+        if widget_class is None:
+            widget_class = component.widget.winfo_class()
 
         try:
             return self.__style_names[widget_class]
@@ -240,6 +288,20 @@ class _StaticStyle(Style):
             cb(builder, component)
 
 
+class _SharedDynamicStyle:
+    """A ttk style configured by a dynamic style and shared by all instances of the dynamic style that produced the same
+    style content.
+    """
+    __slots__ = ('key', 'name', 'builder', 'tree', 'refs')
+
+    def __init__(self, key: Hashable, name: str, builder: StyleBuilder, tree):
+        self.key = key
+        self.name = name
+        self.builder = builder
+        self.tree = tree
+        self.refs = 0
+
+
 class _DynamicStyleInstance(StyleInstance):
     def __init__(
             self,
@@ -247,52 +309,92 @@ class _DynamicStyleInstance(StyleInstance):
             component: TkComponent,
     ):
         self.__style = _style
-        self.__component = component
-        self.__base_class = None
-        self.__name = None
+        self.__shared: Optional[_SharedDynamicStyle] = None
+        self.__widget_class_cache = _WidgetClassCache()
+        # Widget class and values of properties the style depends on at last recomputation
+        self.__inputs = None
 
         self.update(component)
 
     @property
     def name(self) -> str:
-        return self.__name
+        return self.__shared.name
 
     @property
     def style(self) -> 'Style':
         return self.__style
 
     def update(self, component: TkComponent):
-        builder = StyleBuilder(base_class=component.widget.winfo_class())
+        widget_class = self.__widget_class_cache.get(component.widget)
+        dependencies = self.__style.dependencies
+
+        if dependencies is not None:
+            props = component.props
+            inputs = (widget_class, *(props.get(name, _MISSING) for name in dependencies))
+
+            if inputs == self.__inputs:
+                return
+
+            self.__inputs = inputs
+
+        builder = StyleBuilder(base_class=widget_class)
         self.__style.apply(builder, component)
-        base_class = builder.base_class
+        key = builder.freeze()
+        prev_shared = self.__shared
 
-        if not self.__name:
-            self.__name = self.__style.acquire_name(base_class)
-            self.__base_class = base_class
-        elif self.__base_class != base_class:
-            self.__style.release_name(self.__base_class, self.__name)
-            self.__name = self.__style.acquire_name(base_class)
-            self.__base_class = base_class
+        if prev_shared and prev_shared.key == key:
+            return
 
-        builder.apply(
-            component.tree.style_db,
-            self.__name
-        )
+        self.__shared = self.__style.acquire_shared(key, builder, component.tree)
+
+        if prev_shared:
+            self.__style.release_shared(prev_shared)
 
     def release(self):
-        self.__style.release_name(self.__base_class, self.__name)
+        self.__style.release_shared(self.__shared)
+
+
+# All dynamic styles that may have unused ttk styles, see `collect_unused_styles`
+_dynamic_styles: WeakSet['_DynamicStyle'] = WeakSet()
+
+
+def collect_unused_styles():
+    """Immediately clears all ttk styles of dynamic styles that are not used by any component.
+
+    Normally unused styles are cleared automatically, `_DynamicStyle.GC_DELAY` milliseconds after they become unused.
+    """
+    for dynamic_style in list(_dynamic_styles):
+        dynamic_style.collect_garbage()
 
 
 class _DynamicStyle(Style):
+    """A Style that depends on component properties.
+
+    Components whose properties result in identical style options share a single ttk style.
+    ttk styles no longer used by any component are cleared and their names are reused for new styles.
+    """
+
+    # Delay (in milliseconds) between the moment some ttk style becomes unused and clearing of unused styles
+    GC_DELAY = 10000
+
     def __init__(
             self,
             configuration_callbacks,
             name_prefix,
+            depends_on: Optional[Iterable[str]] = None,
+            dependencies: Optional[Iterable[str]] = None,
     ):
         self.__callbacks = configuration_callbacks
         self.__name_prefix = name_prefix
+        self.__depends_on = depends_on
+
+        # Names of component properties this style depends on or `None` if it may depend on any property
+        self.dependencies: Optional[tuple[str, ...]] = None if dependencies is None else tuple(sorted(dependencies))
+
         self.__style_id_set = RandomIdSet() if name_prefix else _global_style_id_set
         self.__name_pool: dict[str, list[str]] = {}
+        self.__shared: dict[tuple[TtkStyle, Hashable], _SharedDynamicStyle] = {}
+        self.__gc_scheduled = False
 
     def __generate_name(self, base_class):
         if self.__name_prefix:
@@ -320,6 +422,55 @@ class _DynamicStyle(Style):
 
         names.append(name)
 
+    def acquire_shared(self, key: Hashable, builder: StyleBuilder, tree) -> _SharedDynamicStyle:
+        """Returns ttk style with content described by given builder, creating it if necessary, and increments it's
+        reference counter.
+        """
+        style_db = tree.style_db
+
+        try:
+            shared = self.__shared[(style_db, key)]
+        except KeyError:
+            shared = _SharedDynamicStyle(key, self.acquire_name(builder.base_class), builder, tree)
+            builder.apply(style_db, shared.name)
+            self.__shared[(style_db, key)] = shared
+            tree.dynamic_styles.add(self)
+
+        shared.refs += 1
+        return shared
+
+    def release_shared(self, shared: _SharedDynamicStyle):
+        """Decrements reference counter of given ttk style, schedules garbage collection if the style is no longer used.
+        """
+        shared.refs -= 1
+
+        if shared.refs == 0 and not self.__gc_scheduled:
+            self.__gc_scheduled = True
+            _dynamic_styles.add(self)
+            shared.tree.schedule_delayed_task(self.GC_DELAY, self.collect_garbage)
+
+    def collect_garbage(self):
+        """Clears ttk styles that are not used by any component and returns their names to the pool."""
+        self.__gc_scheduled = False
+        _dynamic_styles.discard(self)
+
+        for (style_db, key), shared in list(self.__shared.items()):
+            if shared.refs > 0:
+                continue
+
+            del self.__shared[(style_db, key)]
+            shared.builder.reset(style_db, shared.name)
+            self.release_name(shared.builder.base_class, shared.name)
+
+    @property
+    def style_names(self) -> list[str]:
+        """Names of all ttk styles currently configured by this style, including ones waiting for garbage collection."""
+        return [shared.name for shared in self.__shared.values()]
+
+    def get_style_names(self, style_db: TtkStyle) -> list[str]:
+        """Names of ttk styles currently configured by this style in given style database."""
+        return [shared.name for (db, _), shared in self.__shared.items() if db is style_db]
+
     def instantiate(self, component: TkComponent) -> StyleInstance:
         return _DynamicStyleInstance(self, component)
 
@@ -328,22 +479,30 @@ class _DynamicStyle(Style):
             cb(builder, component)
 
     def __call__(self, callback):
-        return style(*self.__callbacks, callback, name_prefix=self.__name_prefix)
+        return style(*self.__callbacks, callback, name_prefix=self.__name_prefix, depends_on=self.__depends_on)
 
 
+_MISSING = object()
+
 _POSITIONAL_PARAM_KINDS = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
 _KEYWORD_PARAM_KINDS = (
     inspect.Parameter.KEYWORD_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD, inspect.Parameter.VAR_KEYWORD)
 
 
 def _normalize_style_callback(cb: Callable):
+    """Wraps style callback into a function accepting style builder and component.
+
+    :returns: tuple of the wrapper function, flag indicating whenever the callback depends on component properties and
+              names of properties the callback depends on (`None` if it may depend on any property)
+    """
     try:
         if cb.__is_normalized_style_callback:
-            return cb, cb.__dynamic_component_access_required
+            return cb, cb.__dynamic_component_access_required, cb.__style_dependencies
     except AttributeError:
         pass
 
     is_dynamic = False
+    dependencies = ()
     signature = inspect.signature(cb)
     parameters = (*signature.parameters.values(),)
 
@@ -355,6 +514,16 @@ def _normalize_style_callback(cb: Callable):
             cb(builder)
     elif all(par.kind in _KEYWORD_PARAM_KINDS for par in parameters[1:]):
         is_dynamic = True
+        dependencies = []
+
+        for par in parameters[1:]:
+            if par.kind is inspect.Parameter.VAR_KEYWORD:
+                # Named variable keyword parameter (unlike conventional `**_`) means the callback may read any property
+                if not par.name.startswith('_'):
+                    dependencies = None
+                    break
+            else:
+                dependencies.append(par.name)
 
         def normalized_callback(builder: StyleBuilder, component: TkComponent):
             cb(builder, **component.props)
@@ -363,33 +532,66 @@ def _normalize_style_callback(cb: Callable):
 
     normalized_callback.__is_normalized_style_callback = True
     normalized_callback.__dynamic_component_access_required = is_dynamic
+    normalized_callback.__style_dependencies = dependencies
 
-    return normalized_callback, is_dynamic
+    return normalized_callback, is_dynamic, dependencies
 
 
 def style(
         *args,
-        name_prefix=None
+        name_prefix=None,
+        depends_on: Optional[Iterable[str]] = None,
 ) -> Style:
+    """Creates a style from style callbacks and other styles.
+
+    Styles that depend on component properties are re-computed only when properties they depend on change.
+    Those properties are inferred from keyword parameters of style callbacks unless listed explicitly in `depends_on`.
+    Callbacks having a named variable keyword parameter (e.g. `**props` but not `**_`) are considered to depend on all
+    properties.
+    """
     style_constructor = _StaticStyle
     callbacks = []
+    dependencies: Optional[set[str]] = set()
+
+    def add_dependencies(names):
+        nonlocal dependencies
+
+        if names is None:
+            dependencies = None
+        elif dependencies is not None:
+            dependencies.update(names)
 
     for arg in args:
         if isinstance(arg, _StaticStyle):
             callbacks.append(arg.apply)
+        elif isinstance(arg, _DynamicStyle):
+            style_constructor = _DynamicStyle
+            callbacks.append(arg.apply)
+            add_dependencies(arg.dependencies)
         elif isinstance(arg, Style):
             style_constructor = _DynamicStyle
             callbacks.append(arg.apply)
+            add_dependencies(None)
         elif callable(arg):
-            normalized, is_dynamic = _normalize_style_callback(arg)
+            normalized, is_dynamic, callback_dependencies = _normalize_style_callback(arg)
             callbacks.append(normalized)
 
             if is_dynamic:
                 style_constructor = _DynamicStyle
+                add_dependencies(callback_dependencies)
         else:
             raise Exception(f'Unexpected style() argument: {repr(arg)}')
 
-    return style_constructor(
+    if style_constructor is _StaticStyle:
+        return _StaticStyle(
+            configuration_callbacks=callbacks,
+            name_prefix=name_prefix,
+            depends_on=depends_on,
+        )
+
+    return _DynamicStyle(
         configuration_callbacks=callbacks,
         name_prefix=name_prefix,
+        depends_on=depends_on,
+        dependencies=dependencies if depends_on is None else depends_on,
     )
@@ -11,9 +11,11 @@ def tk_run_preview(
         topmost=True,
         min_width=200,
         min_height=0,
+        use_server=True,
 ):
     run_preview(
         module_name=module_name,
+        use_server=use_server,
         manager_module_name=__name__,
         options={
             'topmost': topmost,